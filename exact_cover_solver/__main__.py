@@ -0,0 +1,6 @@
+"""Run command line interface with python -m exact_cover_solver."""
+import sys
+
+from exact_cover_solver.cli import main
+
+sys.exit(main())
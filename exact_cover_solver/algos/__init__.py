@@ -4,3 +4,18 @@ Defines imports for things that can be imported directly from this package.
 """
 from .dlx import DLX
 from .dictx import DictX
+from .arraydlx import ArrayDLX
+from .bitx import BitX
+from .xcc import XCC
+from .limits import SearchLimits, SearchResult
+from .stats import SolveStats
+from .estimate import TreeSizeEstimate
+from .strategies import (
+    ColumnSelectionStrategy,
+    MRV,
+    EarlyExitMRV,
+    DegreeMRV,
+    RandomMRV,
+    BucketMRV,
+    STRATEGIES,
+)
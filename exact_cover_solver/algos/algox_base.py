@@ -4,9 +4,17 @@ Algorithm X is a straightforward recursive, nondeterministic, depth-first and
 backtracking algorithm.
 """
 
+import time
 from abc import ABC, abstractmethod
-from typing import List, Generic
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Generator, Iterator, List, Generic, Optional
+
+from .limits import LimitTracker, SearchLimits, SearchResult
+from .parallel import split_problem, solve_subproblem, count_subproblem
+from .stats import SolveStats
 from exact_cover_solver.datastructures import GenericMatrix
+from exact_cover_solver.datastructures.matrix_base import Matrix
 from exact_cover_solver.types import Solution
 
 
@@ -18,23 +26,232 @@ class AlgorithmX(ABC, Generic[GenericMatrix]):
 
     Attributes:
         _solutions: List for solutions algorithm produces.
+        _iterative: Whether search is run with an explicit stack instead of
+            recursion.
+        _workers: Number of worker processes used for search.
+        _split_depth: How many levels of search tree are expanded before handing
+            subproblems to worker processes.
     """
 
-    def __init__(self) -> None:
-        """Initialize with empty solution counter."""
+    def __init__(
+        self, iterative: bool = False, workers: int = 1, split_depth: int = 2
+    ) -> None:
+        """Initialize with empty solution counter.
+
+        Args:
+            iterative: Run search with an explicit stack of (column, row) records
+                instead of recursion. Produces the same solutions in the same order,
+                but avoids function call overhead and recursion depth limits.
+            workers: Number of worker processes. With more than one worker, search
+                tree is split to subproblems which are solved in a process pool.
+            split_depth: How many levels of search tree are expanded to create
+                subproblems for worker processes.
+
+        Raises:
+            ValueError: if workers or split depth is not positive.
+        """
+        if workers < 1:
+            raise ValueError(f"Number of workers must be positive, got {workers}.")
+        if split_depth < 1:
+            raise ValueError(f"Split depth must be positive, got {split_depth}.")
         self._solutions: List[Solution] = []
+        self._iterative = iterative
+        self._workers = workers
+        self._split_depth = split_depth
 
     @abstractmethod
-    def solve(self, matrix: GenericMatrix) -> List[Solution]:
+    def solve(
+        self, matrix: GenericMatrix, limits: Optional[SearchLimits] = None
+    ) -> List[Solution]:
         """Abstract solving method that should be implemented by a subclass.
 
         Args:
             matrix: Exact cover problem matrix that can be consumed by a subclass.
+            limits: Limits for stopping search early, search is exhaustive if None.
 
         Returns:
-            List of solutions algorithm has produced.
+            List of solutions algorithm has produced. With limits, a SearchResult
+            telling whether the search was complete.
 
         Raises:
             NotImplementedError: abstract method was directly called.
         """
         raise NotImplementedError
+
+    def iter_solutions(self, matrix: GenericMatrix) -> Iterator[Solution]:
+        """Yield solutions one by one.
+
+        Default implementation falls back to solving everything first. Subclasses
+        should override this to yield each solution as soon as it is found.
+
+        Args:
+            matrix: Exact cover problem matrix that can be consumed by a subclass.
+
+        Yields:
+            Solutions algorithm produces.
+        """
+        yield from self.solve(matrix)
+
+    def count(self, matrix: GenericMatrix) -> int:
+        """Count solutions without collecting them.
+
+        Default implementation consumes solutions from iter_solutions. Subclasses
+        should override this to avoid creating solution lists altogether.
+
+        Args:
+            matrix: Exact cover problem matrix that can be consumed by a subclass.
+
+        Returns:
+            Number of solutions.
+        """
+        return sum(1 for _ in self.iter_solutions(matrix))
+
+    def _create_tracker(self, limits: SearchLimits) -> LimitTracker:
+        """Start tracking limits for a serial search.
+
+        Args:
+            limits: Limits for the search.
+
+        Returns:
+            Tracker for the search.
+
+        Raises:
+            ValueError: if search is split to multiple workers.
+        """
+        if self._workers > 1:
+            raise ValueError("Search limits can't be used with multiple workers.")
+        return LimitTracker(limits)
+
+    @staticmethod
+    def _collect_result(
+        search: Generator[Solution, None, None],
+        matrix: Matrix,
+        tracker: Optional[LimitTracker] = None,
+        stats: Optional[SolveStats] = None,
+    ) -> SearchResult[Solution]:
+        """Collect solutions from search until it ends or some limit is hit.
+
+        Search is closed after collecting, so it can restore the matrix. Solutions
+        of merged rows are expanded and each expanded solution counts against the
+        solution limit.
+
+        Args:
+            search: Search yielding partial solution that covers the matrix.
+            matrix: Matrix being searched.
+            tracker: Tracker the search checks its node and time limits with.
+            stats: Statistics the search is recording, search time is added to it.
+
+        Returns:
+            Solutions found, whether the search was complete and its statistics.
+        """
+        start_time = time.perf_counter()
+        result: SearchResult[Solution] = SearchResult(stats=stats)
+        solutions = (
+            expanded for solution in search for expanded in matrix.expand(solution)
+        )
+        try:
+            for solution in solutions:
+                result.append(solution)
+                if tracker is not None and not tracker.add_solution():
+                    break
+        finally:
+            search.close()
+        result.complete = tracker is None or not tracker.truncated
+        if stats is not None:
+            stats.phase_times["search"] = time.perf_counter() - start_time
+            stats.solutions = len(result)
+        return result
+
+    def _expand_solutions(self, matrix: Matrix) -> None:
+        """Replace collected solutions of merged rows with solutions they stand for.
+
+        Args:
+            matrix: Matrix solutions were collected from.
+        """
+        if matrix.row_groups:
+            solutions = [
+                expanded
+                for solution in self._solutions
+                for expanded in matrix.expand(solution)
+            ]
+            self._solutions.clear()
+            self._solutions.extend(solutions)
+
+    def _worker_options(self) -> Dict[str, Any]:
+        """Get keyword arguments for creating algorithm in a worker process.
+
+        Workers always search serially, subclasses can add their own options.
+
+        Returns:
+            Dictionary of keyword arguments.
+        """
+        return {}
+
+    def _worker_algorithm(self) -> Callable[[], "AlgorithmX"]:
+        """Get picklable factory creating serial copy of this algorithm.
+
+        Returns:
+            Factory function for worker processes.
+        """
+        return partial(type(self), **self._worker_options())
+
+    def _solve_in_parallel(self, matrix: GenericMatrix) -> List[Solution]:
+        """Collect solutions by solving subproblems in worker processes.
+
+        Args:
+            matrix: Exact cover problem matrix that can be consumed by a subclass.
+
+        Returns:
+            List of the same solutions serial search finds. They come in the order
+            of the subproblems, which may differ from serial search, e.g. when the
+            matrix merges duplicate rows.
+        """
+        self._solutions.clear()
+        self._solutions.extend(self._iter_in_parallel(matrix))
+        return self._solutions
+
+    def _iter_in_parallel(self, matrix: GenericMatrix) -> Iterator[Solution]:
+        """Yield solutions by solving subproblems in worker processes.
+
+        All subproblems are submitted at once and their solutions are yielded in
+        the order of the subproblems. Subproblems not yet started are cancelled if
+        generator is closed.
+
+        Args:
+            matrix: Exact cover problem matrix that can be consumed by a subclass.
+
+        Yields:
+            Solutions algorithm produces.
+        """
+        subproblems = split_problem(matrix.problem_data, self._split_depth)
+        executor = ProcessPoolExecutor(max_workers=self._workers)
+        algorithm = self._worker_algorithm()
+        futures = [
+            executor.submit(solve_subproblem, algorithm, type(matrix), subproblem)
+            for subproblem in subproblems
+        ]
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown()
+
+    def _count_in_parallel(self, matrix: GenericMatrix) -> int:
+        """Count solutions by counting subproblems in worker processes.
+
+        Args:
+            matrix: Exact cover problem matrix that can be consumed by a subclass.
+
+        Returns:
+            Number of solutions.
+        """
+        subproblems = split_problem(matrix.problem_data, self._split_depth)
+        algorithm = self._worker_algorithm()
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            counts = [
+                executor.submit(count_subproblem, algorithm, type(matrix), subproblem)
+                for subproblem in subproblems
+            ]
+            return sum(count.result() for count in counts)
@@ -0,0 +1,188 @@
+"""Dancing links implementation for algorithm X working on flat integer arrays."""
+
+from typing import Generator, Iterator, List, Optional
+
+from .algox_base import AlgorithmX
+from .limits import LimitTracker, SearchLimits
+from exact_cover_solver.types import Solution
+from exact_cover_solver.datastructures import ArrayMatrix
+
+SearchGenerator = Generator[Solution, None, None]
+
+
+class ArrayDLX(AlgorithmX[ArrayMatrix]):
+    """Dancing links implementation for algorithm X working on flat integer arrays.
+
+    Links are followed by indexing arrays instead of accessing object attributes and
+    covering is inlined to the search loop, so there are no method calls per updated
+    node. Search is always driven with an explicit stack.
+    """
+
+    def __init__(self, workers: int = 1, split_depth: int = 2) -> None:
+        """Initialize object by calling parent constructor.
+
+        Args:
+            workers: Number of worker processes to split search to.
+            split_depth: How many levels of search tree to expand for workers.
+        """
+        super().__init__(True, workers, split_depth)
+
+    def solve(
+        self, matrix: ArrayMatrix, limits: Optional[SearchLimits] = None
+    ) -> List[Solution]:
+        """Solve which rows cover the given matrix.
+
+        Args:
+            matrix: Matrix representation implemented with integer arrays.
+            limits: Limits for stopping search early, search is exhaustive if None.
+
+        Returns:
+            List of solutions. Solution is a list identifiers of rows that were
+            picked to solution. With limits, a SearchResult telling whether the
+            search was complete.
+        """
+        if limits is not None:
+            tracker = self._create_tracker(limits)
+            search = self._search(matrix, [], tracker)
+            return self._collect_result(search, matrix, tracker)
+        if self._workers > 1:
+            return self._solve_in_parallel(matrix)
+        self._solutions.clear()
+        for solution in self._search(matrix, []):
+            self._solutions.extend(matrix.expand(solution))
+        return self._solutions
+
+    def iter_solutions(self, matrix: ArrayMatrix) -> Iterator[Solution]:
+        """Yield solutions one by one as soon as they are found.
+
+        Generator can be abandoned at any point, matrix is never modified.
+
+        Args:
+            matrix: Matrix representation implemented with integer arrays.
+
+        Yields:
+            Solution as a list of identifiers of rows that were picked to solution.
+        """
+        if self._workers > 1:
+            yield from self._iter_in_parallel(matrix)
+            return
+        for solution in self._search(matrix, []):
+            yield from matrix.expand(solution)
+
+    def count(self, matrix: ArrayMatrix) -> int:
+        """Count solutions without copying or storing them.
+
+        Solutions of merged rows are weighted by the sizes of their groups instead
+        of being expanded.
+
+        Args:
+            matrix: Matrix representation implemented with integer arrays.
+
+        Returns:
+            Number of solutions.
+        """
+        if self._workers > 1:
+            return self._count_in_parallel(matrix)
+        return sum(map(matrix.weight, self._search(matrix, [])))
+
+    @staticmethod
+    def _search(
+        matrix: ArrayMatrix, partial: Solution, tracker: Optional[LimitTracker] = None
+    ) -> SearchGenerator:
+        """Perform algorithm X with an explicit stack and yield solutions.
+
+        Stack holds the data node picked on each level, the covered column of the
+        level is found through it. Links are copied to lists before search,
+        since indexing lists is faster than indexing arrays and the matrix itself
+        stays untouched even if search is abandoned. Yielded list is the partial
+        solution itself, so it's only valid until the search continues.
+
+        Args:
+            matrix: Matrix representation implemented with integer arrays.
+            partial: List including rows collected this far in search.
+            tracker: Tracker counting each visited node against node and time limits.
+
+        Yields:
+            Partial solution each time it covers the whole matrix.
+        """
+        left, right = list(matrix.left), list(matrix.right)
+        up, down = list(matrix.up), list(matrix.down)
+        column_of, size = list(matrix.column), list(matrix.size)
+        row_ids, row_of = matrix.row_ids, matrix.row
+        stack: List[int] = []
+        while True:
+            if tracker is not None and not tracker.visit():
+                return
+            if right[0] == 0:
+                yield partial
+                column = node = -1
+            else:
+                column = right[0]
+                smallest = size[column]
+                candidate = right[column]
+                while candidate != 0:
+                    if size[candidate] < smallest:
+                        column, smallest = candidate, size[candidate]
+                    candidate = right[candidate]
+
+                left[right[column]] = left[column]
+                right[left[column]] = right[column]
+                i = down[column]
+                while i != column:
+                    j = right[i]
+                    while j != i:
+                        down[up[j]] = down[j]
+                        up[down[j]] = up[j]
+                        size[column_of[j]] -= 1
+                        j = right[j]
+                    i = down[i]
+                node = down[column]
+
+            while node == column:
+                if column > 0:
+                    i = up[column]
+                    while i != column:
+                        j = left[i]
+                        while j != i:
+                            size[column_of[j]] += 1
+                            down[up[j]] = up[down[j]] = j
+                            j = left[j]
+                        i = up[i]
+                    left[right[column]] = right[left[column]] = column
+                if not stack:
+                    return
+                node = stack.pop()
+                partial.pop()
+                k = left[node]
+                while k != node:
+                    other = column_of[k]
+                    i = up[other]
+                    while i != other:
+                        j = left[i]
+                        while j != i:
+                            size[column_of[j]] += 1
+                            down[up[j]] = up[down[j]] = j
+                            j = left[j]
+                        i = up[i]
+                    left[right[other]] = right[left[other]] = other
+                    k = left[k]
+                column = column_of[node]
+                node = down[node]
+
+            stack.append(node)
+            partial.append(row_ids[row_of[node]])
+            k = right[node]
+            while k != node:
+                other = column_of[k]
+                left[right[other]] = left[other]
+                right[left[other]] = right[other]
+                i = down[other]
+                while i != other:
+                    j = right[i]
+                    while j != i:
+                        down[up[j]] = down[j]
+                        up[down[j]] = up[j]
+                        size[column_of[j]] -= 1
+                        j = right[j]
+                    i = down[i]
+                k = right[k]
@@ -0,0 +1,170 @@
+"""Bitset based implementation for algorithm X."""
+
+from typing import Callable, Generator, Iterator, List, Optional, Tuple
+
+from .algox_base import AlgorithmX
+from .limits import LimitTracker, SearchLimits
+from exact_cover_solver.types import Solution
+from exact_cover_solver.datastructures import BitMatrix
+
+StackRecord = Tuple[int, int, int]
+SearchGenerator = Generator[Solution, None, None]
+
+popcount: Callable[[int], int] = getattr(
+    int, "bit_count", lambda mask: bin(mask).count("1")
+)
+
+
+class BitX(AlgorithmX[BitMatrix]):
+    """Bitset based implementation for algorithm X.
+
+    Search state is just two masks: rows that are still live and columns that are
+    still uncovered. Picking a row removes all conflicting rows and covered columns
+    with one bitwise operation each, and since ints are immutable, nothing has to be
+    restored when backtracking. Search is always driven with an explicit stack.
+    """
+
+    def __init__(self, workers: int = 1, split_depth: int = 2) -> None:
+        """Initialize object by calling parent constructor.
+
+        Args:
+            workers: Number of worker processes to split search to.
+            split_depth: How many levels of search tree to expand for workers.
+        """
+        super().__init__(True, workers, split_depth)
+
+    def solve(
+        self, matrix: BitMatrix, limits: Optional[SearchLimits] = None
+    ) -> List[Solution]:
+        """Solve which rows cover the given matrix.
+
+        Args:
+            matrix: Matrix representation implemented with integer bitmasks.
+            limits: Limits for stopping search early, search is exhaustive if None.
+
+        Returns:
+            List of solutions. Solution is a list identifiers of rows that were
+            picked to solution. With limits, a SearchResult telling whether the
+            search was complete.
+        """
+        if limits is not None:
+            tracker = self._create_tracker(limits)
+            search = self._search(matrix, [], tracker)
+            return self._collect_result(search, matrix, tracker)
+        if self._workers > 1:
+            return self._solve_in_parallel(matrix)
+        self._solutions.clear()
+        for solution in self._search(matrix, []):
+            self._solutions.extend(matrix.expand(solution))
+        return self._solutions
+
+    def iter_solutions(self, matrix: BitMatrix) -> Iterator[Solution]:
+        """Yield solutions one by one as soon as they are found.
+
+        Generator can be abandoned at any point, matrix is never modified.
+
+        Args:
+            matrix: Matrix representation implemented with integer bitmasks.
+
+        Yields:
+            Solution as a list of identifiers of rows that were picked to solution.
+        """
+        if self._workers > 1:
+            yield from self._iter_in_parallel(matrix)
+            return
+        for solution in self._search(matrix, []):
+            yield from matrix.expand(solution)
+
+    def count(self, matrix: BitMatrix) -> int:
+        """Count solutions without copying or storing them.
+
+        Solutions of merged rows are weighted by the sizes of their groups instead
+        of being expanded.
+
+        Args:
+            matrix: Matrix representation implemented with integer bitmasks.
+
+        Returns:
+            Number of solutions.
+        """
+        if self._workers > 1:
+            return self._count_in_parallel(matrix)
+        return sum(map(matrix.weight, self._search(matrix, [])))
+
+    @classmethod
+    def _search(
+        cls,
+        matrix: BitMatrix,
+        partial: Solution,
+        tracker: Optional[LimitTracker] = None,
+    ) -> SearchGenerator:
+        """Perform algorithm X with an explicit stack and yield solutions.
+
+        Each stack record holds the candidate rows not yet tried on that level and
+        live rows and uncovered columns before picking any of them. Yielded list is
+        the partial solution itself, so it's only valid until the search continues.
+
+        Args:
+            matrix: Matrix representation implemented with integer bitmasks.
+            partial: List including rows collected this far in search.
+            tracker: Tracker counting each visited node against node and time limits.
+
+        Yields:
+            Partial solution each time it covers the whole matrix.
+        """
+        row_masks, conflict_masks = matrix.row_masks, matrix.conflict_masks
+        column_masks, row_ids = matrix.column_masks, matrix.row_ids
+        stack: List[StackRecord] = []
+        live, uncovered = matrix.all_rows, matrix.all_columns
+        candidates = 0
+        while True:
+            if tracker is not None and not tracker.visit():
+                return
+            if not uncovered:
+                yield partial
+            else:
+                column = cls._choose_optimal_column(column_masks, live, uncovered)
+                candidates = column_masks[column] & live
+            while not candidates:
+                if not stack:
+                    return
+                candidates, live, uncovered = stack.pop()
+                partial.pop()
+
+            lowest = candidates & -candidates
+            row = lowest.bit_length() - 1
+            stack.append((candidates ^ lowest, live, uncovered))
+            partial.append(row_ids[row])
+            live &= ~conflict_masks[row]
+            uncovered &= ~row_masks[row]
+            candidates = 0
+
+    @staticmethod
+    def _choose_optimal_column(
+        column_masks: List[int], live: int, uncovered: int
+    ) -> int:
+        """Find uncovered column with fewest live rows to minimize branching factor.
+
+        Ties are broken by picking the first column. Scan stops early when a column
+        without any live rows is found, since it can't be beaten.
+
+        Args:
+            column_masks: Mask of candidate rows for each column.
+            live: Mask of rows that are still live.
+            uncovered: Mask of columns that are still uncovered, must not be empty.
+
+        Returns:
+            Index of optimal column.
+        """
+        lowest = uncovered & -uncovered
+        optimal_column = lowest.bit_length() - 1
+        size = popcount(column_masks[optimal_column] & live)
+        uncovered ^= lowest
+        while uncovered and size:
+            lowest = uncovered & -uncovered
+            column = lowest.bit_length() - 1
+            column_size = popcount(column_masks[column] & live)
+            if column_size < size:
+                optimal_column, size = column, column_size
+            uncovered ^= lowest
+        return optimal_column
@@ -1,47 +1,243 @@
 """Dictionary based implementation for algorithm X."""
 
-from typing import List, Optional, Generic
+from random import Random
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generator,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from .algox_base import AlgorithmX
-from exact_cover_solver.types import Solution, SubsetCollection, UniverseElement
-from exact_cover_solver.datastructures import DictMatrix, ColumnDict, ColumnValue
+from .estimate import Probe, TreeSizeEstimate
+from .limits import LimitTracker, SearchLimits
+from .stats import SolveStats
+from .strategies import ColumnSelectionStrategy, MRV
+from exact_cover_solver.types import (
+    Solution,
+    SubsetCollection,
+    SubsetId,
+    UniverseElement,
+)
+from exact_cover_solver.datastructures import (
+    DictMatrix,
+    ColumnDict,
+    ColumnValue,
+    LRUCache,
+)
+
+StackRecord = Tuple[List[SubsetId], int, List[ColumnValue]]
+PathRecord = Tuple[SubsetId, List[ColumnValue]]
+MemoKey = FrozenSet[UniverseElement]
+Secondary = FrozenSet[UniverseElement]
+SearchGenerator = Generator[Solution, None, None]
+RowWeight = Callable[[SubsetId], int]
 
 
 class DictX(AlgorithmX[DictMatrix], Generic[UniverseElement]):
     """Dictionary based implementation for algorithm X.
 
     Inheriting from generic type UniverseElement allows its bounded usage inside this
-    class.
+    class. Secondary columns stay in the column dictionary, so covering a row removes
+    rows conflicting with it on them too, but they are never chosen for branching and
+    matrix counts as covered when only secondary columns are left.
     """
 
-    def __init__(self) -> None:
-        """Initialize object by calling parent constructor."""
-        super().__init__()
+    def __init__(
+        self,
+        iterative: bool = False,
+        workers: int = 1,
+        split_depth: int = 2,
+        strategy: Optional[ColumnSelectionStrategy] = None,
+        instrument: bool = False,
+    ) -> None:
+        """Initialize object by calling parent constructor.
+
+        Args:
+            iterative: Run search with an explicit stack instead of recursion.
+            workers: Number of worker processes to split search to.
+            split_depth: How many levels of search tree to expand for workers.
+            strategy: How to choose column to branch on, first column with fewest
+                rows by default.
+            instrument: Collect statistics with a separate instrumented search
+                loop when solving. Solutions are then returned as a SearchResult
+                with the statistics.
+
+        Raises:
+            ValueError: if instrumentation is used with multiple workers.
+        """
+        super().__init__(iterative, workers, split_depth)
+        if instrument and workers > 1:
+            raise ValueError("Instrumentation can't be used with multiple workers.")
+        self._strategy = strategy or MRV()
+        self._instrument = instrument
 
-    def solve(self, matrix: DictMatrix) -> List[Solution]:
+    def solve(
+        self, matrix: DictMatrix, limits: Optional[SearchLimits] = None
+    ) -> List[Solution]:
         """Solve which rows cover the given matrix.
 
         Clears solutions bookkeeping from previous runs, then calls
-        recursive method.
+        recursive or iterative search method. Search with limits or
+        instrumentation is always iterative.
 
         Args:
             matrix: Matrix representation implemented with dictionaries and sets.
+            limits: Limits for stopping search early, search is exhaustive if None.
 
         Returns:
             List of solutions. Solution is a list identifiers of rows that were
-            picked to solution.
+            picked to solution. With limits or instrumentation, a SearchResult
+            telling whether the search was complete and its statistics.
         """
-        self._solutions.clear()
         column_dict, set_collection = matrix.data
+        if limits is not None or self._instrument:
+            tracker = self._create_tracker(limits) if limits is not None else None
+            if not self._instrument:
+                search = self._search_iterative(
+                    column_dict, set_collection, [], matrix.secondary, tracker
+                )
+                return self._collect_result(search, matrix, tracker)
+            stats = SolveStats()
+            search = self._search_instrumented(
+                column_dict, set_collection, [], stats, matrix.secondary, tracker
+            )
+            return self._collect_result(search, matrix, tracker, stats)
+        if self._workers > 1:
+            return self._solve_in_parallel(matrix)
+        self._solutions.clear()
         partial: Solution = []
-        self._search(column_dict, set_collection, partial)
+        if self._iterative:
+            search = self._search_iterative(
+                column_dict, set_collection, partial, matrix.secondary
+            )
+            for solution in search:
+                self._solutions.extend(matrix.expand(solution))
+        else:
+            self._search(column_dict, set_collection, partial, matrix.secondary)
+            self._expand_solutions(matrix)
         return self._solutions
 
+    def iter_solutions(self, matrix: DictMatrix) -> Iterator[Solution]:
+        """Yield solutions one by one as soon as they are found.
+
+        Generator can be abandoned at any point, closing it restores the matrix to
+        its original state.
+
+        Args:
+            matrix: Matrix representation implemented with dictionaries and sets.
+
+        Yields:
+            Solution as a list of identifiers of rows that were picked to solution.
+        """
+        if self._workers > 1:
+            yield from self._iter_in_parallel(matrix)
+            return
+        column_dict, set_collection = matrix.data
+        search = self._search_iterative(
+            column_dict, set_collection, [], matrix.secondary
+        )
+        try:
+            for solution in search:
+                yield from matrix.expand(solution)
+        finally:
+            search.close()
+
+    def count(self, matrix: DictMatrix) -> int:
+        """Count solutions without copying or storing them.
+
+        Solutions of merged rows are weighted by the sizes of their groups instead
+        of being expanded.
+
+        Args:
+            matrix: Matrix representation implemented with dictionaries and sets.
+
+        Returns:
+            Number of solutions.
+        """
+        if self._workers > 1:
+            return self._count_in_parallel(matrix)
+        column_dict, set_collection = matrix.data
+        search = self._search_iterative(
+            column_dict, set_collection, [], matrix.secondary
+        )
+        return sum(map(matrix.weight, search))
+
+    def count_memoized(self, matrix: DictMatrix, cache_size: int = 2**16) -> int:
+        """Count solutions memoizing counts of already seen subproblems.
+
+        Number of ways to cover the rest of the matrix only depends on which columns
+        are still in the column dictionary, so it's stored with those as key.
+
+        Args:
+            matrix: Matrix representation implemented with dictionaries and sets.
+            cache_size: Maximum number of subproblem counts to keep. Least recently
+                used counts are evicted when cache is full.
+
+        Returns:
+            Number of solutions.
+        """
+        column_dict, set_collection = matrix.data
+        return self._count_memoized(
+            column_dict,
+            set_collection,
+            matrix.row_weight,
+            LRUCache(cache_size),
+            matrix.secondary,
+        )
+
+    def estimate(
+        self, matrix: DictMatrix, probes: int = 100, seed: Optional[int] = None
+    ) -> TreeSizeEstimate:
+        """Estimate size of the search tree by walking random paths through it.
+
+        Columns are chosen with the strategy of the algorithm, so estimate is for
+        the tree that search with same strategy would explore.
+
+        Args:
+            matrix: Matrix representation implemented with dictionaries and sets.
+            probes: Number of random paths to walk.
+            seed: Seed for picking random rows, same seed gives same estimate as
+                long as rows of the columns are iterated in same order.
+
+        Returns:
+            Estimated number of nodes and solutions with confidence bounds.
+        """
+        random = Random(seed)
+        column_dict, set_collection = matrix.data
+        return TreeSizeEstimate(
+            [
+                self._probe(
+                    column_dict,
+                    set_collection,
+                    matrix.row_weight,
+                    random,
+                    matrix.secondary,
+                )
+                for _ in range(probes)
+            ]
+        )
+
+    def _worker_options(self) -> Dict[str, Any]:
+        """Pass column selection strategy to algorithms in worker processes.
+
+        Returns:
+            Dictionary with the strategy.
+        """
+        return {"strategy": self._strategy}
+
     def _search(
         self,
         column_dict: ColumnDict,
         set_collection: SubsetCollection,
         partial: Solution,
+        secondary: Secondary = frozenset(),
     ) -> None:
         """Perform algorithm X recursively and collect solutions.
 
@@ -49,12 +245,13 @@ class DictX(AlgorithmX[DictMatrix], Generic[UniverseElement]):
             column_dict: Matrix representation as a dictionary.
             set_collection: Original set collection used to create the matrix.
             partial: List including rows collected this far in recursion.
+            secondary: Elements whose columns are secondary.
         """
-        if not column_dict:
+        if column_dict.keys() <= secondary:
             self._solutions.append(partial[:])
             return
 
-        column = self._choose_optimal_column(column_dict)
+        column = self._strategy.choose_column(column_dict, set_collection, secondary)
 
         if not column_dict[column]:
             return
@@ -64,34 +261,289 @@ class DictX(AlgorithmX[DictMatrix], Generic[UniverseElement]):
         for row in rows:
             partial.append(row)
             removed_columns = self._cover(column_dict, set_collection, row)
-            self._search(column_dict, set_collection, partial)
+            self._search(column_dict, set_collection, partial, secondary)
             self._uncover(column_dict, set_collection, row, removed_columns)
             partial.pop()
 
+    def _search_iterative(
+        self,
+        column_dict: ColumnDict,
+        set_collection: SubsetCollection,
+        partial: Solution,
+        secondary: Secondary = frozenset(),
+        tracker: Optional[LimitTracker] = None,
+    ) -> SearchGenerator:
+        """Perform algorithm X with an explicit stack and yield solutions.
+
+        Each stack record holds the candidate rows of the chosen column, index of the
+        row currently picked and columns removed while covering that row, so the
+        nodes are visited in the same order as in the recursive search. Yielded list
+        is the partial solution itself, so it's only valid until the search
+        continues. If search is closed early or stopped by the tracker, covered rows
+        are uncovered before exiting.
+
+        Args:
+            column_dict: Matrix representation as a dictionary.
+            set_collection: Original set collection used to create the matrix.
+            partial: List including rows collected this far in search.
+            secondary: Elements whose columns are secondary.
+            tracker: Tracker counting each visited node against node and time limits.
+
+        Yields:
+            Partial solution each time it covers the whole matrix.
+        """
+        stack: List[StackRecord] = []
+        try:
+            descend = True
+            while True:
+                if descend:
+                    if tracker is not None and not tracker.visit():
+                        return
+                    if column_dict.keys() <= secondary:
+                        yield partial
+                    else:
+                        column = self._strategy.choose_column(
+                            column_dict, set_collection, secondary
+                        )
+                        if column_dict[column]:
+                            rows = list(column_dict[column])
+                            row = rows[0]
+                            partial.append(row)
+                            removed_columns = self._cover(
+                                column_dict, set_collection, row
+                            )
+                            stack.append((rows, 0, removed_columns))
+                            continue
+
+                if not stack:
+                    return
+                rows, index, removed_columns = stack.pop()
+                self._uncover(
+                    column_dict, set_collection, partial.pop(), removed_columns
+                )
+                index += 1
+                if index < len(rows):
+                    row = rows[index]
+                    partial.append(row)
+                    removed_columns = self._cover(column_dict, set_collection, row)
+                    stack.append((rows, index, removed_columns))
+                    descend = True
+                else:
+                    descend = False
+        finally:
+            while stack:
+                _, _, removed_columns = stack.pop()
+                self._uncover(
+                    column_dict, set_collection, partial.pop(), removed_columns
+                )
+
+    def _search_instrumented(
+        self,
+        column_dict: ColumnDict,
+        set_collection: SubsetCollection,
+        partial: Solution,
+        stats: SolveStats,
+        secondary: Secondary = frozenset(),
+        tracker: Optional[LimitTracker] = None,
+    ) -> SearchGenerator:
+        """Perform iterative algorithm X while recording statistics.
+
+        Same search as the iterative one, but each node, chosen column and update
+        is counted. Updates of a cover are counted from the columns it removed, and
+        uncover restores as many, so both are counted when covering.
+
+        Args:
+            column_dict: Matrix representation as a dictionary.
+            set_collection: Original set collection used to create the matrix.
+            partial: List including rows collected this far in search.
+            stats: Statistics to record to.
+            secondary: Elements whose columns are secondary.
+            tracker: Tracker counting each visited node against node and time limits.
+
+        Yields:
+            Partial solution each time it covers the whole matrix.
+        """
+        stack: List[StackRecord] = []
+        try:
+            descend = True
+            while True:
+                if descend:
+                    if tracker is not None and not tracker.visit():
+                        return
+                    stats.visit(len(stack))
+                    if column_dict.keys() <= secondary:
+                        yield partial
+                    else:
+                        column = self._strategy.choose_column(
+                            column_dict, set_collection, secondary
+                        )
+                        stats.choose(len(stack), len(column_dict[column]))
+                        if column_dict[column]:
+                            rows = list(column_dict[column])
+                            row = rows[0]
+                            partial.append(row)
+                            removed_columns = self._cover(
+                                column_dict, set_collection, row
+                            )
+                            stats.updates += 2 * self._count_updates(
+                                set_collection, removed_columns
+                            )
+                            stack.append((rows, 0, removed_columns))
+                            continue
+
+                if not stack:
+                    return
+                rows, index, removed_columns = stack.pop()
+                self._uncover(
+                    column_dict, set_collection, partial.pop(), removed_columns
+                )
+                index += 1
+                if index < len(rows):
+                    row = rows[index]
+                    partial.append(row)
+                    removed_columns = self._cover(column_dict, set_collection, row)
+                    stats.updates += 2 * self._count_updates(
+                        set_collection, removed_columns
+                    )
+                    stack.append((rows, index, removed_columns))
+                    descend = True
+                else:
+                    descend = False
+        finally:
+            while stack:
+                _, _, removed_columns = stack.pop()
+                self._uncover(
+                    column_dict, set_collection, partial.pop(), removed_columns
+                )
+
+    def _probe(
+        self,
+        column_dict: ColumnDict,
+        set_collection: SubsetCollection,
+        row_weight: RowWeight,
+        random: Random,
+        secondary: Secondary = frozenset(),
+    ) -> Probe:
+        """Walk one random path from root to leaf and restore the matrix.
+
+        Solution estimate is multiplied by the sizes of the row groups on the path,
+        so it estimates solutions of the problem before merging duplicate rows.
+
+        Args:
+            column_dict: Matrix representation as a dictionary.
+            set_collection: Original set collection used to create the matrix.
+            row_weight: Function giving number of subsets merged to a row.
+            random: Random number generator picking the rows.
+            secondary: Elements whose columns are secondary.
+
+        Returns:
+            Estimated number of nodes and solutions.
+        """
+        path: List[PathRecord] = []
+        weight, nodes, solutions, multiplicity = 1, 0, 0, 1
+        try:
+            while True:
+                nodes += weight
+                if column_dict.keys() <= secondary:
+                    solutions = weight * multiplicity
+                    break
+                column = self._strategy.choose_column(
+                    column_dict, set_collection, secondary
+                )
+                rows = list(column_dict[column])
+                if not rows:
+                    break
+                weight *= len(rows)
+                row = rows[random.randrange(len(rows))]
+                multiplicity *= row_weight(row)
+                path.append((row, self._cover(column_dict, set_collection, row)))
+        finally:
+            while path:
+                row, removed_columns = path.pop()
+                self._uncover(column_dict, set_collection, row, removed_columns)
+        return nodes, solutions
+
+    def _count_memoized(
+        self,
+        column_dict: ColumnDict,
+        set_collection: SubsetCollection,
+        row_weight: RowWeight,
+        cache: "LRUCache[MemoKey, int]",
+        secondary: Secondary = frozenset(),
+    ) -> int:
+        """Count solutions recursively using cached subproblem counts.
+
+        Key includes remaining secondary columns too, since they decide which rows
+        are still allowed.
+
+        Args:
+            column_dict: Matrix representation as a dictionary.
+            set_collection: Original set collection used to create the matrix.
+            row_weight: Function giving number of subsets merged to a row.
+            cache: Subproblem counts keyed by remaining columns.
+            secondary: Elements whose columns are secondary.
+
+        Returns:
+            Number of ways to cover the remaining columns.
+        """
+        if column_dict.keys() <= secondary:
+            return 1
+
+        key = frozenset(column_dict)
+        count = cache.get(key)
+        if count is not None:
+            return count
+
+        count = 0
+        column = self._strategy.choose_column(column_dict, set_collection, secondary)
+        for row in list(column_dict[column]):
+            removed_columns = self._cover(column_dict, set_collection, row)
+            count += row_weight(row) * self._count_memoized(
+                column_dict, set_collection, row_weight, cache, secondary
+            )
+            self._uncover(column_dict, set_collection, row, removed_columns)
+        cache.put(key, count)
+        return count
+
     @staticmethod
-    def _choose_optimal_column(column_dict: ColumnDict) -> UniverseElement:
+    def _choose_optimal_column(
+        column_dict: ColumnDict, secondary: Secondary = frozenset()
+    ) -> UniverseElement:
         """Find column with smallest size to minimize the branching factor.
 
+        Search uses the strategy given to constructor, this is the default one.
+
         Args:
             column_dict: Dictionary of each column on current iteration.
+            secondary: Elements whose columns are secondary.
 
         Returns:
             Key of optimal column.
+        """
+        column: UniverseElement = MRV().choose_column(column_dict, {}, secondary)
+        return column
 
-        Raises:
-            ValueError: if not possible to find any column from given dict.
-        """
-        key: Optional[UniverseElement] = None
-        size: Optional[int] = None
-        for element, subset_ids in column_dict.items():
-            key = element if key is None else key
-            size = len(subset_ids) if size is None else size
-            key, size = (
-                (element, len(subset_ids)) if len(subset_ids) < size else (key, size)
-            )
-        if key is not None and size is not None:
-            return key
-        raise ValueError("Not possible to choose optimal column from empty dict.")
+    @staticmethod
+    def _count_updates(
+        set_collection: SubsetCollection, removed_columns: List[ColumnValue]
+    ) -> int:
+        """Count updates made by a cover that removed given columns.
+
+        Each removed column was popped from the dictionary, and each of its rows
+        was removed from the sets of its other elements.
+
+        Args:
+            set_collection: Original set collection used to create the matrix.
+            removed_columns: Columns removed while covering a set.
+
+        Returns:
+            Number of removals.
+        """
+        updates = len(removed_columns)
+        for rows in removed_columns:
+            for row in rows:
+                updates += len(set_collection[row]) - 1
+        return updates
 
     @staticmethod
     def _cover(
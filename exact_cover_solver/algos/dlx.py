@@ -1,37 +1,206 @@
 """Dancing links based implementation for algorithm X."""
 
-from typing import List, Union
+from random import Random
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from .algox_base import AlgorithmX
-from exact_cover_solver.types import Solution
-from exact_cover_solver.datastructures import DLXMatrix, ColumnObject, RootObject
+from .estimate import Probe, TreeSizeEstimate
+from .limits import LimitTracker, SearchLimits
+from .stats import SolveStats
+from .strategies import ColumnSelectionStrategy, MRV
+from exact_cover_solver.types import Solution, SubsetId
+from exact_cover_solver.datastructures import (
+    DLXMatrix,
+    ColumnObject,
+    DataObject,
+    LRUCache,
+    RootObject,
+)
+
+StackRecord = Tuple[ColumnObject, DataObject]
+LiveColumns = Tuple[ColumnObject, ...]
+ColumnSet = FrozenSet[ColumnObject]
+MemoKey = Tuple[LiveColumns, ColumnSet]
+SearchGenerator = Generator[Solution, None, None]
+RowWeight = Callable[[SubsetId], int]
 
 
 class DLX(AlgorithmX[DLXMatrix]):
-    """Dancing links based implementation for algorithm X."""
+    """Dancing links based implementation for algorithm X.
+
+    Secondary columns aren't linked to the header list, so they are never chosen
+    for branching, but covering a row still covers them and removes conflicting rows.
+    """
 
-    def __init__(self) -> None:
-        """Initialize object by calling parent constructor."""
-        super().__init__()
+    def __init__(
+        self,
+        iterative: bool = False,
+        workers: int = 1,
+        split_depth: int = 2,
+        strategy: Optional[ColumnSelectionStrategy] = None,
+        instrument: bool = False,
+    ) -> None:
+        """Initialize object by calling parent constructor.
+
+        Args:
+            iterative: Run search with an explicit stack instead of recursion.
+            workers: Number of worker processes to split search to.
+            split_depth: How many levels of search tree to expand for workers.
+            strategy: How to choose column to branch on, first column with fewest
+                rows by default.
+            instrument: Collect statistics with a separate instrumented search
+                loop when solving. Solutions are then returned as a SearchResult
+                with the statistics.
+
+        Raises:
+            ValueError: if instrumentation is used with multiple workers.
+        """
+        super().__init__(iterative, workers, split_depth)
+        if instrument and workers > 1:
+            raise ValueError("Instrumentation can't be used with multiple workers.")
+        self._strategy = strategy or MRV()
+        self._instrument = instrument
 
-    def solve(self, matrix: DLXMatrix) -> List[Solution]:
+    def solve(
+        self, matrix: DLXMatrix, limits: Optional[SearchLimits] = None
+    ) -> List[Solution]:
         """Solve which rows cover the given matrix.
 
         Clears solutions bookkeeping from previous runs, then calls
-        recursive method.
+        recursive or iterative search method. Search with limits or
+        instrumentation is always iterative.
 
         Args:
             matrix: Matrix representation implemented with circular doubly linked lists.
+            limits: Limits for stopping search early, search is exhaustive if None.
 
         Returns:
             List of solutions. Solution is a list identifiers of rows that were
-            picked to solution.
+            picked to solution. With limits or instrumentation, a SearchResult
+            telling whether the search was complete and its statistics.
         """
+        if limits is not None or self._instrument:
+            tracker = self._create_tracker(limits) if limits is not None else None
+            if not self._instrument:
+                search = self._search_iterative(matrix.root, [], tracker)
+                return self._collect_result(search, matrix, tracker)
+            stats = SolveStats()
+            search = self._search_instrumented(matrix.root, [], stats, tracker)
+            return self._collect_result(search, matrix, tracker, stats)
+        if self._workers > 1:
+            return self._solve_in_parallel(matrix)
         self._solutions.clear()
         partial: Solution = []
-        self._search(matrix.root, partial)
+        if self._iterative:
+            for solution in self._search_iterative(matrix.root, partial):
+                self._solutions.extend(matrix.expand(solution))
+        else:
+            self._search(matrix.root, partial)
+            self._expand_solutions(matrix)
         return self._solutions
 
+    def iter_solutions(self, matrix: DLXMatrix) -> Iterator[Solution]:
+        """Yield solutions one by one as soon as they are found.
+
+        Generator can be abandoned at any point, closing it restores the matrix to
+        its original state.
+
+        Args:
+            matrix: Matrix representation implemented with circular doubly linked lists.
+
+        Yields:
+            Solution as a list of identifiers of rows that were picked to solution.
+        """
+        if self._workers > 1:
+            yield from self._iter_in_parallel(matrix)
+            return
+        search = self._search_iterative(matrix.root, [])
+        try:
+            for solution in search:
+                yield from matrix.expand(solution)
+        finally:
+            search.close()
+
+    def count(self, matrix: DLXMatrix) -> int:
+        """Count solutions without copying or storing them.
+
+        Solutions of merged rows are weighted by the sizes of their groups instead
+        of being expanded.
+
+        Args:
+            matrix: Matrix representation implemented with circular doubly linked lists.
+
+        Returns:
+            Number of solutions.
+        """
+        if self._workers > 1:
+            return self._count_in_parallel(matrix)
+        return sum(map(matrix.weight, self._search_iterative(matrix.root, [])))
+
+    def count_memoized(self, matrix: DLXMatrix, cache_size: int = 2**16) -> int:
+        """Count solutions memoizing counts of already seen subproblems.
+
+        Number of ways to cover the rest of the matrix only depends on which columns
+        are still uncovered, so it's stored with the live columns and covered
+        secondary columns as key. Different row choices often lead to same set of
+        columns, e.g. with duplicate subsets or in tiling problems, and the whole
+        subtree is skipped then.
+
+        Args:
+            matrix: Matrix representation implemented with circular doubly linked lists.
+            cache_size: Maximum number of subproblem counts to keep. Least recently
+                used counts are evicted when cache is full.
+
+        Returns:
+            Number of solutions.
+        """
+        return self._count_memoized(
+            matrix.root,
+            matrix.row_weight,
+            LRUCache(cache_size),
+            frozenset(matrix.secondary_columns),
+            frozenset(),
+        )
+
+    def estimate(
+        self, matrix: DLXMatrix, probes: int = 100, seed: Optional[int] = None
+    ) -> TreeSizeEstimate:
+        """Estimate size of the search tree by walking random paths through it.
+
+        Columns are chosen with the strategy of the algorithm, so estimate is for
+        the tree that search with same strategy would explore.
+
+        Args:
+            matrix: Matrix representation implemented with circular doubly linked lists.
+            probes: Number of random paths to walk.
+            seed: Seed for picking random rows, same seed gives same estimate.
+
+        Returns:
+            Estimated number of nodes and solutions with confidence bounds.
+        """
+        random = Random(seed)
+        return TreeSizeEstimate(
+            [self._probe(matrix.root, matrix.row_weight, random) for _ in range(probes)]
+        )
+
+    def _worker_options(self) -> Dict[str, Any]:
+        """Pass column selection strategy to algorithms in worker processes.
+
+        Returns:
+            Dictionary with the strategy.
+        """
+        return {"strategy": self._strategy}
+
     def _search(self, root: RootObject, partial: Solution) -> None:
         """Perform algorithm X recursively and collect solutions.
 
@@ -43,7 +212,7 @@ class DLX(AlgorithmX[DLXMatrix]):
             self._solutions.append(partial[:])
             return
 
-        column = self._choose_optimal_column_object(root)
+        column = self._strategy.choose_column_object(root)
 
         if column.size == 0:
             return
@@ -66,32 +235,293 @@ class DLX(AlgorithmX[DLXMatrix]):
             row = row.down
         self._uncover(column)
 
+    def _search_iterative(
+        self,
+        root: RootObject,
+        partial: Solution,
+        tracker: Optional[LimitTracker] = None,
+    ) -> SearchGenerator:
+        """Perform algorithm X with an explicit stack and yield solutions.
+
+        Each stack record holds a covered column and the row currently picked from
+        it, so the nodes are visited in the same order as in the recursive search.
+        Yielded list is the partial solution itself, so it's only valid until the
+        search continues. If search is closed early or stopped by the tracker,
+        covered columns are uncovered before exiting.
+
+        Args:
+            root: Matrix representation implemented as circular doubly linked lists.
+            partial: List including rows collected this far in search.
+            tracker: Tracker counting each visited node against node and time limits.
+
+        Yields:
+            Partial solution each time it covers the whole matrix.
+        """
+        stack: List[StackRecord] = []
+        try:
+            descend = True
+            while True:
+                if descend:
+                    if tracker is not None and not tracker.visit():
+                        return
+                    if root.right is root:
+                        yield partial
+                    else:
+                        column = self._strategy.choose_column_object(root)
+                        row = column.down
+                        if isinstance(row, DataObject):
+                            self._cover(column)
+                            partial.append(row.id)
+                            node = row.right
+                            while node is not row:
+                                self._cover(node.column)
+                                node = node.right
+                            stack.append((column, row))
+                            continue
+
+                if not stack:
+                    return
+                column, row = stack.pop()
+                node = row.left
+                while node is not row:
+                    self._uncover(node.column)
+                    node = node.left
+                partial.pop()
+                next_row = row.down
+                if isinstance(next_row, ColumnObject):
+                    self._uncover(column)
+                    descend = False
+                else:
+                    partial.append(next_row.id)
+                    node = next_row.right
+                    while node is not next_row:
+                        self._cover(node.column)
+                        node = node.right
+                    stack.append((column, next_row))
+                    descend = True
+        finally:
+            while stack:
+                column, row = stack.pop()
+                node = row.left
+                while node is not row:
+                    self._uncover(node.column)
+                    node = node.left
+                partial.pop()
+                self._uncover(column)
+
+    def _search_instrumented(
+        self,
+        root: RootObject,
+        partial: Solution,
+        stats: SolveStats,
+        tracker: Optional[LimitTracker] = None,
+    ) -> SearchGenerator:
+        """Perform iterative algorithm X while recording statistics.
+
+        Same search as the iterative one, but each node, chosen column and link
+        update is counted. Every cover is undone by an uncover doing as many
+        updates, so both are counted when covering.
+
+        Args:
+            root: Matrix representation implemented as circular doubly linked lists.
+            partial: List including rows collected this far in search.
+            stats: Statistics to record to.
+            tracker: Tracker counting each visited node against node and time limits.
+
+        Yields:
+            Partial solution each time it covers the whole matrix.
+        """
+        stack: List[StackRecord] = []
+        try:
+            descend = True
+            while True:
+                if descend:
+                    if tracker is not None and not tracker.visit():
+                        return
+                    stats.visit(len(stack))
+                    if root.right is root:
+                        yield partial
+                    else:
+                        column = self._strategy.choose_column_object(root)
+                        stats.choose(len(stack), column.size)
+                        row = column.down
+                        if isinstance(row, DataObject):
+                            updates = self._cover_counted(column)
+                            partial.append(row.id)
+                            node = row.right
+                            while node is not row:
+                                updates += self._cover_counted(node.column)
+                                node = node.right
+                            stats.updates += 2 * updates
+                            stack.append((column, row))
+                            continue
+
+                if not stack:
+                    return
+                column, row = stack.pop()
+                node = row.left
+                while node is not row:
+                    self._uncover(node.column)
+                    node = node.left
+                partial.pop()
+                next_row = row.down
+                if isinstance(next_row, ColumnObject):
+                    self._uncover(column)
+                    descend = False
+                else:
+                    partial.append(next_row.id)
+                    updates = 0
+                    node = next_row.right
+                    while node is not next_row:
+                        updates += self._cover_counted(node.column)
+                        node = node.right
+                    stats.updates += 2 * updates
+                    stack.append((column, next_row))
+                    descend = True
+        finally:
+            while stack:
+                column, row = stack.pop()
+                node = row.left
+                while node is not row:
+                    self._uncover(node.column)
+                    node = node.left
+                partial.pop()
+                self._uncover(column)
+
+    def _probe(self, root: RootObject, row_weight: RowWeight, random: Random) -> Probe:
+        """Walk one random path from root to leaf and restore the matrix.
+
+        Solution estimate is multiplied by the sizes of the row groups on the path,
+        so it estimates solutions of the problem before merging duplicate rows.
+
+        Args:
+            root: Matrix representation implemented as circular doubly linked lists.
+            row_weight: Function giving number of subsets merged to a row.
+            random: Random number generator picking the rows.
+
+        Returns:
+            Estimated number of nodes and solutions.
+        """
+        stack: List[StackRecord] = []
+        weight, nodes, solutions, multiplicity = 1, 0, 0, 1
+        try:
+            while True:
+                nodes += weight
+                if root.right is root:
+                    solutions = weight * multiplicity
+                    break
+                column = self._strategy.choose_column_object(root)
+                if column.size == 0:
+                    break
+                weight *= column.size
+                row = column.down
+                for _ in range(random.randrange(column.size)):
+                    row = row.down
+                if not isinstance(row, DataObject):
+                    break
+                multiplicity *= row_weight(row.id)
+                self._cover(column)
+                node = row.right
+                while node is not row:
+                    self._cover(node.column)
+                    node = node.right
+                stack.append((column, row))
+        finally:
+            while stack:
+                column, row = stack.pop()
+                node = row.left
+                while node is not row:
+                    self._uncover(node.column)
+                    node = node.left
+                self._uncover(column)
+        return nodes, solutions
+
+    def _count_memoized(
+        self,
+        root: RootObject,
+        row_weight: RowWeight,
+        cache: "LRUCache[MemoKey, int]",
+        secondary: ColumnSet,
+        covered: ColumnSet,
+    ) -> int:
+        """Count solutions recursively using cached subproblem counts.
+
+        Args:
+            root: Matrix representation implemented as circular doubly linked lists.
+            row_weight: Function giving number of subsets merged to a row.
+            cache: Subproblem counts keyed by live and covered secondary columns.
+            secondary: Secondary columns of the matrix.
+            covered: Secondary columns covered this far in recursion.
+
+        Returns:
+            Number of ways to cover the live columns.
+        """
+        if root.right is root:
+            return 1
+
+        key = (self._live_columns(root), covered)
+        count = cache.get(key)
+        if count is not None:
+            return count
+
+        count = 0
+        column = self._strategy.choose_column_object(root)
+        if column.size != 0:
+            self._cover(column)
+            row = column.down
+            while not isinstance(row, ColumnObject):
+                reached = covered
+                node = row.right
+                while node != row:
+                    self._cover(node.column)
+                    if node.column in secondary:
+                        reached = reached.union((node.column,))
+                    node = node.right
+                count += row_weight(row.id) * self._count_memoized(
+                    root, row_weight, cache, secondary, reached
+                )
+                node = row.left
+                while node != row:
+                    self._uncover(node.column)
+                    node = node.left
+                row = row.down
+            self._uncover(column)
+        cache.put(key, count)
+        return count
+
+    @staticmethod
+    def _live_columns(root: RootObject) -> LiveColumns:
+        """Collect columns still linked to the header list.
+
+        Header list keeps columns in their original order, so same set of columns
+        always gives the same tuple.
+
+        Args:
+            root: Matrix representation implemented as circular doubly linked lists.
+
+        Returns:
+            Tuple of live column objects.
+        """
+        columns = []
+        column = root.right
+        while not isinstance(column, RootObject):
+            columns.append(column)
+            column = column.right
+        return tuple(columns)
+
     @staticmethod
     def _choose_optimal_column_object(root: RootObject) -> ColumnObject:
         """Find column with smallest number of 1s to minimize the branching factor.
 
+        Search uses the strategy given to constructor, this is the default one.
+
         Args:
             root: Matrix representation implemented as circular doubly linked lists.
 
         Returns:
             Linked list column node representing column with smallest number of 1s.
-
-        Raises:
-            ValueError: if not possible to find any column from given root
-        """
-        current_column: Union[ColumnObject, RootObject] = root.right
-        if isinstance(current_column, RootObject):
-            raise ValueError("No columns reachable from given root")
-        optimal_column: ColumnObject = current_column
-        size = current_column.size
-        while not isinstance(current_column, RootObject):
-            optimal_column, size = (
-                (current_column, current_column.size)
-                if current_column.size < size
-                else (optimal_column, size)
-            )
-            current_column = current_column.right
-        return optimal_column
+        """
+        return MRV().choose_column_object(root)
 
     @staticmethod
     def _cover(column: ColumnObject) -> None:
@@ -113,6 +543,28 @@ class DLX(AlgorithmX[DLXMatrix]):
                 node = node.right
             row = row.down
 
+    @staticmethod
+    def _cover_counted(column: ColumnObject) -> int:
+        """Cover given column like _cover and count detached nodes.
+
+        Args:
+            column: Linked list column node.
+
+        Returns:
+            Number of detach calls, column itself included.
+        """
+        column.detach()
+        updates = 1
+        row = column.down
+        while not isinstance(row, ColumnObject):
+            node = row.right
+            while node is not row:
+                node.detach()
+                updates += 1
+                node = node.right
+            row = row.down
+        return updates
+
     @staticmethod
     def _uncover(column: ColumnObject) -> None:
         """Uncover given column.
@@ -0,0 +1,63 @@
+"""Monte Carlo estimates of search tree size.
+
+Follows Knuth's random path method. Probe walks from the root to a leaf picking a
+random row on each level, and multiplies the branching factors seen so far. Sum of
+those products is an unbiased estimate of the number of nodes in the tree, and the
+product at a solution leaf is an unbiased estimate of the number of solutions.
+Averaging many probes makes the estimates converge, but their distribution is
+heavy tailed, so bounds from normal approximation should be taken as rough.
+"""
+from math import sqrt
+from statistics import mean, stdev
+from typing import List, Tuple
+
+Probe = Tuple[int, int]
+Bounds = Tuple[float, float]
+
+
+class TreeSizeEstimate:
+    """Estimated number of nodes and solutions in a search tree.
+
+    Attributes:
+        nodes: Estimated number of search tree nodes.
+        nodes_bounds: Lower and upper confidence bound for number of nodes.
+        solutions: Estimated number of solutions.
+        solutions_bounds: Lower and upper confidence bound for number of solutions.
+        probes: Number of random paths estimate is based on.
+    """
+
+    z = 1.96
+
+    def __init__(self, probes: List[Probe]) -> None:
+        """Calculate estimates with 95 % confidence bounds from probes.
+
+        Args:
+            probes: Estimated node and solution counts from each random path.
+
+        Raises:
+            ValueError: if there are less than two probes.
+        """
+        if len(probes) < 2:
+            raise ValueError("At least two probes are needed for confidence bounds.")
+        node_counts = [nodes for nodes, _ in probes]
+        solution_counts = [solutions for _, solutions in probes]
+        self.nodes, self.nodes_bounds = self._mean_with_bounds(node_counts, 1)
+        self.solutions, self.solutions_bounds = self._mean_with_bounds(
+            solution_counts, 0
+        )
+        self.probes = len(probes)
+
+    @classmethod
+    def _mean_with_bounds(cls, counts: List[int], minimum: int) -> Tuple[float, Bounds]:
+        """Calculate mean of counts and its confidence bounds.
+
+        Args:
+            counts: Count estimated by each probe.
+            minimum: Smallest possible value of the count.
+
+        Returns:
+            Mean and its lower and upper bound.
+        """
+        counts_mean = float(mean(counts))
+        margin = cls.z * stdev(counts) / sqrt(len(counts))
+        return counts_mean, (max(counts_mean - margin, minimum), counts_mean + margin)
@@ -0,0 +1,162 @@
+"""Limits for stopping a search before the whole search tree is explored.
+
+Limits are checked by a tracker created for each search. Checking a node only
+decrements a countdown, clock is read once per countdown round, so checks don't
+slow down the search noticeably.
+"""
+import time
+from typing import Iterable, List, Optional, TypeVar
+
+from .stats import SolveStats
+
+T = TypeVar("T")
+
+
+class SearchLimits:
+    """Limits for a single search.
+
+    Attributes:
+        max_nodes: Maximum number of search tree nodes to visit.
+        time_limit: Maximum number of seconds to search.
+        max_solutions: Maximum number of solutions to find.
+    """
+
+    def __init__(
+        self,
+        max_nodes: Optional[int] = None,
+        time_limit: Optional[float] = None,
+        max_solutions: Optional[int] = None,
+    ) -> None:
+        """Initialize limits, None means no limit.
+
+        Args:
+            max_nodes: Maximum number of search tree nodes to visit.
+            time_limit: Maximum number of seconds to search. Deadline is set when
+                search starts.
+            max_solutions: Maximum number of solutions to find. Search stops at the
+                last allowed solution without checking whether there are more.
+
+        Raises:
+            ValueError: if some limit is not positive.
+        """
+        for name, value in [
+            ("max_nodes", max_nodes),
+            ("time_limit", time_limit),
+            ("max_solutions", max_solutions),
+        ]:
+            if value is not None and value <= 0:
+                raise ValueError(f"Limit {name} must be positive, got {value}.")
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+        self.max_solutions = max_solutions
+
+
+class SearchResult(List[T]):
+    """List of solutions telling whether the search was complete.
+
+    Incomplete result means only that there may be more solutions. Search stopped by
+    solution limit counts as truncated even if the last allowed solution happened to
+    be the last one, since rest of the tree wasn't explored to confirm it, e.g. a
+    problem with exactly two solutions is incomplete with max_solutions=2 but
+    complete with max_solutions=3.
+
+    Attributes:
+        complete: True if the whole search tree was explored, so these are all the
+            solutions. False if search was stopped by a limit, so there may be more
+            solutions.
+        stats: Statistics of the search if it was instrumented, None otherwise.
+    """
+
+    def __init__(
+        self,
+        solutions: Iterable[T] = (),
+        complete: bool = True,
+        stats: Optional[SolveStats] = None,
+    ) -> None:
+        """Initialize list with given solutions.
+
+        Args:
+            solutions: Solutions found.
+            complete: Whether the whole search tree was explored.
+            stats: Statistics of the search if it was instrumented.
+        """
+        super().__init__(solutions)
+        self.complete = complete
+        self.stats = stats
+
+
+class LimitTracker:
+    """Counters for checking limits during one search.
+
+    Attributes:
+        truncated: Whether some limit has been hit.
+    """
+
+    check_interval = 1024
+
+    def __init__(self, limits: SearchLimits) -> None:
+        """Start tracking limits, deadline is counted from now.
+
+        Args:
+            limits: Limits for the search.
+        """
+        self.truncated = False
+        self._nodes_left = limits.max_nodes
+        self._deadline = (
+            time.monotonic() + limits.time_limit
+            if limits.time_limit is not None
+            else None
+        )
+        self._solutions_left = limits.max_solutions
+        self._round = 0
+        self._countdown = 0
+        self._start_round()
+
+    def visit(self) -> bool:
+        """Count visited node.
+
+        Returns:
+            True if search can continue.
+        """
+        self._countdown -= 1
+        if self._countdown > 0:
+            return True
+        return self._check()
+
+    def add_solution(self) -> bool:
+        """Count found solution.
+
+        Returns:
+            True if search can continue.
+        """
+        if self._solutions_left is None:
+            return True
+        self._solutions_left -= 1
+        if self._solutions_left > 0:
+            return True
+        self.truncated = True
+        return False
+
+    def _check(self) -> bool:
+        """Check node and time limits when countdown runs out and start new round.
+
+        Returns:
+            True if search can continue.
+        """
+        if self._nodes_left is not None:
+            self._nodes_left -= self._round
+            if self._nodes_left < 0:
+                self.truncated = True
+                return False
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            self.truncated = True
+            return False
+        self._start_round()
+        return True
+
+    def _start_round(self) -> None:
+        """Set countdown to next check, which is on the first node over the limit."""
+        self._round = self.check_interval
+        if self._nodes_left is not None:
+            self._round = min(self._round, self._nodes_left + 1)
+        self._countdown = self._round
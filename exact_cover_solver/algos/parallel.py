@@ -0,0 +1,125 @@
+"""Helpers for splitting algorithm X search to independent subproblems.
+
+Search tree is expanded to a given depth directly from the problem data: on each
+level the column with fewest candidate rows is chosen (first one on ties, like the
+engines do) and every candidate row yields a smaller problem where the covered
+columns and conflicting rows are removed. Each subproblem is identified by the
+rows picked on the way, i.e. its prefix. Subproblems can then be solved in separate
+processes and their results combined in the order of the prefixes. Subproblems of
+valid problems are valid, so their matrices skip validation. Secondary
+elements are carried along, covered ones are removed like primary ones, but they
+are never chosen for branching.
+"""
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from exact_cover_solver.datastructures.compiled import unpack_problem_data
+from exact_cover_solver.datastructures.matrix_base import Matrix
+from exact_cover_solver.types import ProblemData, Solution, UniverseElement
+
+Subproblem = Tuple[Solution, ProblemData]
+Candidates = Dict[UniverseElement, Solution]
+
+
+def split_problem(problem_data: ProblemData, depth: int) -> List[Subproblem]:
+    """Expand search tree of given problem to given depth.
+
+    Branches that end to a solution or to a dead end before reaching the depth are
+    returned as they are: solved branch has an empty universe and dead end has a
+    column without candidate rows.
+
+    Args:
+        problem_data: Data needed to create an exact cover problem matrix.
+        depth: How many levels of the search tree to expand.
+
+    Returns:
+        List of subproblems in the same order the search would visit them.
+    """
+    subproblems: List[Subproblem] = [([], problem_data)]
+    for _ in range(depth):
+        expanded: List[Subproblem] = []
+        for prefix, data in subproblems:
+            universe, subset_collection, secondary_universe = unpack_problem_data(data)
+            candidates: Candidates = {element: [] for element in universe}
+            for subset_id, subset in subset_collection.items():
+                for element in subset:
+                    if element in candidates:
+                        candidates[element].append(subset_id)
+            if not universe or not all(candidates.values()):
+                expanded.append((prefix, data))
+                continue
+            column = min(universe, key=lambda element: len(candidates[element]))
+            for subset_id in candidates[column]:
+                covered = set(subset_collection[subset_id])
+                reduced_universe = [
+                    element for element in universe if element not in covered
+                ]
+                reduced_collection = {
+                    other_id: subset
+                    for other_id, subset in subset_collection.items()
+                    if covered.isdisjoint(subset)
+                }
+                reduced_data: ProblemData = (reduced_universe, reduced_collection)
+                if secondary_universe:
+                    reduced_secondary = [
+                        element
+                        for element in secondary_universe
+                        if element not in covered
+                    ]
+                    reduced_data = (
+                        reduced_universe,
+                        reduced_collection,
+                        reduced_secondary,
+                    )
+                expanded.append(([*prefix, subset_id], reduced_data))
+        subproblems = expanded
+    return subproblems
+
+
+def solve_subproblem(
+    algo_class: Callable[[], Any], matrix_class: Type[Matrix], subproblem: Subproblem
+) -> List[Solution]:
+    """Solve subproblem serially and prepend its prefix to solutions.
+
+    Module level function, so it can be sent to worker processes.
+
+    Args:
+        algo_class: Algorithm X implementation or factory creating one.
+        matrix_class: Matrix implementation algorithm consumes.
+        subproblem: Prefix and problem data of the subproblem.
+
+    Returns:
+        List of solutions to the original problem starting with the prefix.
+    """
+    prefix, data = subproblem
+    universe, subset_collection, _ = unpack_problem_data(data)
+    if not universe:
+        return [prefix]
+    if not subset_collection:
+        return []
+    solutions = algo_class().solve(matrix_class(data, trusted=True))
+    return [[*prefix, *solution] for solution in solutions]
+
+
+def count_subproblem(
+    algo_class: Callable[[], Any], matrix_class: Type[Matrix], subproblem: Subproblem
+) -> int:
+    """Count solutions of subproblem serially.
+
+    Module level function, so it can be sent to worker processes.
+
+    Args:
+        algo_class: Algorithm X implementation or factory creating one.
+        matrix_class: Matrix implementation algorithm consumes.
+        subproblem: Prefix and problem data of the subproblem.
+
+    Returns:
+        Number of solutions to the original problem starting with the prefix.
+    """
+    _, data = subproblem
+    universe, subset_collection, _ = unpack_problem_data(data)
+    if not universe:
+        return 1
+    if not subset_collection:
+        return 0
+    count: int = algo_class().count(matrix_class(data, trusted=True))
+    return count
@@ -0,0 +1,95 @@
+"""Statistics collected from instrumented searches.
+
+Instrumented search is a separate copy of the search loop, so searches without
+instrumentation don't pay anything for it.
+"""
+from typing import Dict, List
+
+
+class SolveStats:
+    """Statistics about one solve.
+
+    Attributes:
+        nodes_per_depth: Number of search tree nodes visited on each depth, root
+            being on depth 0.
+        choices_per_depth: Number of nodes on each depth that chose a column to
+            branch on, i.e. nodes that weren't solutions.
+        rows_per_depth: Sum of candidate rows of columns chosen on each depth.
+        updates: Number of link updates, i.e. detach and attach calls in dancing
+            links or set and dictionary removals and additions in dictionary based
+            search.
+        solutions: Number of solutions found.
+        phase_times: Seconds spent in each phase of solving, keyed by phase name.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.nodes_per_depth: List[int] = []
+        self.choices_per_depth: List[int] = []
+        self.rows_per_depth: List[int] = []
+        self.updates = 0
+        self.solutions = 0
+        self.phase_times: Dict[str, float] = {}
+
+    @property
+    def nodes(self) -> int:
+        """Get total number of search tree nodes visited.
+
+        Returns:
+            Number of nodes.
+        """
+        return sum(self.nodes_per_depth)
+
+    @property
+    def branching_factors(self) -> List[float]:
+        """Get average number of candidate rows of chosen columns on each depth.
+
+        Returns:
+            Average branching factor for each depth, 0 for depths without choices.
+        """
+        return [
+            rows / choices if choices else 0.0
+            for rows, choices in zip(self.rows_per_depth, self.choices_per_depth)
+        ]
+
+    def visit(self, depth: int) -> None:
+        """Count node visited on given depth.
+
+        Args:
+            depth: Depth of the node, i.e. number of rows picked before it.
+        """
+        if depth == len(self.nodes_per_depth):
+            self.nodes_per_depth.append(0)
+            self.choices_per_depth.append(0)
+            self.rows_per_depth.append(0)
+        self.nodes_per_depth[depth] += 1
+
+    def choose(self, depth: int, rows: int) -> None:
+        """Count column chosen on given depth.
+
+        Args:
+            depth: Depth of the node choosing the column.
+            rows: Number of candidate rows in the column.
+        """
+        self.choices_per_depth[depth] += 1
+        self.rows_per_depth[depth] += rows
+
+    def merge(self, other: "SolveStats") -> None:
+        """Add counters and phase times of another solve to these statistics.
+
+        Args:
+            other: Statistics of a solve of another part of the same problem.
+        """
+        missing = len(other.nodes_per_depth) - len(self.nodes_per_depth)
+        for counts, other_counts in [
+            (self.nodes_per_depth, other.nodes_per_depth),
+            (self.choices_per_depth, other.choices_per_depth),
+            (self.rows_per_depth, other.rows_per_depth),
+        ]:
+            counts.extend([0] * missing)
+            for depth, count in enumerate(other_counts):
+                counts[depth] += count
+        self.updates += other.updates
+        self.solutions += other.solutions
+        for phase, seconds in other.phase_times.items():
+            self.phase_times[phase] = self.phase_times.get(phase, 0.0) + seconds
@@ -0,0 +1,470 @@
+"""Column selection strategies for dancing links and dictionary based algorithm X.
+
+On each level of the search, algorithm X picks one uncovered primary column and
+branches on its rows. All strategies here pick a column with minimum remaining values
+(MRV), i.e. fewest candidate rows, since it minimizes the branching factor. They
+differ in how much of the header list they scan and how they break ties:
+- MRV: scan all columns, pick the first one with fewest rows.
+- EarlyExitMRV: stop scanning at the first column with at most one row, since only
+  a column without rows could beat it and that would just end the branch.
+- DegreeMRV: break ties by picking the column sharing rows with most other columns,
+  which tends to shrink the rest of the matrix the most.
+- RandomMRV: break ties randomly, useful for restarts and estimating tree size.
+- BucketMRV: take the column from size buckets of the matrix without scanning, if
+  matrix was created with them.
+
+Strategies work on both DLXMatrix header lists and DictMatrix column dictionaries.
+"""
+from abc import ABC, abstractmethod
+from random import Random
+from typing import cast, Dict, FrozenSet, Hashable, Optional, Set, Type, Union
+
+from exact_cover_solver.datastructures import (
+    BucketColumnDict,
+    ColumnDict,
+    ColumnObject,
+    ColumnValue,
+    DataObject,
+    RootObject,
+)
+from exact_cover_solver.types import SubsetCollection, UniverseElement
+
+Secondary = FrozenSet[UniverseElement]
+
+
+class ColumnSelectionStrategy(ABC):
+    """Base class for strategies choosing which column to branch on.
+
+    Attributes:
+        uses_size_buckets: Whether strategy needs matrices created with size
+            buckets to avoid scanning the columns.
+    """
+
+    uses_size_buckets = False
+
+    @abstractmethod
+    def choose_column_object(self, root: RootObject) -> ColumnObject:
+        """Choose column object from header list of dancing links matrix.
+
+        Args:
+            root: Matrix representation implemented as circular doubly linked lists.
+
+        Returns:
+            Chosen column object.
+
+        Raises:
+            NotImplementedError: abstract method was directly called.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def choose_column(
+        self,
+        column_dict: "ColumnDict[UniverseElement]",
+        set_collection: SubsetCollection,
+        secondary: Secondary = frozenset(),
+    ) -> UniverseElement:
+        """Choose primary column from column dictionary.
+
+        Args:
+            column_dict: Dictionary of each column on current iteration.
+            set_collection: Original set collection used to create the matrix.
+            secondary: Elements whose columns are secondary.
+
+        Returns:
+            Key of chosen column.
+
+        Raises:
+            NotImplementedError: abstract method was directly called.
+        """
+        raise NotImplementedError
+
+
+class MRV(ColumnSelectionStrategy):
+    """Pick the first column with fewest rows."""
+
+    def choose_column_object(self, root: RootObject) -> ColumnObject:
+        """Choose first column object with smallest size.
+
+        Args:
+            root: Matrix representation implemented as circular doubly linked lists.
+
+        Returns:
+            Column object with smallest size.
+
+        Raises:
+            ValueError: if not possible to find any column from given root
+        """
+        current_column: Union[ColumnObject, RootObject] = root.right
+        if isinstance(current_column, RootObject):
+            raise ValueError("No columns reachable from given root")
+        optimal_column: ColumnObject = current_column
+        size = current_column.size
+        while not isinstance(current_column, RootObject):
+            if current_column.size < size:
+                optimal_column, size = current_column, current_column.size
+            current_column = current_column.right
+        return optimal_column
+
+    def choose_column(
+        self,
+        column_dict: "ColumnDict[UniverseElement]",
+        set_collection: SubsetCollection,
+        secondary: Secondary = frozenset(),
+    ) -> UniverseElement:
+        """Choose first primary column with smallest size.
+
+        Args:
+            column_dict: Dictionary of each column on current iteration.
+            set_collection: Original set collection used to create the matrix.
+            secondary: Elements whose columns are secondary.
+
+        Returns:
+            Key of column with smallest size.
+
+        Raises:
+            ValueError: if not possible to find any primary column from given dict.
+        """
+        key: Optional[UniverseElement] = None
+        size = 0
+        for element, subset_ids in column_dict.items():
+            if element in secondary:
+                continue
+            if key is None or len(subset_ids) < size:
+                key, size = element, len(subset_ids)
+        if key is not None:
+            return key
+        raise ValueError(
+            "Not possible to choose optimal column from dict without primary columns."
+        )
+
+
+class EarlyExitMRV(ColumnSelectionStrategy):
+    """Pick the first column with fewest rows, stop at first column with at most one.
+
+    Attributes:
+        limit: Size at or below which scan stops.
+    """
+
+    limit = 1
+
+    def choose_column_object(self, root: RootObject) -> ColumnObject:
+        """Choose first column object with smallest size, stopping early.
+
+        Args:
+            root: Matrix representation implemented as circular doubly linked lists.
+
+        Returns:
+            Column object with smallest size among scanned ones.
+
+        Raises:
+            ValueError: if not possible to find any column from given root
+        """
+        current_column: Union[ColumnObject, RootObject] = root.right
+        if isinstance(current_column, RootObject):
+            raise ValueError("No columns reachable from given root")
+        optimal_column: ColumnObject = current_column
+        size = current_column.size
+        while size > self.limit and not isinstance(current_column, RootObject):
+            if current_column.size < size:
+                optimal_column, size = current_column, current_column.size
+            current_column = current_column.right
+        return optimal_column
+
+    def choose_column(
+        self,
+        column_dict: "ColumnDict[UniverseElement]",
+        set_collection: SubsetCollection,
+        secondary: Secondary = frozenset(),
+    ) -> UniverseElement:
+        """Choose first primary column with smallest size, stopping early.
+
+        Args:
+            column_dict: Dictionary of each column on current iteration.
+            set_collection: Original set collection used to create the matrix.
+            secondary: Elements whose columns are secondary.
+
+        Returns:
+            Key of column with smallest size among scanned ones.
+
+        Raises:
+            ValueError: if not possible to find any primary column from given dict.
+        """
+        key: Optional[UniverseElement] = None
+        size = 0
+        for element, subset_ids in column_dict.items():
+            if element in secondary:
+                continue
+            if key is None or len(subset_ids) < size:
+                key, size = element, len(subset_ids)
+                if size <= self.limit:
+                    break
+        if key is not None:
+            return key
+        raise ValueError(
+            "Not possible to choose optimal column from dict without primary columns."
+        )
+
+
+class DegreeMRV(ColumnSelectionStrategy):
+    """Pick column with fewest rows, breaking ties by the degree of the column.
+
+    Degree of a column is the number of other live columns its rows have elements
+    in. It's only calculated for tied columns.
+    """
+
+    def choose_column_object(self, root: RootObject) -> ColumnObject:
+        """Choose column object with smallest size and highest degree.
+
+        Args:
+            root: Matrix representation implemented as circular doubly linked lists.
+
+        Returns:
+            Column object with smallest size, first one of highest degree on ties.
+
+        Raises:
+            ValueError: if not possible to find any column from given root
+        """
+        current_column: Union[ColumnObject, RootObject] = root.right
+        if isinstance(current_column, RootObject):
+            raise ValueError("No columns reachable from given root")
+        optimal_column: ColumnObject = current_column
+        size = current_column.size
+        degree: Optional[int] = None
+        current_column = current_column.right
+        while not isinstance(current_column, RootObject):
+            if current_column.size < size:
+                optimal_column, size = current_column, current_column.size
+                degree = None
+            elif current_column.size == size:
+                if degree is None:
+                    degree = self._column_object_degree(optimal_column)
+                current_degree = self._column_object_degree(current_column)
+                if current_degree > degree:
+                    optimal_column, degree = current_column, current_degree
+            current_column = current_column.right
+        return optimal_column
+
+    def choose_column(
+        self,
+        column_dict: "ColumnDict[UniverseElement]",
+        set_collection: SubsetCollection,
+        secondary: Secondary = frozenset(),
+    ) -> UniverseElement:
+        """Choose primary column with smallest size and highest degree.
+
+        Args:
+            column_dict: Dictionary of each column on current iteration.
+            set_collection: Original set collection used to create the matrix.
+            secondary: Elements whose columns are secondary.
+
+        Returns:
+            Key of column with smallest size, first one of highest degree on ties.
+
+        Raises:
+            ValueError: if not possible to find any primary column from given dict.
+        """
+        key: Optional[UniverseElement] = None
+        size = 0
+        degree: Optional[int] = None
+        for element, subset_ids in column_dict.items():
+            if element in secondary:
+                continue
+            if key is None or len(subset_ids) < size:
+                key, size = element, len(subset_ids)
+                degree = None
+            elif len(subset_ids) == size:
+                if degree is None:
+                    degree = self._column_degree(column_dict[key], set_collection)
+                current_degree = self._column_degree(subset_ids, set_collection)
+                if current_degree > degree:
+                    key, degree = element, current_degree
+        if key is not None:
+            return key
+        raise ValueError(
+            "Not possible to choose optimal column from dict without primary columns."
+        )
+
+    @staticmethod
+    def _column_object_degree(column: ColumnObject) -> int:
+        """Count other columns sharing a row with given column.
+
+        Args:
+            column: Linked list column node.
+
+        Returns:
+            Degree of the column.
+        """
+        neighbours: Set[ColumnObject] = set()
+        row = column.down
+        while isinstance(row, DataObject):
+            node = row.right
+            while node is not row:
+                neighbours.add(node.column)
+                node = node.right
+            row = row.down
+        return len(neighbours)
+
+    @staticmethod
+    def _column_degree(
+        subset_ids: ColumnValue, set_collection: SubsetCollection
+    ) -> int:
+        """Count other columns sharing a row with column of given rows.
+
+        Rows still in the column dictionary only have elements of live columns.
+
+        Args:
+            subset_ids: Rows of the column.
+            set_collection: Original set collection used to create the matrix.
+
+        Returns:
+            Degree of the column.
+        """
+        neighbours: Set[Hashable] = set()
+        for subset_id in subset_ids:
+            neighbours.update(set_collection[subset_id])
+        return max(len(neighbours) - 1, 0)
+
+
+class RandomMRV(ColumnSelectionStrategy):
+    """Pick column with fewest rows, breaking ties uniformly at random."""
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """Initialize random number generator of the strategy.
+
+        Args:
+            seed: Seed for random number generator, same seed gives same choices.
+        """
+        self._random = Random(seed)
+
+    def choose_column_object(self, root: RootObject) -> ColumnObject:
+        """Choose random column object among the ones with smallest size.
+
+        Args:
+            root: Matrix representation implemented as circular doubly linked lists.
+
+        Returns:
+            Column object with smallest size.
+
+        Raises:
+            ValueError: if not possible to find any column from given root
+        """
+        current_column: Union[ColumnObject, RootObject] = root.right
+        if isinstance(current_column, RootObject):
+            raise ValueError("No columns reachable from given root")
+        optimal_column: ColumnObject = current_column
+        size = current_column.size
+        ties = 1
+        current_column = current_column.right
+        while not isinstance(current_column, RootObject):
+            if current_column.size < size:
+                optimal_column, size = current_column, current_column.size
+                ties = 1
+            elif current_column.size == size:
+                ties += 1
+                if self._random.randrange(ties) == 0:
+                    optimal_column = current_column
+            current_column = current_column.right
+        return optimal_column
+
+    def choose_column(
+        self,
+        column_dict: "ColumnDict[UniverseElement]",
+        set_collection: SubsetCollection,
+        secondary: Secondary = frozenset(),
+    ) -> UniverseElement:
+        """Choose random primary column among the ones with smallest size.
+
+        Args:
+            column_dict: Dictionary of each column on current iteration.
+            set_collection: Original set collection used to create the matrix.
+            secondary: Elements whose columns are secondary.
+
+        Returns:
+            Key of column with smallest size.
+
+        Raises:
+            ValueError: if not possible to find any primary column from given dict.
+        """
+        key: Optional[UniverseElement] = None
+        size = 0
+        ties = 0
+        for element, subset_ids in column_dict.items():
+            if element in secondary:
+                continue
+            if key is None or len(subset_ids) < size:
+                key, size = element, len(subset_ids)
+                ties = 1
+            elif len(subset_ids) == size:
+                ties += 1
+                if self._random.randrange(ties) == 0:
+                    key = element
+        if key is not None:
+            return key
+        raise ValueError(
+            "Not possible to choose optimal column from dict without primary columns."
+        )
+
+
+class BucketMRV(ColumnSelectionStrategy):
+    """Pick column with fewest rows from size buckets of the matrix.
+
+    Matrices created with size buckets keep live primary columns in buckets by
+    their size, so choosing doesn't depend on the number of columns. On ties,
+    column that has been longest in its bucket is picked. Matrices without buckets
+    are scanned like with MRV.
+    """
+
+    uses_size_buckets = True
+
+    def __init__(self) -> None:
+        """Initialize strategy used for matrices without buckets."""
+        self._fallback = MRV()
+
+    def choose_column_object(self, root: RootObject) -> ColumnObject:
+        """Choose column object with smallest size from size buckets.
+
+        Args:
+            root: Matrix representation implemented as circular doubly linked lists.
+
+        Returns:
+            Column object with smallest size.
+
+        Raises:
+            ValueError: if not possible to find any column from given root
+        """
+        if isinstance(root, RootObject) and root.buckets is not None:
+            return root.buckets.first()
+        return self._fallback.choose_column_object(root)
+
+    def choose_column(
+        self,
+        column_dict: "ColumnDict[UniverseElement]",
+        set_collection: SubsetCollection,
+        secondary: Secondary = frozenset(),
+    ) -> UniverseElement:
+        """Choose primary column with smallest size from size buckets.
+
+        Args:
+            column_dict: Dictionary of each column on current iteration.
+            set_collection: Original set collection used to create the matrix.
+            secondary: Elements whose columns are secondary.
+
+        Returns:
+            Key of column with smallest size.
+
+        Raises:
+            ValueError: if not possible to find any primary column from given dict.
+        """
+        if isinstance(column_dict, BucketColumnDict):
+            return cast(UniverseElement, column_dict.buckets.first().element)
+        return self._fallback.choose_column(column_dict, set_collection, secondary)
+
+
+STRATEGIES: Dict[str, Type[ColumnSelectionStrategy]] = {
+    "MRV": MRV,
+    "EarlyExitMRV": EarlyExitMRV,
+    "DegreeMRV": DegreeMRV,
+    "RandomMRV": RandomMRV,
+    "BucketMRV": BucketMRV,
+}
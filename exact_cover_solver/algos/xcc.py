@@ -0,0 +1,234 @@
+"""Dancing links based implementation for exact cover with colors (XCC).
+
+Follows Knuth's algorithm C. Primary columns are covered like in algorithm X, but
+secondary elements of a picked row are committed: uncolored ones are covered, colored
+ones are purified, which hides only the rows giving the element another color. Rows
+agreeing with the color are marked purified and left in place, so they can still be
+picked later.
+"""
+
+from typing import List, Optional
+
+from .algox_base import AlgorithmX
+from .limits import LimitTracker, SearchLimits, SearchResult
+from .strategies import ColumnSelectionStrategy, MRV
+from exact_cover_solver.types import Solution
+from exact_cover_solver.datastructures import (
+    ColoredDataObject,
+    ColumnObject,
+    RootObject,
+    XCCMatrix,
+)
+
+
+class XCC(AlgorithmX[XCCMatrix]):
+    """Dancing links based implementation for exact cover with colors.
+
+    Attributes:
+        _tracker: Tracker for limits of the current search, None if search is
+            exhaustive.
+    """
+
+    def __init__(self, strategy: Optional[ColumnSelectionStrategy] = None) -> None:
+        """Initialize object by calling parent constructor.
+
+        Args:
+            strategy: How to choose primary column to branch on, first column with
+                fewest rows by default.
+        """
+        super().__init__()
+        self._strategy = strategy or MRV()
+        self._tracker: Optional[LimitTracker] = None
+
+    def solve(
+        self, matrix: XCCMatrix, limits: Optional[SearchLimits] = None
+    ) -> List[Solution]:
+        """Solve which rows cover the given matrix.
+
+        Clears solutions bookkeeping from previous runs, then calls recursive search.
+        Solutions of merged rows are expanded after search, so solution limit is
+        applied to the expanded solutions there.
+
+        Args:
+            matrix: Matrix with colored secondary columns.
+            limits: Limits for stopping search early, search is exhaustive if None.
+
+        Returns:
+            List of solutions. Solution is a list identifiers of rows that were
+            picked to solution. With limits, a SearchResult telling whether the
+            search was complete.
+        """
+        self._solutions.clear()
+        if limits is None:
+            self._search(matrix.root, [])
+            self._expand_solutions(matrix)
+            return self._solutions
+        tracker = self._tracker = self._create_tracker(limits)
+        try:
+            self._search(matrix.root, [])
+        finally:
+            self._tracker = None
+        self._expand_solutions(matrix)
+        complete = not tracker.truncated
+        if limits.max_solutions is not None:
+            complete = complete and len(self._solutions) <= limits.max_solutions
+            del self._solutions[limits.max_solutions :]
+        return SearchResult(self._solutions, complete=complete)
+
+    def _search(self, root: RootObject, partial: Solution) -> None:
+        """Perform algorithm C recursively and collect solutions.
+
+        When a limit is hit, each level still uncommits its row and uncovers its
+        column while returning, so the matrix is restored.
+
+        Args:
+            root: Matrix representation implemented as circular doubly linked lists.
+            partial: List including rows collected this far in recursion.
+        """
+        tracker = self._tracker
+        if tracker is not None and not tracker.visit():
+            return
+        if root.right is root:
+            self._solutions.append(partial[:])
+            if tracker is not None:
+                tracker.add_solution()
+            return
+
+        column = self._strategy.choose_column_object(root)
+
+        if column.size == 0:
+            return
+
+        self._cover(column)
+
+        row = column.down
+        while isinstance(row, ColoredDataObject):
+            partial.append(row.id)
+            node = row.right
+            while node is not row:
+                self._commit(node)
+                node = node.right
+            self._search(root, partial)
+            node = row.left
+            while node is not row:
+                self._uncommit(node)
+                node = node.left
+            partial.pop()
+            if tracker is not None and tracker.truncated:
+                break
+            row = row.down
+        self._uncover(column)
+
+    @classmethod
+    def _commit(cls, node: ColoredDataObject) -> None:
+        """Cover or purify column of given node, depending on its color.
+
+        Nodes already purified by an earlier row with same color are skipped.
+
+        Args:
+            node: Data object of the picked row.
+        """
+        if node.color is None:
+            cls._cover(node.column)
+        elif not node.purified:
+            cls._purify(node)
+
+    @classmethod
+    def _uncommit(cls, node: ColoredDataObject) -> None:
+        """Undo committing given node.
+
+        Args:
+            node: Data object of the picked row.
+        """
+        if node.color is None:
+            cls._uncover(node.column)
+        elif not node.purified:
+            cls._unpurify(node)
+
+    @classmethod
+    def _cover(cls, column: ColumnObject) -> None:
+        """Cover given column.
+
+        Remove column from the header list and hide all rows in column.
+
+        Args:
+            column: Linked list column node.
+        """
+        column.detach()
+        row = column.down
+        while isinstance(row, ColoredDataObject):
+            cls._hide(row)
+            row = row.down
+
+    @classmethod
+    def _uncover(cls, column: ColumnObject) -> None:
+        """Uncover given column in reversed order of covering.
+
+        Args:
+            column: Linked list column node.
+        """
+        row = column.up
+        while isinstance(row, ColoredDataObject):
+            cls._unhide(row)
+            row = row.up
+        column.attach()
+
+    @classmethod
+    def _purify(cls, node: ColoredDataObject) -> None:
+        """Hide rows giving column of node another color, mark the rest purified.
+
+        Node itself is not marked, so uncommitting it knows to unpurify.
+
+        Args:
+            node: Colored data object of the picked row.
+        """
+        row = node.column.down
+        while isinstance(row, ColoredDataObject):
+            if row.color != node.color:
+                cls._hide(row)
+            elif row is not node:
+                row.purified = True
+            row = row.down
+
+    @classmethod
+    def _unpurify(cls, node: ColoredDataObject) -> None:
+        """Undo purifying in reversed order.
+
+        Args:
+            node: Colored data object of the picked row.
+        """
+        row = node.column.up
+        while isinstance(row, ColoredDataObject):
+            if row.color != node.color:
+                cls._unhide(row)
+            elif row is not node:
+                row.purified = False
+            row = row.up
+
+    @staticmethod
+    def _hide(row: ColoredDataObject) -> None:
+        """Detach other nodes of row from their columns.
+
+        Purified nodes are left in place, their columns are not searched anymore.
+
+        Args:
+            row: Data object whose row is hidden.
+        """
+        node = row.right
+        while node is not row:
+            if not node.purified:
+                node.detach()
+            node = node.right
+
+    @staticmethod
+    def _unhide(row: ColoredDataObject) -> None:
+        """Attach other nodes of row back in reversed order.
+
+        Args:
+            row: Data object whose row is restored.
+        """
+        node = row.left
+        while node is not row:
+            if not node.purified:
+                node.attach()
+            node = node.left
@@ -0,0 +1,345 @@
+"""Command line interface for solving problems in shell pipelines.
+
+Generic problems are read as JSON objects with keys "universe", "subsets" and
+optionally "secondary_universe", e.g.
+{"universe": [1, 2], "subsets": {"a": [1], "b": [2], "c": [1, 2]}}. Input can have
+any number of problems one after another, e.g. one per line, and each problem is
+solved as soon as its last line is read. JSON arrays inside elements are read as
+tuples. Problem files saved with save_problem are read as well.
+Sudoku boards are read the same way as JSON arrays of rows, empty cells being zero.
+
+Output has one JSON object per line, written as soon as a solution is found, so
+solutions are never collected to memory. Each line tells the index of the problem
+in the input and either a solution or the number of solutions.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from exact_cover_solver.datastructures.problemfile import load_problem, MAGIC
+from exact_cover_solver.services import Solver
+from exact_cover_solver.services.solver import ALGORITHMS
+from exact_cover_solver.types import ProblemData
+
+COMMANDS = ["generic", "sudoku", "pentomino"]
+
+_WHITESPACE = re.compile(r"\s*")
+_STRUCTURE = re.compile(r'[\[\]{}"]')
+_STRING_REST = re.compile(r'(?:[^"\\\n]|\\.)*"')
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Solve problems given on the command line and write solutions to stdout.
+
+    Generic problems are solved if no command is given.
+
+    Args:
+        argv: Arguments without the program name, sys.argv[1:] if None.
+
+    Returns:
+        Exit status, 1 if some problem was invalid or some file couldn't be read.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in [*COMMANDS, "-h", "--help"]:
+        argv = ["generic", *argv]
+    arguments = _create_parser().parse_args(argv)
+    solver = Solver(workers=arguments.workers)
+    iter_solutions = getattr(solver, f"iter_{arguments.command}_solutions")
+    count_solutions = getattr(solver, f"count_{arguments.command}_solutions")
+    try:
+        for index, problem in enumerate(_read_problems(arguments)):
+            if arguments.count:
+                if arguments.max_solutions is None:
+                    count = count_solutions(arguments.algorithm, *problem)
+                else:
+                    solutions = iter_solutions(arguments.algorithm, *problem)
+                    count = sum(1 for _ in islice(solutions, arguments.max_solutions))
+                _write_line({"problem": index, "count": count})
+                continue
+            solutions = iter_solutions(arguments.algorithm, *problem)
+            for solution in islice(solutions, arguments.max_solutions):
+                _write_line({"problem": index, "solution": solution})
+    except BrokenPipeError:
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    except (ValueError, OSError) as error:
+        print(f"exact-cover-solver: error: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    """Create parser for command line arguments.
+
+    Returns:
+        Parser with a subparser for each command.
+    """
+    options = argparse.ArgumentParser(add_help=False)
+    options.add_argument(
+        "-a",
+        "--algorithm",
+        choices=list(ALGORITHMS),
+        default="DLX",
+        help="algorithm to solve problems with (default: %(default)s)",
+    )
+    options.add_argument(
+        "-w",
+        "--workers",
+        type=_positive_integer,
+        default=1,
+        help="number of worker processes to split search to (default: %(default)s)",
+    )
+    options.add_argument(
+        "-n",
+        "--max-solutions",
+        type=_positive_integer,
+        help="stop after this many solutions of each problem",
+    )
+    options.add_argument(
+        "-c",
+        "--count",
+        action="store_true",
+        help="write only the number of solutions of each problem",
+    )
+    parser = argparse.ArgumentParser(
+        prog="exact-cover-solver",
+        description="Solve exact cover problems, writing one JSON object per line.",
+    )
+    commands = parser.add_subparsers(dest="command")
+    generic = commands.add_parser(
+        "generic",
+        parents=[options],
+        help="solve generic problems, the default command",
+    )
+    generic.add_argument(
+        "files",
+        nargs="*",
+        default=["-"],
+        help="JSON or problem files to read problems from, - for stdin (default)",
+    )
+    sudoku = commands.add_parser("sudoku", parents=[options], help="solve sudokus")
+    sudoku.add_argument(
+        "files",
+        nargs="*",
+        default=["-"],
+        help="JSON files to read sudoku boards from, - for stdin (default)",
+    )
+    pentomino = commands.add_parser(
+        "pentomino", parents=[options], help="fill a board with pentominoes"
+    )
+    pentomino.add_argument("height", type=_positive_integer, help="board height")
+    pentomino.add_argument("width", type=_positive_integer, help="board width")
+    return parser
+
+
+def _positive_integer(value: str) -> int:
+    """Convert argument to a positive integer.
+
+    Args:
+        value: Argument given on the command line.
+
+    Returns:
+        Integer value of the argument.
+
+    Raises:
+        ArgumentTypeError: if argument is not a positive integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return number
+
+
+def _read_problems(arguments: argparse.Namespace) -> Iterator[Tuple[Any, ...]]:
+    """Read problems lazily for the chosen command.
+
+    Input is read line by line and each problem is yielded as soon as its last
+    line is read, so problems are solved while the rest of the input is still
+    coming.
+
+    Args:
+        arguments: Parsed command line arguments.
+
+    Yields:
+        Arguments for the solver methods of the command after the algorithm.
+
+    Raises:
+        ValueError: if some input is not valid JSON or generic problem has wrong
+            shape.
+        OSError: if some file can't be read.
+    """
+    if arguments.command == "pentomino":
+        yield arguments.height, arguments.width
+        return
+    for path in arguments.files:
+        with contextlib.ExitStack() as stack:
+            if path == "-":
+                lines: Iterable[str] = sys.stdin
+            else:
+                file = stack.enter_context(open(path, "rb"))
+                if file.read(len(MAGIC)) == MAGIC and arguments.command == "generic":
+                    yield (load_problem(path),)
+                    continue
+                file.seek(0)
+                lines = io.TextIOWrapper(file, encoding="utf-8")
+            for value in _read_json_values(lines):
+                if arguments.command == "generic":
+                    yield (_to_problem_data(value),)
+                else:
+                    yield (value,)
+
+
+def _read_json_values(lines: Iterable[str]) -> Iterator[Any]:
+    """Decode JSON values following each other in lines of text.
+
+    Brackets outside strings are counted while reading, and lines are decoded
+    once every array and object opened in them is closed. Each character is
+    scanned and decoded only once, however many lines a value has.
+
+    Args:
+        lines: Lines having values separated by optional whitespace.
+
+    Yields:
+        Each decoded value as soon as the line it ends on is read.
+
+    Raises:
+        ValueError: if text is not valid JSON.
+    """
+    buffer: List[str] = []
+    depth = 0
+    for line in lines:
+        buffer.append(line)
+        depth = _nesting_depth(line, depth)
+        if depth <= 0:
+            yield from _decode_json_values("".join(buffer))
+            buffer = []
+            depth = 0
+    yield from _decode_json_values("".join(buffer))
+
+
+def _nesting_depth(line: str, depth: int) -> int:
+    """Count arrays and objects left open after a line.
+
+    Args:
+        line: Line of JSON text.
+        depth: Number of arrays and objects open before the line.
+
+    Returns:
+        Number of arrays and objects open after the line, zero if line has a
+        string that doesn't end, which can't be valid JSON.
+    """
+    position = 0
+    while True:
+        match = _STRUCTURE.search(line, position)
+        if match is None:
+            return depth
+        if match.group() == '"':
+            string_end = _STRING_REST.match(line, match.end())
+            if string_end is None:
+                return 0
+            position = string_end.end()
+            continue
+        depth += 1 if match.group() in "[{" else -1
+        position = match.end()
+
+
+def _decode_json_values(text: str) -> Iterator[Any]:
+    """Decode JSON values following each other in text.
+
+    Args:
+        text: Text having values separated by optional whitespace.
+
+    Yields:
+        Each decoded value.
+
+    Raises:
+        ValueError: if text is not valid JSON.
+    """
+    decoder = json.JSONDecoder()
+    position = _WHITESPACE.match(text).end()  # type: ignore
+    while position < len(text):
+        value, position = decoder.raw_decode(text, position)
+        position = _WHITESPACE.match(text, position).end()  # type: ignore
+        yield value
+
+
+def _to_problem_data(value: Any) -> ProblemData:
+    """Convert decoded JSON object to problem data.
+
+    Args:
+        value: Decoded JSON object.
+
+    Returns:
+        Data needed to create an exact cover problem matrix.
+
+    Raises:
+        ValueError: if object doesn't have universe and subsets, subsets is not an
+            object or universe, some subset or secondary universe is not an array.
+    """
+    if not isinstance(value, dict) or not {"universe", "subsets"} <= set(value):
+        raise ValueError(
+            "Generic problem should be a JSON object with universe and subsets."
+        )
+    if not isinstance(value["subsets"], dict):
+        raise ValueError("Subsets should be a JSON object of arrays.")
+    universe = _to_elements(value["universe"], "Universe")
+    subset_collection = {
+        subset_id: _to_elements(subset, f"Subset {subset_id}")
+        for subset_id, subset in value["subsets"].items()
+    }
+    if "secondary_universe" in value:
+        secondary_universe = _to_elements(
+            value["secondary_universe"], "Secondary universe"
+        )
+        return universe, subset_collection, secondary_universe
+    return universe, subset_collection
+
+
+def _to_elements(value: Any, name: str) -> List[Any]:
+    """Convert decoded JSON array to a list of elements.
+
+    Args:
+        value: Decoded JSON array.
+        name: What the array is, used in the error message.
+
+    Returns:
+        Elements with JSON arrays converted to tuples.
+
+    Raises:
+        ValueError: if value is not an array.
+    """
+    if not isinstance(value, list):
+        raise ValueError(f"{name} should be a JSON array.")
+    return [_to_tuples(element) for element in value]
+
+
+def _to_tuples(value: Any) -> Any:
+    """Convert JSON arrays in value to tuples, so they can be used as elements.
+
+    Args:
+        value: Decoded JSON value.
+
+    Returns:
+        Value with each list converted to a tuple.
+    """
+    if isinstance(value, list):
+        return tuple(_to_tuples(item) for item in value)
+    return value
+
+
+def _write_line(value: Any) -> None:
+    """Write value to stdout as one line of JSON right away.
+
+    Args:
+        value: Value to write.
+    """
+    sys.stdout.write(json.dumps(value, default=repr) + "\n")
+    sys.stdout.flush()
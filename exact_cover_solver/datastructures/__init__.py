@@ -3,7 +3,16 @@
 Defines imports for things that can be imported directly from this package.
 """
 
+from .compiled import CompiledProblem, compile_problem
+from .problemfile import load_problem, save_problem
+from .dlxformat import read_dlx, write_dlx
 from .dlxmatrix import DLXMatrix, RootObject, ColumnObject, DataObject
-from .dictmatrix import DictMatrix, ColumnDict, ColumnValue
+from .dlxdataobjects import ColoredDataObject
+from .xccmatrix import XCCMatrix
+from .dictmatrix import DictMatrix, BucketColumnDict, ColumnDict, ColumnValue
+from .arraymatrix import ArrayMatrix
+from .bitmatrix import BitMatrix
+from .lrucache import LRUCache
+from .sizebuckets import SizeBuckets
 from .pentomino import Pentominoes
 from .matrix_base import GenericMatrix
@@ -0,0 +1,104 @@
+"""Exact cover matrix implementation with dancing links stored in integer arrays.
+
+Instead of one Python object per node, the whole linked structure lives in parallel
+integer arrays, like in Knuth's original implementation. Node 0 is the root, nodes
+1..n are column headers and the rest are data nodes. Headers of secondary columns
+come after the primary ones and are only linked to themselves. For node x:
+- left[x], right[x], up[x] and down[x] are indices of neighbouring nodes
+- column[x] is index of the column header node belongs to
+- size[c] is number of data nodes in column c (only used for header nodes)
+- row[x] is index of the subset data node belongs to (-1 for headers)
+"""
+from array import array
+from typing import List
+
+from .compiled import Problem
+from .matrix_base import Matrix
+from exact_cover_solver.types import SubsetId, Universe
+
+ROOT = 0
+
+RowIds = List[SubsetId]
+
+
+class ArrayMatrix(Matrix):
+    """Exact cover matrix implementation with dancing links in integer arrays."""
+
+    def __init__(self, problem: Problem, trusted: bool = False) -> None:
+        """Initialize empty link arrays and id lookups.
+
+        Args:
+            problem: Data needed to create matrix, or problem compiled from it.
+            trusted: Skip validation of data known to be valid.
+        """
+        self.left = array("i")
+        self.right = array("i")
+        self.up = array("i")
+        self.down = array("i")
+        self.column = array("i")
+        self.size = array("i")
+        self.row = array("i")
+        self.column_ids: Universe = []
+        self.row_ids: RowIds = []
+        super().__init__(problem, trusted)
+
+    def _create(self) -> None:
+        """Call creator methods for header and data nodes."""
+        self._create_header_nodes()
+        self._create_data_nodes()
+
+    def _create_header_nodes(self) -> None:
+        """Create root and column header nodes linked together to a circular row.
+
+        Header of each column is right after root at its column index. Secondary
+        column headers are left out from the row.
+        """
+        columns_amount = self._compiled.primary_amount
+        self.column_ids = list(self._compiled.column_ids)
+        headers = range(len(self.column_ids) + 1)
+        self.left.extend(
+            header - 1 if header <= columns_amount else header for header in headers
+        )
+        self.left[ROOT] = columns_amount
+        self.right.extend(
+            header + 1 if header < columns_amount else header for header in headers
+        )
+        self.right[columns_amount] = ROOT
+        self.up.extend(headers)
+        self.down.extend(headers)
+        self.column.extend(headers)
+        self.size.extend(0 for _ in headers)
+        self.row.extend(-1 for _ in headers)
+
+    def _create_data_nodes(self) -> None:
+        """Create data nodes for each subset.
+
+        Data nodes are appended to the bottom of their columns and linked together to
+        form a circular row.
+
+        Raises:
+            ValueError: if subset is empty.
+        """
+        compiled = self._compiled
+        for row_index, row in enumerate(self._merged_rows):
+            subset_id = compiled.row_ids[row]
+            columns = compiled.row(row)
+            if not columns:
+                raise ValueError(
+                    f"Cannot not link subset elements together for subset {subset_id}"
+                )
+            self.row_ids.append(subset_id)
+            first = len(self.column)
+            last = first + len(columns) - 1
+            for offset, column_index in enumerate(columns):
+                node = first + offset
+                column = column_index + 1
+                self.left.append(node - 1 if node != first else last)
+                self.right.append(node + 1 if node != last else first)
+                self.up.append(self.up[column])
+                self.down.append(column)
+                self.down[self.up[column]] = node
+                self.up[column] = node
+                self.column.append(column)
+                self.row.append(row_index)
+                self.size[column] += 1
@@ -0,0 +1,83 @@
+"""Exact cover matrix implementation with integer bitmasks.
+
+Columns and rows are numbered in the order they appear in the universe and in the
+subset collection. Every row is stored as a mask of the columns it covers, every
+column as a mask of the rows it appears in. Python ints have arbitrary precision,
+so masks work for any amount of rows and columns, but they are most efficient when
+there's at most few hundred columns. Secondary columns are numbered after the
+primary ones.
+"""
+from typing import List
+
+from .compiled import Problem
+from .matrix_base import Matrix
+from exact_cover_solver.types import SubsetId, Universe
+
+RowIds = List[SubsetId]
+
+
+class BitMatrix(Matrix):
+    """Exact cover matrix implementation with integer bitmasks.
+
+    Attributes:
+        row_masks: Mask of columns for each row.
+        column_masks: Mask of candidate rows for each column.
+        conflict_masks: Mask of rows sharing at least one column for each row,
+            including the row itself.
+        row_ids: Subset id for each row.
+        column_ids: Universe element for each column.
+    """
+
+    def __init__(self, problem: Problem, trusted: bool = False) -> None:
+        """Initialize empty masks and id lookups.
+
+        Args:
+            problem: Data needed to create matrix, or problem compiled from it.
+            trusted: Skip validation of data known to be valid.
+        """
+        self.row_masks: List[int] = []
+        self.column_masks: List[int] = []
+        self.conflict_masks: List[int] = []
+        self.row_ids: RowIds = []
+        self.column_ids: Universe = []
+        super().__init__(problem, trusted)
+
+    def _create(self) -> None:
+        """Create row and column masks, then conflict masks based on them."""
+        compiled = self._compiled
+        self.column_ids = list(compiled.column_ids)
+        self.column_masks = [0] * len(self.column_ids)
+        rows = [compiled.row(row) for row in self._merged_rows]
+        for row, columns in enumerate(rows):
+            self.row_ids.append(compiled.row_ids[self._merged_rows[row]])
+            row_mask = 0
+            for column in columns:
+                row_mask |= 1 << column
+                self.column_masks[column] |= 1 << row
+            self.row_masks.append(row_mask)
+
+        for columns in rows:
+            conflict_mask = 0
+            for column in columns:
+                conflict_mask |= self.column_masks[column]
+            self.conflict_masks.append(conflict_mask)
+
+    @property
+    def all_columns(self) -> int:
+        """Get mask with every primary column set.
+
+        Secondary columns are left out, since search doesn't need to cover them.
+
+        Returns:
+            Mask of all primary columns.
+        """
+        return (1 << self._compiled.primary_amount) - 1
+
+    @property
+    def all_rows(self) -> int:
+        """Get mask with every row set.
+
+        Returns:
+            Mask of all rows.
+        """
+        return (1 << len(self.row_ids)) - 1
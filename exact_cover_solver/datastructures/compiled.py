@@ -0,0 +1,250 @@
+"""Exact cover problem compiled to integers.
+
+Elements and subset ids can be any hashable objects, e.g. tuples or strings, and
+hashing them again for every matrix is slow. Compiled problem interns them to dense
+integers once: columns are numbered primary elements first and rows in the order of
+the subset collection. Rows are stored in compressed sparse row (CSR) form, columns
+of row r being indices[indptr[r]:indptr[r + 1]]. Lists of the original elements and
+subset ids decode the integers back.
+
+Matrices of every engine can be created from the same compiled problem, so problem
+solved repeatedly is only validated and interned once.
+"""
+from array import array
+from typing import Dict, Iterable, Optional, Sequence, Tuple, Union
+
+from exact_cover_solver.types import (
+    ProblemData,
+    SecondaryUniverse,
+    Solution,
+    SubsetCollection,
+    SubsetId,
+    Universe,
+    UniverseElement,
+)
+
+ColumnIndex = Dict[UniverseElement, int]
+RowIndex = Dict[SubsetId, int]
+
+
+def unpack_problem_data(
+    problem_data: ProblemData,
+) -> Tuple[Universe, SubsetCollection, SecondaryUniverse]:
+    """Unpack problem data to universe, subset collection and secondary universe.
+
+    Args:
+        problem_data: Data needed to create an exact cover problem matrix.
+
+    Returns:
+        Tuple containing universe, subset collection and secondary universe, which is
+        empty if problem data didn't have one.
+    """
+    if len(problem_data) == 3:
+        universe, subset_collection, secondary_universe = problem_data  # type: ignore
+        return universe, subset_collection, secondary_universe
+    universe, subset_collection = problem_data  # type: ignore
+    return universe, subset_collection, []
+
+
+class CompiledProblem:
+    """Exact cover problem with elements and subset ids interned to integers.
+
+    Attributes:
+        column_ids: Element of each column, primary elements first.
+        primary_amount: Number of primary columns.
+        row_ids: Subset id of each row.
+        indptr: Start of each row in indices, followed by the end of the last row.
+        indices: Columns of each row one after another.
+    """
+
+    def __init__(
+        self,
+        column_ids: Sequence[UniverseElement],
+        primary_amount: int,
+        row_ids: Sequence[SubsetId],
+        indptr: Sequence[int],
+        indices: Sequence[int],
+        problem_data: Optional[ProblemData] = None,
+        column_index: Optional[ColumnIndex] = None,
+    ) -> None:
+        """Initialize compiled problem without validating it.
+
+        Args:
+            column_ids: Element of each column, primary elements first.
+            primary_amount: Number of primary columns.
+            row_ids: Subset id of each row.
+            indptr: Start of each row in indices, followed by the end of the last
+                row.
+            indices: Columns of each row one after another.
+            problem_data: Data problem was compiled from, decoded from the integers
+                when first needed if not given.
+            column_index: Column of each element, built when first needed if not
+                given.
+        """
+        self.column_ids = column_ids
+        self.primary_amount = primary_amount
+        self.row_ids = row_ids
+        self.indptr = indptr
+        self.indices = indices
+        self._problem_data = problem_data
+        self._column_index = column_index
+        self._row_index: Optional[RowIndex] = None
+
+    @property
+    def rows_amount(self) -> int:
+        """Get number of rows.
+
+        Returns:
+            Number of subsets in the problem.
+        """
+        return len(self.row_ids)
+
+    @property
+    def problem_data(self) -> ProblemData:
+        """Get data problem was compiled from.
+
+        Returns:
+            Tuple containing universe and subset collection, and secondary universe
+            if problem has secondary columns.
+        """
+        if self._problem_data is None:
+            column_ids = self.column_ids
+            universe = list(column_ids[: self.primary_amount])
+            subset_collection = {
+                subset_id: [column_ids[column] for column in self.row(row)]
+                for row, subset_id in enumerate(self.row_ids)
+            }
+            secondary_universe = list(column_ids[self.primary_amount :])
+            if secondary_universe:
+                self._problem_data = universe, subset_collection, secondary_universe
+            else:
+                self._problem_data = universe, subset_collection
+        return self._problem_data
+
+    @property
+    def column_index(self) -> ColumnIndex:
+        """Get column of each element.
+
+        Returns:
+            Dictionary mapping elements to their columns.
+        """
+        if self._column_index is None:
+            self._column_index = {
+                element: column for column, element in enumerate(self.column_ids)
+            }
+        return self._column_index
+
+    @property
+    def row_index(self) -> RowIndex:
+        """Get row of each subset id.
+
+        Returns:
+            Dictionary mapping subset ids to their rows.
+        """
+        if self._row_index is None:
+            self._row_index = {
+                subset_id: row for row, subset_id in enumerate(self.row_ids)
+            }
+        return self._row_index
+
+    def row(self, row: int) -> Sequence[int]:
+        """Get columns of given row.
+
+        Args:
+            row: Index of the row.
+
+        Returns:
+            Columns of the row in the order of the subset elements.
+        """
+        return self.indices[self.indptr[row] : self.indptr[row + 1]]
+
+    def decode(self, rows: Iterable[int]) -> Solution:
+        """Decode rows to subset ids.
+
+        Args:
+            rows: Indices of rows, e.g. picked to a solution.
+
+        Returns:
+            Subset ids of the rows.
+        """
+        row_ids = self.row_ids
+        return [row_ids[row] for row in rows]
+
+
+Problem = Union[ProblemData, CompiledProblem]
+
+
+def compile_problem(
+    problem_data: ProblemData, trusted: bool = False
+) -> CompiledProblem:
+    """Intern problem to integers, validating data on the same pass.
+
+    Args:
+        problem_data: Data needed to create an exact cover problem matrix.
+        trusted: Skip validation of data known to be valid. Problem compiled from
+            invalid data without validation is broken.
+
+    Returns:
+        Compiled problem.
+
+    Raises:
+        ValueError: if data is invalid for some reason.
+    """
+    universe, subset_collection, secondary_universe = unpack_problem_data(problem_data)
+    column_ids = [*universe, *secondary_universe]
+    column_index: ColumnIndex = {
+        element: column for column, element in enumerate(column_ids)
+    }
+    if not trusted:
+        if not universe:
+            raise ValueError("Not possible to create matrix with empty universe.")
+        if not subset_collection:
+            raise ValueError(
+                "Not possible to create matrix with empty subset collection."
+            )
+        if len(column_index) != len(column_ids):
+            _raise_duplicate_elements(universe, secondary_universe)
+    indptr = array("q", [0])
+    indices = array("i")
+    for subset in subset_collection.values():
+        try:
+            columns = [column_index[element] for element in subset]
+        except KeyError:
+            raise ValueError(
+                f"Some elements in subset {subset} are not elements of the universe."
+            ) from None
+        if not trusted:
+            if not columns:
+                raise ValueError("Empty subsets are not allowed.")
+            if len(set(columns)) != len(columns):
+                raise ValueError("Subset should only have unique elements.")
+        indices.extend(columns)
+        indptr.append(len(indices))
+    return CompiledProblem(
+        column_ids,
+        len(universe),
+        list(subset_collection),
+        indptr,
+        indices,
+        problem_data,
+        column_index,
+    )
+
+
+def _raise_duplicate_elements(
+    universe: Universe, secondary_universe: SecondaryUniverse
+) -> None:
+    """Tell which universe has duplicate elements.
+
+    Args:
+        universe: Primary elements of the problem.
+        secondary_universe: Secondary elements of the problem.
+
+    Raises:
+        ValueError: always, telling where the duplicate elements are.
+    """
+    if len(set(universe)) != len(universe):
+        raise ValueError("Universe should only have unique elements.")
+    if len(set(secondary_universe)) != len(secondary_universe):
+        raise ValueError("Secondary universe should only have unique elements.")
+    raise ValueError("Elements can't be both in universe and in secondary universe.")
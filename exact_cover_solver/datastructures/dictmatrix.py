@@ -1,42 +1,200 @@
 """Exact cover matrix implementation with dictionaries and sets."""
 
+from .compiled import Problem, unpack_problem_data
 from .matrix_base import Matrix
+from .sizebuckets import BucketNode, SizeBuckets
 from exact_cover_solver.types import (
     SubsetCollection,
-    ProblemData,
     UniverseElement,
     SubsetId,
 )
-from typing import Dict, Set, Tuple
+from typing import Any, Dict, FrozenSet, Hashable, List, Optional, Set, Tuple
 
 ColumnValue = Set[SubsetId]
 ColumnDict = Dict[UniverseElement, ColumnValue]
+Secondary = FrozenSet[UniverseElement]
+
+
+class BucketColumn(Set[Hashable], BucketNode):
+    """Column set that keeps its place in size buckets up to date.
+
+    Attributes:
+        element: Element the column represents.
+        buckets: Buckets the column is kept in, None until matrix is created.
+    """
+
+    def __init__(self, element: Hashable) -> None:
+        """Initialize empty column.
+
+        Args:
+            element: Element the column represents.
+        """
+        set.__init__(self)
+        BucketNode.__init__(self)
+        self.element = element
+        self.buckets: Optional[SizeBuckets[BucketColumn]] = None
+
+    def add(self, subset_id: Hashable) -> None:
+        """Add row to column and move column to bucket of its new size.
+
+        Args:
+            subset_id: Id of the row.
+        """
+        set.add(self, subset_id)
+        if self.buckets is not None:
+            self.buckets.remove(self)
+            self.buckets.insert(self, len(self))
+
+    def remove(self, subset_id: Hashable) -> None:
+        """Remove row from column and move column to bucket of its new size.
+
+        Args:
+            subset_id: Id of the row.
+        """
+        set.remove(self, subset_id)
+        if self.buckets is not None:
+            self.buckets.remove(self)
+            self.buckets.insert(self, len(self))
+
+
+class BucketColumnDict(Dict[Hashable, Set[Hashable]]):
+    """Column dictionary keeping its primary columns in size buckets.
+
+    Column is in its bucket only while it's in the dictionary, so columns popped
+    while covering are never chosen.
+
+    Attributes:
+        buckets: Buckets of the primary columns.
+    """
+
+    def __init__(self, buckets: SizeBuckets[BucketColumn]) -> None:
+        """Initialize empty dictionary.
+
+        Args:
+            buckets: Buckets of the primary columns.
+        """
+        super().__init__()
+        self.buckets = buckets
+
+    def __setitem__(self, element: Hashable, column: Set[Hashable]) -> None:
+        """Add column to dictionary and to bucket of its size if it's primary.
+
+        Args:
+            element: Element the column represents.
+            column: Rows of the column.
+        """
+        super().__setitem__(element, column)
+        if isinstance(column, BucketColumn):
+            self.buckets.insert(column, len(column))
+
+    def __delitem__(self, element: Hashable) -> None:
+        """Remove column from dictionary and from its bucket.
+
+        Args:
+            element: Element the column represents.
+        """
+        self.pop(element)
+
+    def pop(self, element: Hashable, *default: Any) -> Any:
+        """Remove column from dictionary and from its bucket.
+
+        Args:
+            element: Element the column represents.
+            default: Value to return if column is not in dictionary.
+
+        Returns:
+            Rows of the removed column.
+        """
+        column = super().pop(element, *default)
+        if isinstance(column, BucketColumn):
+            self.buckets.remove(column)
+        return column
 
 
 class DictMatrix(Matrix):
     """Exact cover matrix implementation with dictionaries and sets."""
 
-    def __init__(self, problem_data: ProblemData) -> None:
+    def __init__(
+        self,
+        problem: Problem,
+        size_buckets: bool = False,
+        trusted: bool = False,
+    ) -> None:
         """Initialize matrix with columns dictionary.
 
         Args:
-            problem_data: Data needed to create matrix.
+            problem: Data needed to create matrix, or problem compiled from it.
+            size_buckets: Keep primary columns in buckets by their size, so column
+                with fewest rows can be found without scanning the dictionary.
+                Keeping buckets up to date makes adding and removing rows slower.
+            trusted: Skip validation of data known to be valid.
         """
         self._column_dict: ColumnDict = {}
-        super().__init__(problem_data)
+        self._secondary: Secondary = frozenset()
+        self._merged_collection: SubsetCollection = {}
+        self._size_buckets = size_buckets
+        super().__init__(problem, trusted)
 
     def _create(self) -> None:
-        """Create dict for universe elements and for subsets where element appears."""
-        self._column_dict = {element: set() for element in self._universe}
-        for subset_id, subset_elements in self._subset_collection.items():
-            for element in subset_elements:
-                self._column_dict[element].add(subset_id)
+        """Create dict for universe elements and for subsets where element appears.
+
+        Secondary elements get their own columns too, they are listed after the
+        primary ones.
+        """
+        compiled = self._compiled
+        primary_amount = compiled.primary_amount
+        columns: List[ColumnValue] = [
+            BucketColumn(element) if self._size_buckets else set()
+            for element in compiled.column_ids[:primary_amount]
+        ]
+        columns.extend(set() for _ in compiled.column_ids[primary_amount:])
+        self._column_dict = dict(zip(compiled.column_ids, columns))
+        self._secondary = frozenset(compiled.column_ids[primary_amount:])
+        for row in self._merged_rows:
+            subset_id = compiled.row_ids[row]
+            for column in compiled.row(row):
+                columns[column].add(subset_id)
+        _, subset_collection, _ = unpack_problem_data(self.problem_data)
+        if self._row_groups:
+            subset_collection = {
+                compiled.row_ids[row]: subset_collection[compiled.row_ids[row]]
+                for row in self._merged_rows
+            }
+        self._merged_collection = subset_collection
+        if self._size_buckets:
+            self._create_size_buckets()
+
+    def _create_size_buckets(self) -> None:
+        """Replace column dictionary with one keeping primary columns in buckets."""
+        buckets: SizeBuckets[BucketColumn] = SizeBuckets(
+            max(
+                len(self._column_dict[element])
+                for element in self._compiled.column_ids[
+                    : self._compiled.primary_amount
+                ]
+            )
+        )
+        column_dict = BucketColumnDict(buckets)
+        for element, column in self._column_dict.items():
+            if isinstance(column, BucketColumn):
+                column.buckets = buckets
+            column_dict[element] = column
+        self._column_dict = column_dict
 
     @property
     def data(self) -> Tuple[ColumnDict, SubsetCollection]:
-        """Get created dictionary and original set collection.
+        """Get created dictionary and set collection with duplicates merged.
 
         Returns:
             Tuple containing created matrix and set collection used to create matrix.
         """
-        return self._column_dict, self._subset_collection
+        return self._column_dict, self._merged_collection
+
+    @property
+    def secondary(self) -> Secondary:
+        """Get elements whose columns are secondary.
+
+        Returns:
+            Set of secondary elements, empty if matrix has only primary columns.
+        """
+        return self._secondary
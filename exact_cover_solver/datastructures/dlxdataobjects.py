@@ -1,17 +1,24 @@
 """Dancing link matrix objects."""
 
-from typing import Union
+from typing import Optional, Union
 
-from exact_cover_solver.types import SubsetId, UniverseElement
+from .sizebuckets import BucketNode, SizeBuckets
+from exact_cover_solver.types import Color, SubsetId, UniverseElement
 
 
 class RootObject:
-    """Column object to link matrix column and data objects together."""
+    """Column object to link matrix column and data objects together.
+
+    Attributes:
+        buckets: Live primary columns grouped by size, None if matrix doesn't keep
+            them.
+    """
 
     def __init__(self) -> None:
         """Initialize links."""
         self.left: Union[RootObject, ColumnObject] = self
         self.right: Union[RootObject, ColumnObject] = self
+        self.buckets: Optional[SizeBuckets[BucketColumnObject]] = None
 
 
 class ColumnObject:
@@ -48,6 +55,54 @@ class ColumnObject:
         self.size -= 1
 
 
+class BucketColumnObject(ColumnObject, BucketNode):
+    """Column object that keeps its place in size buckets up to date.
+
+    Column is in its bucket only while it's attached to the header list, so covered
+    columns are never chosen. Size of a covered column doesn't change, since its
+    rows are only removed from the other columns.
+
+    Attributes:
+        buckets: Buckets the column is kept in, None until matrix is created.
+    """
+
+    def __init__(self, column_id: UniverseElement) -> None:
+        """Initialize column object details and links.
+
+        Args:
+            column_id: Which element this column represents.
+        """
+        ColumnObject.__init__(self, column_id)
+        BucketNode.__init__(self)
+        self.buckets: Optional[SizeBuckets[BucketColumnObject]] = None
+
+    def detach(self) -> None:
+        """Detach column object from header list and from its bucket."""
+        super().detach()
+        if self.buckets is not None:
+            self.buckets.remove(self)
+
+    def attach(self) -> None:
+        """Attach column object back to header list and to bucket of its size."""
+        super().attach()
+        if self.buckets is not None:
+            self.buckets.insert(self, self.size)
+
+    def increase_size(self) -> None:
+        """Increase size and move column to next bucket."""
+        self.size += 1
+        if self.buckets is not None:
+            self.buckets.remove(self)
+            self.buckets.insert(self, self.size)
+
+    def decrease_size(self) -> None:
+        """Decrease size and move column to previous bucket."""
+        self.size -= 1
+        if self.buckets is not None:
+            self.buckets.remove(self)
+            self.buckets.insert(self, self.size)
+
+
 class DataObject:
     """Data object representing elements in subsets."""
 
@@ -75,3 +130,27 @@ class DataObject:
         """Attach data object back to its original position in linked list."""
         self.column.increase_size()
         self.up.down = self.down.up = self
+
+
+class ColoredDataObject(DataObject):
+    """Data object with an optional color for elements in secondary columns.
+
+    Rows are made only of colored data objects, so left and right links are narrowed.
+    """
+
+    left: "ColoredDataObject"
+    right: "ColoredDataObject"
+
+    def __init__(
+        self, column: ColumnObject, subset_id: SubsetId, color: Optional[Color] = None
+    ) -> None:
+        """Initialize data object details, links and color.
+
+        Args:
+            column: Column object this data object should be linked to
+            subset_id: Id of the subset this data object belongs to.
+            color: Color of the element, None if element can't be shared.
+        """
+        super().__init__(column, subset_id)
+        self.color = color
+        self.purified = False
@@ -0,0 +1,220 @@
+"""Reader and writer for the text format of Knuth's DLX programs.
+
+First line of a DLX file names the items, primary items first, then a | and the
+secondary items. Every other line is an option listing its items, secondary items
+optionally having a color after a colon, e.g. "a b x:red". Blank lines and lines
+starting with | are comments.
+
+Reading streams the file line by line and interns item names to columns right away,
+so options are never kept as strings or lists. Memory used is the compiled problem
+itself: 4 bytes for each item in options and 8 bytes for each option. Options are
+identified by their index in the file, starting from 0.
+"""
+from array import array
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+from .compiled import CompiledProblem, unpack_problem_data
+from exact_cover_solver.types import ProblemData, SubsetColors
+
+
+def read_dlx(path: str) -> Tuple[CompiledProblem, SubsetColors]:
+    """Read problem from a DLX file.
+
+    Args:
+        path: Path of the file.
+
+    Returns:
+        Tuple containing compiled problem, named by the item names, and colors of
+        the secondary items in options, empty if file has no colors. Matrices can
+        be created from the problem without validating it again.
+
+    Raises:
+        ValueError: if file has no items or some option is invalid.
+    """
+    column_index: Dict[bytes, int] = {}
+    primary_amount = 0
+    indptr = array("q", [0])
+    indices = array("i")
+    colors: SubsetColors = {}
+    column_ids: List[str] = []
+    with open(path, "rb") as file:
+        for line in file:
+            tokens = line.split()
+            if not tokens or tokens[0].startswith(b"|"):
+                continue
+            if not column_ids:
+                column_ids, primary_amount = _read_items(tokens)
+                column_index = {
+                    name.encode(): column for column, name in enumerate(column_ids)
+                }
+                find_column = column_index.__getitem__
+                continue
+            try:
+                columns = list(map(find_column, tokens))
+            except KeyError:
+                columns = _read_colors(
+                    tokens,
+                    column_index,
+                    column_ids,
+                    primary_amount,
+                    colors,
+                    len(indptr) - 1,
+                )
+            if len(set(columns)) != len(columns):
+                raise ValueError(f"Option {len(indptr) - 1} has duplicate items.")
+            indices.extend(columns)
+            indptr.append(len(indices))
+    if not column_ids:
+        raise ValueError(f"File {path} has no items.")
+    compiled = CompiledProblem(
+        column_ids, primary_amount, range(len(indptr) - 1), indptr, indices
+    )
+    return compiled, colors
+
+
+def write_dlx(
+    problem_data: ProblemData, path: str, colors: Optional[SubsetColors] = None
+) -> None:
+    """Write problem to a DLX file.
+
+    File is written as UTF-8, which read_dlx expects. Items are named with the
+    elements as strings without whitespace. Elements having a colon or | in their
+    name are named by their column, e.g. #3. Subset ids are not written, options
+    are in the order of the subset collection.
+
+    Args:
+        problem_data: Data needed to create an exact cover problem matrix.
+        path: Path of the file, overwritten if it exists.
+        colors: Colors of secondary elements for each subset, if any.
+
+    Raises:
+        ValueError: if some subset is empty or has elements not in the universe, or
+            elements or colors don't get unique names.
+    """
+    universe, subset_collection, secondary_universe = unpack_problem_data(problem_data)
+    names = _names([*universe, *secondary_universe], "elements")
+    color_names = _names(
+        [
+            color
+            for element_colors in (colors or {}).values()
+            for color in element_colors.values()
+        ],
+        "colors",
+    )
+    items = [names[element] for element in universe]
+    if secondary_universe:
+        items.append("|")
+        items.extend(names[element] for element in secondary_universe)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(" ".join(items) + "\n")
+        for subset_id, subset in subset_collection.items():
+            if not subset:
+                raise ValueError("Empty subsets are not allowed.")
+            element_colors = (colors or {}).get(subset_id, {})
+            try:
+                option = [
+                    f"{names[element]}:{color_names[element_colors[element]]}"
+                    if element in element_colors
+                    else names[element]
+                    for element in subset
+                ]
+            except KeyError:
+                raise ValueError(
+                    f"Some elements in subset {subset} are not elements of the "
+                    "universe."
+                ) from None
+            file.write(" ".join(option) + "\n")
+
+
+def _read_items(tokens: List[bytes]) -> Tuple[List[str], int]:
+    """Read names of items from the first line.
+
+    Args:
+        tokens: Item names and the | separating secondary items.
+
+    Returns:
+        Tuple containing names of items, primary items first, and number of
+        primary items.
+
+    Raises:
+        ValueError: if there are no primary items, some item is named twice or some
+            name has a colon.
+    """
+    names = [token.decode() for token in tokens]
+    if names.count("|") > 1 or names[0] == "|":
+        raise ValueError("Item line should have primary items and at most one |.")
+    primary_amount = names.index("|") if "|" in names else len(names)
+    column_ids = names[:primary_amount] + names[primary_amount + 1 :]
+    if len(set(column_ids)) != len(column_ids):
+        raise ValueError("Items should have unique names.")
+    if any(":" in name or "|" in name for name in column_ids):
+        raise ValueError(
+            "Item names can't have colons or |, multiplicities are not supported."
+        )
+    return column_ids, primary_amount
+
+
+def _read_colors(
+    tokens: List[bytes],
+    column_index: Dict[bytes, int],
+    column_ids: Sequence[str],
+    primary_amount: int,
+    colors: SubsetColors,
+    row: int,
+) -> List[int]:
+    """Read option having colored items, slow path of reading options.
+
+    Args:
+        tokens: Items of the option.
+        column_index: Column of each item name.
+        column_ids: Name of each column.
+        primary_amount: Number of primary items.
+        colors: Colors of options read so far, updated with the option.
+        row: Index of the option.
+
+    Returns:
+        Columns of the option.
+
+    Raises:
+        ValueError: if option has unknown item or colored primary item.
+    """
+    columns = []
+    for token in tokens:
+        name, colon, color = token.partition(b":")
+        if name not in column_index:
+            raise ValueError(f"Option {row} has unknown item {name.decode()}.")
+        column = column_index[name]
+        if colon:
+            if column < primary_amount:
+                raise ValueError(
+                    f"Option {row} gives a color to primary item {name.decode()}."
+                )
+            colors.setdefault(row, {})[column_ids[column]] = color.decode()
+        columns.append(column)
+    return columns
+
+
+def _names(values: Sequence[Hashable], kind: str) -> Dict[Hashable, str]:
+    """Name values for a DLX file.
+
+    Args:
+        values: Elements or colors to name.
+        kind: What values are, used in the error message.
+
+    Returns:
+        Name of each value.
+
+    Raises:
+        ValueError: if two values get the same name.
+    """
+    names: Dict[Hashable, str] = {}
+    for value in values:
+        if value in names:
+            continue
+        name = "".join(str(value).split())
+        if not name or ":" in name or "|" in name:
+            name = f"#{len(names)}"
+        names[value] = name
+    if len(set(names.values())) != len(names):
+        raise ValueError(f"Some {kind} get the same name in DLX format.")
+    return names
@@ -1,41 +1,70 @@
 """Exact cover matrix implementation with dancing links."""
-from typing import Union, Optional
+from typing import Dict, List, Union, Optional
 
+from .compiled import Problem
 from .matrix_base import Matrix
-from .dlxdataobjects import RootObject, ColumnObject, DataObject
-from exact_cover_solver.types import ProblemData, UniverseElement
+from .dlxdataobjects import BucketColumnObject, ColumnObject, DataObject, RootObject
+from .sizebuckets import SizeBuckets
+from exact_cover_solver.types import SubsetId, UniverseElement
+
+SecondaryColumns = Dict[UniverseElement, ColumnObject]
 
 
 class DLXMatrix(Matrix):
     """Exact cover matrix implementation with dancing links.."""
 
-    def __init__(self, problem_data: ProblemData) -> None:
+    def __init__(
+        self,
+        problem: Problem,
+        size_buckets: bool = False,
+        trusted: bool = False,
+    ) -> None:
         """Initialize matrix with root object.
 
         Args:
-            problem_data: Data needed to create matrix.
+            problem: Data needed to create matrix, or problem compiled from it.
+            size_buckets: Keep live primary columns in buckets by their size, so
+                column with fewest rows can be found without scanning the header
+                list. Keeping buckets up to date makes each link update slower.
+            trusted: Skip validation of data known to be valid.
         """
         self.root = RootObject()
-        super().__init__(problem_data)
+        self._columns: List[ColumnObject] = []
+        self._secondary_columns: SecondaryColumns = {}
+        self._size_buckets = size_buckets
+        super().__init__(problem, trusted)
 
     def _create(self) -> None:
-        """Call creator methods for column and data objects."""
+        """Call creator methods for column and data objects, and size buckets."""
         self._create_column_objects()
         self._create_data_objects()
+        if self._size_buckets:
+            self._create_size_buckets()
 
     def _create_column_objects(self) -> None:
         """Create column objects representing elements in universe.
 
         Column objects are linked to root and together to form a circular row.
+        Secondary columns are left out from the row and only linked to themselves, so
+        search never chooses them, but covering them still removes conflicting rows.
+        Columns are also listed in the order of compiled columns.
         """
+        column_ids = self._compiled.column_ids
+        primary_amount = self._compiled.primary_amount
+        column_class = BucketColumnObject if self._size_buckets else ColumnObject
         previous_column: Union[ColumnObject, RootObject] = self.root
-        for element in self._universe:
-            created_column = ColumnObject(element)
+        for element in column_ids[:primary_amount]:
+            created_column = column_class(element)
             created_column.left = previous_column
             previous_column.right = created_column
             previous_column = created_column
+            self._columns.append(created_column)
         self.root.left = previous_column
         previous_column.right = self.root
+        self._secondary_columns = {
+            element: ColumnObject(element) for element in column_ids[primary_amount:]
+        }
+        self._columns.extend(self._secondary_columns.values())
 
     def _create_data_objects(self) -> None:
         """Create data objects representing elements in each subset.
@@ -43,13 +72,18 @@ class DLXMatrix(Matrix):
         Data objects are linked to correct column object and linked together to form
         a circular row.
         """
-        for subset_id, subset_elements in self._subset_collection.items():
+        compiled = self._compiled
+        columns = self._columns
+        for row in self._merged_rows:
+            subset_id = compiled.row_ids[row]
             leftmost_data_object: Optional[DataObject] = None
             previous_data_object: Optional[DataObject] = None
 
-            for element in subset_elements:
-                column = self._find_column(element)
-                created_data_object = DataObject(column, subset_id)
+            for column_index in compiled.row(row):
+                column = columns[column_index]
+                created_data_object = self._create_data_object(
+                    column, subset_id, column.id
+                )
 
                 lowest_data_object = column.up
                 lowest_data_object.down = created_data_object
@@ -70,12 +104,50 @@ class DLXMatrix(Matrix):
 
             if not previous_data_object or not leftmost_data_object:
                 raise ValueError(
-                    "Cannot not link subset elements together for subset "
-                    f"{subset_id}: {subset_elements}"
+                    f"Cannot not link subset elements together for subset {subset_id}"
                 )
             previous_data_object.right = leftmost_data_object
             leftmost_data_object.left = previous_data_object
 
+    def _create_size_buckets(self) -> None:
+        """Put primary columns to buckets of their size in header list order."""
+        columns = []
+        column = self.root.right
+        while isinstance(column, BucketColumnObject):
+            columns.append(column)
+            column = column.right
+        buckets: SizeBuckets[BucketColumnObject] = SizeBuckets(
+            max(column.size for column in columns)
+        )
+        for column in columns:
+            column.buckets = buckets
+            buckets.insert(column, column.size)
+        self.root.buckets = buckets
+
+    def _create_data_object(
+        self, column: ColumnObject, subset_id: SubsetId, element: UniverseElement
+    ) -> DataObject:
+        """Create single data object, subclasses can override to add details.
+
+        Args:
+            column: Column object data object is linked to.
+            subset_id: Id of the subset data object belongs to.
+            element: Element data object represents in the subset.
+
+        Returns:
+            Created data object.
+        """
+        return DataObject(column, subset_id)
+
+    @property
+    def secondary_columns(self) -> List[ColumnObject]:
+        """Get column objects of secondary elements.
+
+        Returns:
+            List of secondary columns in the order of secondary universe.
+        """
+        return list(self._secondary_columns.values())
+
     def _find_column(self, element: UniverseElement) -> ColumnObject:
         """Find column object representing given element.
 
@@ -86,13 +158,9 @@ class DLXMatrix(Matrix):
             Column object of the correct object
 
         Raises:
-            ValueError: if root object does not have any links or there is no
-                        column for given element.
+            ValueError: if there is no column for given element.
         """
-        column = self.root.right
-        while True:
-            if isinstance(column, RootObject):
-                raise ValueError(f"Could not find column with element {element}")
-            if column.id == element:
-                return column
-            column = column.right
+        column_index = self._compiled.column_index
+        if element not in column_index:
+            raise ValueError(f"Could not find column with element {element}")
+        return self._columns[column_index[element]]
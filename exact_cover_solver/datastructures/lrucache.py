@@ -0,0 +1,91 @@
+"""Size bounded mapping which evicts least recently used entries."""
+import math
+from collections import OrderedDict
+from typing import Dict, Generic, Hashable, Optional, TypeVar
+
+Key = TypeVar("Key", bound=Hashable)
+Value = TypeVar("Value")
+
+
+class LRUCache(Generic[Key, Value]):
+    """Size bounded mapping which evicts least recently used entries.
+
+    Attributes:
+        hits: Number of lookups that found a value.
+        misses: Number of lookups that didn't find a value.
+        bytes_used: Sum of sizes given for stored values.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: Optional[int] = None) -> None:
+        """Initialize empty cache.
+
+        Args:
+            max_entries: How many entries cache can hold before evicting.
+            max_bytes: How many bytes values can take in total before evicting,
+                unbounded if None. Only values stored with a size count.
+
+        Raises:
+            ValueError: if max entries or max bytes is not positive.
+        """
+        if max_entries < 1:
+            raise ValueError(f"Cache size must be positive, got {max_entries}.")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"Cache size must be positive, got {max_bytes} bytes.")
+        self._max_entries = max_entries
+        self._max_bytes = math.inf if max_bytes is None else max_bytes
+        self._entries: "OrderedDict[Key, Value]" = OrderedDict()
+        self._sizes: Dict[Key, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.bytes_used = 0
+
+    def get(self, key: Key) -> Optional[Value]:
+        """Get value for key and mark it as recently used.
+
+        Args:
+            key: Key to look for.
+
+        Returns:
+            Stored value or None if key is not in cache.
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Key, value: Value, size: int = 0) -> None:
+        """Store value for key, evicting least recently used entries if cache is full.
+
+        Value larger than max bytes is not stored at all, and an earlier value of
+        the key is removed, so it's never served instead.
+
+        Args:
+            key: Key to store value for.
+            value: Value to store, must not be None.
+            size: Size of the value in bytes.
+        """
+        entries = self._entries
+        if size > self._max_bytes:
+            if entries.pop(key, None) is not None:
+                self.bytes_used -= self._sizes.pop(key, 0)
+            return
+        entries[key] = value
+        entries.move_to_end(key)
+        if size or self._sizes:
+            self.bytes_used += size - self._sizes.pop(key, 0)
+            if size:
+                self._sizes[key] = size
+        while len(entries) > self._max_entries or self.bytes_used > self._max_bytes:
+            evicted, _ = entries.popitem(last=False)
+            self.bytes_used -= self._sizes.pop(evicted, 0)
+
+    def __len__(self) -> int:
+        """Get number of stored entries.
+
+        Returns:
+            Number of entries.
+        """
+        return len(self._entries)
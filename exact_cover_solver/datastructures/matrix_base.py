@@ -3,27 +3,156 @@
 Matrix is an incidence matrix, i.e. a representation of exact cover problem set elements
 as columns and possible subsets as rows. When subset at row x has element y in it,
 matrix(x,y) will be 1, otherwise 0.
+
+Besides the primary columns that must be covered exactly once, matrix can have
+secondary columns that must be covered at most once. Secondary columns are never
+chosen for branching, they only rule out rows that would cover them twice.
+
+Subsets with identical elements are merged to a single row carrying the ids of all
+of them. Identical rows always conflict, so a solution has at most one of them and
+each solution of the merged matrix stands for a solution with every combination of
+merged ids. Search only explores the merged rows once, and solutions are expanded
+when they are emitted.
+
+Matrices are created from problem compiled to integers, which is validated and
+interned in a single pass. Data known to be valid, e.g. created by the problem
+creators or already validated by reduction, can skip validation, and compiled
+problem can be reused to create any number of matrices.
 """
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from itertools import product
+from typing import Dict, Hashable, Iterator, List, Tuple, TypeVar
 
-from exact_cover_solver.types import ProblemData
+from .compiled import CompiledProblem, compile_problem, Problem
+from exact_cover_solver.types import ProblemData, Solution, SubsetId
+
+RowGroups = Dict[SubsetId, List[SubsetId]]
 
 
 class Matrix(ABC):
     """Base class for matrix used by algorithm X implementations."""
 
-    def __init__(self, problem_data: ProblemData) -> None:
+    def __init__(self, problem: Problem, trusted: bool = False) -> None:
         """Initialize matrix details and call column and node creator methods.
 
         Args:
-            problem_data: Data needed to create an exact cover problem matrix.
+            problem: Data needed to create an exact cover problem matrix, or problem
+                compiled from it.
+            trusted: Skip validation of data known to be valid. Matrix created from
+                invalid data without validation is broken. Compiled problems are
+                never validated again.
         """
-        universe, subset_collection = self._validate_problem_data(problem_data)
-        self._universe = universe
-        self._subset_collection = subset_collection
+        if isinstance(problem, CompiledProblem):
+            self._compiled = problem
+        else:
+            self._compiled = compile_problem(problem, trusted)
+        self._trusted = trusted
+        self._merged_rows, self._row_groups = self._merge_duplicates()
         self._create()
 
+    @property
+    def compiled(self) -> CompiledProblem:
+        """Get problem compiled to integers matrix was created from.
+
+        Returns:
+            Compiled problem.
+        """
+        return self._compiled
+
+    @property
+    def problem_data(self) -> ProblemData:
+        """Get data matrix was created from.
+
+        Returns:
+            Tuple containing universe and subset collection, and secondary universe
+            if matrix has secondary columns.
+        """
+        return self._compiled.problem_data
+
+    @property
+    def row_groups(self) -> RowGroups:
+        """Get ids of subsets merged to a single row.
+
+        Returns:
+            Dictionary mapping id of the merged row to ids of all the subsets it
+            stands for, first one being the row id itself. Rows without duplicates
+            are left out.
+        """
+        return self._row_groups
+
+    def expand(self, solution: Solution) -> Iterator[Solution]:
+        """Yield solutions of the original problem solution of merged rows stands for.
+
+        Args:
+            solution: Solution found from the merged matrix.
+
+        Yields:
+            Solution for each combination of ids of the merged rows, as new lists.
+        """
+        if not self._row_groups:
+            yield solution[:]
+            return
+        groups = [
+            self._row_groups.get(subset_id, [subset_id]) for subset_id in solution
+        ]
+        for subset_ids in product(*groups):
+            yield list(subset_ids)
+
+    def weight(self, solution: Solution) -> int:
+        """Count solutions of the original problem solution of merged rows stands for.
+
+        Args:
+            solution: Solution found from the merged matrix.
+
+        Returns:
+            Product of the group sizes of the rows in solution.
+        """
+        count = 1
+        if self._row_groups:
+            for subset_id in solution:
+                count *= self.row_weight(subset_id)
+        return count
+
+    def row_weight(self, subset_id: SubsetId) -> int:
+        """Count subsets merged to given row.
+
+        Args:
+            subset_id: Id of a row in the merged matrix.
+
+        Returns:
+            Size of the row's group, 1 if row had no duplicates.
+        """
+        group = self._row_groups.get(subset_id)
+        return len(group) if group is not None else 1
+
+    def _merge_duplicates(self) -> Tuple[List[int], RowGroups]:
+        """Merge rows identical to some earlier row to the first one of them.
+
+        Returns:
+            Rows left after merging in their original order, and groups of subset
+            ids of the merged rows.
+        """
+        row_ids = self._compiled.row_ids
+        first_rows: Dict[Hashable, int] = {}
+        groups: RowGroups = {}
+        for row in range(len(row_ids)):
+            first_row = first_rows.setdefault(self._row_key(row), row)
+            if first_row != row:
+                first_id = row_ids[first_row]
+                groups.setdefault(first_id, [first_id]).append(row_ids[row])
+        return list(first_rows.values()), groups
+
+    def _row_key(self, row: int) -> Hashable:
+        """Get key telling which rows are identical.
+
+        Args:
+            row: Index of the row in compiled problem.
+
+        Returns:
+            Key that is equal for rows with the same columns.
+        """
+        return frozenset(self._compiled.row(row))
+
     @staticmethod
     def _validate_problem_data(problem_data: ProblemData) -> ProblemData:
         """Check that given universe and subset collection are valid.
@@ -31,30 +160,14 @@ class Matrix(ABC):
         Args:
             problem_data: Data needed to create an exact cover problem matrix.
 
+        Returns:
+            Given problem data.
+
         Raises:
             ValueError: if data is invalid for some reason.
         """
-        universe, subset_collection = problem_data
-        if not universe:
-            raise ValueError("Not possible to create matrix with empty universe.")
-        if not subset_collection:
-            raise ValueError(
-                "Not possible to create matrix with empty subset collection."
-            )
-        universe_set = set(universe)
-        if len(universe_set) != len(universe):
-            raise ValueError("Universe should only have unique elements.")
-        for subset in subset_collection.values():
-            if not subset:
-                raise ValueError("Empty subsets are not allowed.")
-            if len(set(subset)) != len(subset):
-                raise ValueError("Subset should only have unique elements.")
-            if any(element not in universe_set for element in subset):
-                raise ValueError(
-                    f"Some elements in subset {subset} are not elements "
-                    "of the universe."
-                )
-        return universe, subset_collection
+        compile_problem(problem_data)
+        return problem_data
 
     @abstractmethod
     def _create(self) -> None:
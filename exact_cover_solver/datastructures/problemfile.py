@@ -0,0 +1,362 @@
+"""Binary file format for compiled exact cover problems.
+
+File starts with a fixed size header telling the format version and where each
+section is, followed by four sections aligned to 8 bytes:
+- Element of each column.
+- Subset id of each row.
+- Row pointers of compressed sparse rows as 64 bit integers.
+- Column indices of compressed sparse rows as 32 bit integers.
+
+Element and subset id tables of plain integers are stored as 64 bit integer
+arrays. Other tables are encoded value by value, supporting integers, strings,
+bytes, floats, booleans, None and tuples of them. Nothing is unpickled, so loading
+a file can't run code.
+
+Loading memory maps the file. Row arrays and integer tables are used directly from
+the mapped memory without copying, so processes loading the same file share its
+pages. Row arrays are checked to point inside the problem before they are used, so a
+corrupted file can't make matrices index past their columns.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from typing import Any, List, Sequence, Tuple
+
+from .compiled import CompiledProblem
+
+MAGIC = b"ECSP"
+VERSION = 1
+VALUE_TABLE = 0
+INTEGER_TABLE = 1
+
+_HEADER = struct.Struct("<4sHBBB3xQQQQ8Q")
+_COUNT = struct.Struct("<Q")
+_LENGTH = struct.Struct("<I")
+_INTEGER = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+_ALIGNMENT = 8
+_MAX_NESTING = 100
+
+Section = Tuple[int, int]
+
+
+def save_problem(compiled: CompiledProblem, path: str) -> None:
+    """Save compiled problem to a file.
+
+    Args:
+        compiled: Problem to save.
+        path: Path of the file, overwritten if it exists.
+
+    Raises:
+        ValueError: if some element or subset id can't be saved.
+    """
+    column_kind, column_table = _encode_table(compiled.column_ids)
+    row_kind, row_table = _encode_table(compiled.row_ids)
+    indptr = _native_bytes(compiled.indptr, "q")
+    indices = _native_bytes(compiled.indices, "i")
+    sections: List[Section] = []
+    offset = _HEADER.size
+    for data in [column_table, row_table, indptr, indices]:
+        offset += -offset % _ALIGNMENT
+        sections.append((offset, len(data)))
+        offset += len(data)
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        column_kind,
+        row_kind,
+        sys.byteorder == "big",
+        compiled.primary_amount,
+        len(compiled.column_ids),
+        len(compiled.row_ids),
+        len(compiled.indices),
+        *[value for section in sections for value in section],
+    )
+    with open(path, "wb") as file:
+        file.write(header)
+        for (offset, _), data in zip(
+            sections, [column_table, row_table, indptr, indices]
+        ):
+            file.write(bytes(offset - file.tell()))
+            file.write(data)
+
+
+def load_problem(path: str) -> CompiledProblem:
+    """Load compiled problem from a file by memory mapping it.
+
+    Args:
+        path: Path of a file saved with save_problem.
+
+    Returns:
+        Compiled problem using the mapped file for its row arrays.
+
+    Raises:
+        ValueError: if file is not a problem file, its version is not supported or
+            it is truncated or corrupted.
+    """
+    with open(path, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mapped) < _HEADER.size:
+        raise ValueError(f"File {path} is not an exact cover problem file.")
+    (
+        magic,
+        version,
+        column_kind,
+        row_kind,
+        big_endian,
+        primary_amount,
+        columns_amount,
+        rows_amount,
+        indices_amount,
+        *section_values,
+    ) = _HEADER.unpack_from(mapped)
+    if magic != MAGIC:
+        raise ValueError(f"File {path} is not an exact cover problem file.")
+    if version != VERSION:
+        raise ValueError(
+            f"Problem file version {version} is not supported, "
+            f"supported version is {VERSION}."
+        )
+    swap = bool(big_endian) != (sys.byteorder == "big")
+    view = memoryview(mapped)
+    sections = [
+        view[offset : offset + size]
+        for offset, size in zip(section_values[::2], section_values[1::2])
+    ]
+    column_ids = _decode_table(sections[0], column_kind, columns_amount, swap)
+    row_ids = _decode_table(sections[1], row_kind, rows_amount, swap)
+    indptr = _integers(sections[2], "q", rows_amount + 1, swap)
+    indices = _integers(sections[3], "i", indices_amount, swap)
+    _check_rows(primary_amount, columns_amount, indptr, indices)
+    return CompiledProblem(column_ids, primary_amount, row_ids, indptr, indices)
+
+
+def _check_rows(
+    primary_amount: int,
+    columns_amount: int,
+    indptr: Sequence[int],
+    indices: Sequence[int],
+) -> None:
+    """Check that rows of a loaded problem point inside it.
+
+    Checks are done with builtins running over the whole arrays at once, which is
+    much faster than looping over rows.
+
+    Args:
+        primary_amount: Number of primary columns.
+        columns_amount: Number of columns.
+        indptr: Start of each row in indices, followed by the end of the last row.
+        indices: Columns of each row one after another.
+
+    Raises:
+        ValueError: if some row or column is out of bounds.
+    """
+    if (
+        primary_amount > columns_amount
+        or indptr[0] != 0
+        or indptr[-1] != len(indices)
+        or list(indptr) != sorted(indptr)
+        or (len(indices) and (min(indices) < 0 or max(indices) >= columns_amount))
+    ):
+        raise ValueError("Problem file is truncated or corrupted.")
+
+
+def _native_bytes(values: Sequence[int], typecode: str) -> bytes:
+    """Get integers as bytes of an array of given type in native byte order.
+
+    Args:
+        values: Integers to convert.
+        typecode: Type code of the array.
+
+    Returns:
+        Bytes of the array.
+    """
+    if isinstance(values, array) and values.typecode == typecode:
+        return values.tobytes()
+    return array(typecode, values).tobytes()
+
+
+def _integers(
+    data: memoryview, typecode: str, amount: int, swap: bool
+) -> Sequence[int]:
+    """View bytes as integers of given type.
+
+    Args:
+        data: Bytes of the integers.
+        typecode: Type code of the integers.
+        amount: Number of integers.
+        swap: Whether integers were saved in the other byte order.
+
+    Returns:
+        View to the bytes if they are in native byte order, otherwise a swapped
+        copy.
+
+    Raises:
+        ValueError: if there are less bytes than integers need.
+    """
+    if len(data) != amount * array(typecode).itemsize:
+        raise ValueError("Problem file is truncated or corrupted.")
+    if swap:
+        values = array(typecode, data.tobytes())
+        values.byteswap()
+        return values
+    return data.cast(typecode)  # type: ignore
+
+
+def _encode_table(values: Sequence[Any]) -> Tuple[int, bytes]:
+    """Encode elements or subset ids.
+
+    Args:
+        values: Elements or subset ids to encode.
+
+    Returns:
+        Kind of the table and its bytes.
+
+    Raises:
+        ValueError: if some value can't be encoded.
+    """
+    if all(type(value) is int for value in values):
+        try:
+            return INTEGER_TABLE, _native_bytes(values, "q")
+        except OverflowError:
+            pass
+    encoded = bytearray(_COUNT.pack(len(values)))
+    for value in values:
+        encode_value(value, encoded)
+    return VALUE_TABLE, bytes(encoded)
+
+
+def _decode_table(
+    data: memoryview, kind: int, amount: int, swap: bool
+) -> Sequence[Any]:
+    """Decode elements or subset ids.
+
+    Args:
+        data: Bytes of the table.
+        kind: Kind of the table.
+        amount: Number of values in the table.
+        swap: Whether integer tables were saved in the other byte order.
+
+    Returns:
+        Values of the table, a view to the bytes for integer tables.
+
+    Raises:
+        ValueError: if table is corrupted.
+    """
+    if kind == INTEGER_TABLE:
+        return _integers(data, "q", amount, swap)
+    if kind != VALUE_TABLE:
+        raise ValueError(f"Unknown table kind {kind} in problem file.")
+    values = []
+    offset = _COUNT.size
+    try:
+        for _ in range(amount):
+            value, offset = _decode_value(data, offset)
+            values.append(value)
+    except (IndexError, struct.error, UnicodeDecodeError):
+        raise ValueError("Problem file is truncated or corrupted.") from None
+    return values
+
+
+def encode_value(value: Any, encoded: bytearray) -> None:
+    """Append tagged value to encoded bytes.
+
+    Encoding is canonical: equal values of supported types always give the same
+    bytes, so it can be hashed to identify values too.
+
+    Args:
+        value: Value to encode.
+        encoded: Bytes encoded so far.
+
+    Raises:
+        ValueError: if value or some value inside it has unsupported type.
+    """
+    _encode_value(value, encoded, 0)
+
+
+def _encode_value(value: Any, encoded: bytearray, depth: int) -> None:
+    """Append tagged value nested in given number of tuples to encoded bytes.
+
+    Args:
+        value: Value to encode.
+        encoded: Bytes encoded so far.
+        depth: Number of tuples value is inside of.
+
+    Raises:
+        ValueError: if value has unsupported type or is nested too deeply.
+    """
+    if value is None:
+        encoded += b"n"
+    elif value is True or value is False:
+        encoded += b"t" if value else b"f"
+    elif type(value) is int:
+        if -(2**63) <= value < 2**63:
+            encoded += b"i" + _INTEGER.pack(value)
+        else:
+            data = str(value).encode()
+            encoded += b"I" + _LENGTH.pack(len(data)) + data
+    elif type(value) is float:
+        encoded += b"d" + _FLOAT.pack(value)
+    elif type(value) is str:
+        data = value.encode()
+        encoded += b"s" + _LENGTH.pack(len(data)) + data
+    elif type(value) is bytes:
+        encoded += b"b" + _LENGTH.pack(len(value)) + value
+    elif type(value) is tuple:
+        if depth >= _MAX_NESTING:
+            raise ValueError(f"Can't save tuples nested over {_MAX_NESTING} deep.")
+        encoded += b"(" + _LENGTH.pack(len(value))
+        for item in value:
+            _encode_value(item, encoded, depth + 1)
+    else:
+        raise ValueError(f"Can't save value {value!r} of type {type(value)}.")
+
+
+def _decode_value(data: memoryview, offset: int, depth: int = 0) -> Tuple[Any, int]:
+    """Decode tagged value starting from given offset.
+
+    Args:
+        data: Encoded bytes.
+        offset: Offset of the value's tag.
+        depth: Number of tuples value is inside of.
+
+    Returns:
+        Decoded value and offset right after it.
+
+    Raises:
+        ValueError: if tag is unknown or tuples are nested too deeply.
+    """
+    tag = data[offset : offset + 1].tobytes()
+    offset += 1
+    if tag == b"n":
+        return None, offset
+    if tag in [b"t", b"f"]:
+        return tag == b"t", offset
+    if tag == b"i":
+        return _INTEGER.unpack_from(data, offset)[0], offset + _INTEGER.size
+    if tag == b"d":
+        return _FLOAT.unpack_from(data, offset)[0], offset + _FLOAT.size
+    if tag == b"(":
+        if depth >= _MAX_NESTING:
+            raise ValueError("Values in problem file are nested too deeply.")
+        (length,) = _LENGTH.unpack_from(data, offset)
+        offset += _LENGTH.size
+        items = []
+        for _ in range(length):
+            item, offset = _decode_value(data, offset, depth + 1)
+            items.append(item)
+        return tuple(items), offset
+    if tag in [b"I", b"s", b"b"]:
+        (length,) = _LENGTH.unpack_from(data, offset)
+        offset += _LENGTH.size
+        raw = data[offset : offset + length].tobytes()
+        if len(raw) != length:
+            raise IndexError("Value continues past the end of the table.")
+        offset += length
+        if tag == b"I":
+            return int(raw.decode()), offset
+        if tag == b"s":
+            return raw.decode(), offset
+        return raw, offset
+    raise ValueError(f"Unknown value tag {tag!r} in problem file.")
@@ -0,0 +1,83 @@
+"""Columns grouped to doubly linked buckets by their size.
+
+Buckets let column selection find a column with fewest rows without scanning the
+whole header list. Columns move between neighbouring buckets when their size
+changes, and the index of the smallest possibly nonempty bucket is only moved up
+when a column is chosen, so choosing takes amortized constant time.
+"""
+from typing import cast, Generic, List, TypeVar
+
+
+class BucketNode:
+    """Node in a bucket list, subclassed by columns kept in buckets.
+
+    Attributes:
+        bucket_left: Previous node in the bucket.
+        bucket_right: Next node in the bucket.
+    """
+
+    def __init__(self) -> None:
+        """Initialize node linked to itself."""
+        self.bucket_left: BucketNode = self
+        self.bucket_right: BucketNode = self
+
+
+Node = TypeVar("Node", bound=BucketNode)
+
+
+class SizeBuckets(Generic[Node]):
+    """Circular doubly linked list of nodes for each size."""
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize empty buckets.
+
+        Args:
+            max_size: Largest size a node can have.
+        """
+        self._heads: List[BucketNode] = [BucketNode() for _ in range(max_size + 1)]
+        self._minimum = max_size + 1
+
+    def insert(self, node: Node, size: int) -> None:
+        """Link node to the end of the bucket of given size.
+
+        Args:
+            node: Node not in any bucket.
+            size: Current size of the node.
+        """
+        head = self._heads[size]
+        node.bucket_left = head.bucket_left
+        node.bucket_right = head
+        head.bucket_left.bucket_right = node
+        head.bucket_left = node
+        if size < self._minimum:
+            self._minimum = size
+
+    @staticmethod
+    def remove(node: Node) -> None:
+        """Unlink node from its bucket.
+
+        Args:
+            node: Node in some bucket.
+        """
+        node.bucket_left.bucket_right = node.bucket_right
+        node.bucket_right.bucket_left = node.bucket_left
+
+    def first(self) -> Node:
+        """Find node that has been longest in the smallest nonempty bucket.
+
+        Returns:
+            Node with smallest size.
+
+        Raises:
+            ValueError: if all buckets are empty.
+        """
+        heads = self._heads
+        size = self._minimum
+        while size < len(heads):
+            head = heads[size]
+            if head.bucket_right is not head:
+                self._minimum = size
+                return cast(Node, head.bucket_right)
+            size += 1
+        self._minimum = size
+        raise ValueError("No columns left in size buckets.")
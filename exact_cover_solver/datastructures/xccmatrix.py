@@ -0,0 +1,99 @@
+"""Exact cover matrix with colored secondary columns implemented with dancing links.
+
+In generalized exact cover with colors (XCC), subset can give a color to any of its
+secondary elements. Subsets giving the same color to an element can be picked to the
+same solution, while uncolored secondary elements can still be covered at most once.
+"""
+from typing import Hashable, Optional
+
+from .compiled import Problem, unpack_problem_data
+from .dlxmatrix import DLXMatrix
+from .dlxdataobjects import ColoredDataObject, ColumnObject, DataObject
+from exact_cover_solver.types import (
+    SubsetColors,
+    SubsetId,
+    UniverseElement,
+)
+
+
+class XCCMatrix(DLXMatrix):
+    """Exact cover matrix with colored secondary columns."""
+
+    def __init__(
+        self,
+        problem: Problem,
+        colors: Optional[SubsetColors] = None,
+        trusted: bool = False,
+    ) -> None:
+        """Initialize matrix with colors of subset elements.
+
+        Args:
+            problem: Data needed to create matrix, or problem compiled from it.
+            colors: Colors of secondary elements for each subset. Elements without
+                a color can't be shared with other subsets.
+            trusted: Skip validation of data and colors known to be valid.
+        """
+        self._colors: SubsetColors = colors or {}
+        super().__init__(problem, trusted=trusted)
+
+    def _create(self) -> None:
+        """Validate colors unless trusted, then create column and data objects."""
+        if not self._trusted:
+            self._validate_colors()
+        super()._create()
+
+    def _validate_colors(self) -> None:
+        """Check that colors are only given to secondary elements of subsets.
+
+        Raises:
+            ValueError: if colored subset or element is not found, or element is
+                not secondary.
+        """
+        _, subset_collection, _ = unpack_problem_data(self.problem_data)
+        column_index = self._compiled.column_index
+        primary_amount = self._compiled.primary_amount
+        for subset_id, element_colors in self._colors.items():
+            if subset_id not in subset_collection:
+                raise ValueError(f"Colors given for unknown subset {subset_id}.")
+            subset = subset_collection[subset_id]
+            for element in element_colors:
+                if element not in subset:
+                    raise ValueError(
+                        f"Color given for element {element} not in subset "
+                        f"{subset_id}."
+                    )
+                if column_index[element] < primary_amount:
+                    raise ValueError(
+                        f"Only secondary elements can have colors, got {element}."
+                    )
+
+    def _row_key(self, row: int) -> Hashable:
+        """Get key telling which rows are identical, colors included.
+
+        Args:
+            row: Index of the row in compiled problem.
+
+        Returns:
+            Key that is equal for rows with the same columns and colors.
+        """
+        subset_id = self._compiled.row_ids[row]
+        return (
+            frozenset(self._compiled.row(row)),
+            frozenset(self._colors.get(subset_id, {}).items()),
+        )
+
+    def _create_data_object(
+        self, column: ColumnObject, subset_id: SubsetId, element: UniverseElement
+    ) -> DataObject:
+        """Create data object with color of the element in given subset.
+
+        Args:
+            column: Column object data object is linked to.
+            subset_id: Id of the subset data object belongs to.
+            element: Element data object represents in the subset.
+
+        Returns:
+            Created colored data object.
+        """
+        color = self._colors.get(subset_id, {}).get(element)
+        return ColoredDataObject(column, subset_id, color)
@@ -0,0 +1,6 @@
+"""Package for preprocessing problems before matrices are built.
+
+Defines imports for things that can be imported directly from this package.
+"""
+from .components import combine, decompose
+from .reduction import reduce, ReducedProblem
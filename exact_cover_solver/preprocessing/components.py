@@ -0,0 +1,107 @@
+"""Decomposition of exact cover problems to independent components.
+
+Columns are connected if some row has both of them. Rows of different connected
+components never conflict, so every solution is a union of one solution from each
+component. Components can be searched separately and the number of solutions of the
+whole problem is the product of their solution counts, which can be a lot less work
+than searching through the cross product.
+"""
+from itertools import product
+from typing import Dict, Hashable, Iterable, Iterator, List
+
+from exact_cover_solver.datastructures.compiled import unpack_problem_data
+from exact_cover_solver.datastructures.matrix_base import Matrix
+from exact_cover_solver.types import ProblemData, Solution
+
+
+def decompose(problem_data: ProblemData) -> List[ProblemData]:
+    """Split problem to connected components.
+
+    Components without primary columns are left out, since choosing no rows is
+    their only solution. If some primary column has no rows, problem has no
+    solutions and it's returned as it is.
+
+    Args:
+        problem_data: Data needed to create an exact cover problem matrix.
+
+    Returns:
+        Problem data of each component, ordered by their first primary column.
+
+    Raises:
+        ValueError: if problem data is invalid.
+    """
+    universe, subset_collection, secondary_universe = unpack_problem_data(
+        Matrix._validate_problem_data(problem_data)
+    )
+    parents: Dict[Hashable, Hashable] = {
+        element: element for element in [*universe, *secondary_universe]
+    }
+    for subset in subset_collection.values():
+        root = _find(parents, subset[0])
+        for element in subset[1:]:
+            other_root = _find(parents, element)
+            if other_root != root:
+                parents[other_root] = root
+    covered = {element for subset in subset_collection.values() for element in subset}
+    if any(element not in covered for element in universe):
+        return [problem_data]
+    roots = {element: _find(parents, element) for element in parents}
+    universes: Dict[Hashable, List[Hashable]] = {}
+    for element in universe:
+        universes.setdefault(roots[element], []).append(element)
+    if len(universes) == 1:
+        return [problem_data]
+    collections: Dict[Hashable, Dict[Hashable, List[Hashable]]] = {
+        root: {} for root in universes
+    }
+    for subset_id, subset in subset_collection.items():
+        root = roots[subset[0]]
+        if root in collections:
+            collections[root][subset_id] = subset
+    secondary_universes: Dict[Hashable, List[Hashable]] = {
+        root: [] for root in universes
+    }
+    for element in secondary_universe:
+        if roots[element] in secondary_universes:
+            secondary_universes[roots[element]].append(element)
+    components: List[ProblemData] = []
+    for root, component_universe in universes.items():
+        if secondary_universes[root]:
+            components.append(
+                (component_universe, collections[root], secondary_universes[root])
+            )
+        else:
+            components.append((component_universe, collections[root]))
+    return components
+
+
+def combine(component_solutions: Iterable[Iterable[Solution]]) -> Iterator[Solution]:
+    """Combine solutions of components lazily to solutions of the whole problem.
+
+    Solutions of components are collected when the first solution is requested, but
+    their cross product is never stored.
+
+    Args:
+        component_solutions: Solutions of each component.
+
+    Returns:
+        Iterator over solutions, rows of each component in the component order.
+    """
+    for parts in product(*component_solutions):
+        yield [subset_id for part in parts for subset_id in part]
+
+
+def _find(parents: Dict[Hashable, Hashable], element: Hashable) -> Hashable:
+    """Find root of element's component, halving the path on the way.
+
+    Args:
+        parents: Parent of each element, roots being their own parents.
+        element: Element to find root for.
+
+    Returns:
+        Root of the component.
+    """
+    while parents[element] != element:
+        parents[element] = parents[parents[element]]
+        element = parents[element]
+    return element
@@ -0,0 +1,349 @@
+"""Reduction of exact cover problems before search.
+
+Works in the spirit of Knuth's DLX-PRE. Reduction rules are applied until none of
+them changes the problem anymore:
+- Column without rows can't be covered, so problem has no solutions.
+- Column with a single row forces that row to every solution. Row is recorded and
+  removed together with its columns and all rows conflicting with it.
+- Row conflicting with every row of some primary column can't be in any solution,
+  since that column couldn't be covered anymore.
+- If rows of column a are a subset of rows of column b, row covering a also covers
+  b, so rest of the rows of b can be removed and b becomes a duplicate of a. When
+  a is primary, b is removed. Secondary column with rows being a subset of another
+  column's rows never rules out anything by itself, so it's removed.
+- Row without primary columns is never picked by algorithm X, and secondary column
+  with at most one row never rules out anything, so they are removed.
+
+Solutions of the reduced problem are solutions of the original one once forced
+rows are added back to them.
+"""
+from typing import Dict, Hashable, List, Optional, Set
+
+from exact_cover_solver.datastructures.compiled import unpack_problem_data
+from exact_cover_solver.datastructures.matrix_base import Matrix
+from exact_cover_solver.types import (
+    ProblemData,
+    SecondaryUniverse,
+    Solution,
+    SubsetCollection,
+    Universe,
+)
+
+RowIds = List[Hashable]
+RowSet = Set[Hashable]
+Columns = Dict[Hashable, RowSet]
+
+
+class ReducedProblem:
+    """Problem left after reduction and the rows reduction forced.
+
+    Attributes:
+        problem_data: Reduced problem data, None if reduction already decided the
+            problem, i.e. all primary columns were covered by forced rows or some
+            column couldn't be covered.
+        forced: Ids of rows forced to every solution.
+        feasible: False if reduction found a column that can't be covered.
+        removed_rows: Ids of rows removed as they can't be in any solution.
+        removed_columns: Columns removed as duplicates or unnecessary.
+    """
+
+    def __init__(
+        self,
+        problem_data: Optional[ProblemData],
+        forced: RowIds,
+        feasible: bool,
+        removed_rows: RowIds,
+        removed_columns: List[Hashable],
+    ) -> None:
+        """Initialize reduced problem.
+
+        Args:
+            problem_data: Reduced problem data, None if problem was decided.
+            forced: Ids of rows forced to every solution.
+            feasible: Whether problem can still have solutions.
+            removed_rows: Ids of rows removed as they can't be in any solution.
+            removed_columns: Columns removed as duplicates or unnecessary.
+        """
+        self.problem_data = problem_data
+        self.forced = forced
+        self.feasible = feasible
+        self.removed_rows = removed_rows
+        self.removed_columns = removed_columns
+
+    @property
+    def solutions(self) -> List[Solution]:
+        """Get solutions of a problem reduction decided.
+
+        Returns:
+            List with the forced rows as the only solution if problem was solved by
+            reduction, empty list if it has no solutions.
+
+        Raises:
+            ValueError: if problem still needs to be searched.
+        """
+        if self.problem_data is not None:
+            raise ValueError("Reduced problem still needs to be searched.")
+        return [self.forced[:]] if self.feasible else []
+
+    def expand(self, solution: Solution) -> Solution:
+        """Add forced rows to solution of the reduced problem.
+
+        Args:
+            solution: Solution of the reduced problem.
+
+        Returns:
+            Solution of the original problem, forced rows first.
+        """
+        return self.forced + solution
+
+
+def reduce(problem_data: ProblemData) -> ReducedProblem:
+    """Reduce problem by applying reduction rules until nothing changes.
+
+    Args:
+        problem_data: Data needed to create an exact cover problem matrix.
+
+    Returns:
+        Reduced problem with the forced rows.
+
+    Raises:
+        ValueError: if problem data is invalid.
+    """
+    universe, subset_collection, secondary_universe = unpack_problem_data(
+        Matrix._validate_problem_data(problem_data)
+    )
+    return _Reduction(universe, subset_collection, secondary_universe).run()
+
+
+class _Reduction:
+    """State of a single reduction.
+
+    Attributes:
+        _rows: Elements of each live row.
+        _columns: Live rows of each live column.
+        _primary: Live primary columns.
+    """
+
+    def __init__(
+        self,
+        universe: Universe,
+        subset_collection: SubsetCollection,
+        secondary_universe: SecondaryUniverse,
+    ) -> None:
+        """Create columns and rows of the problem.
+
+        Args:
+            universe: Primary elements of the problem.
+            subset_collection: Rows of the problem.
+            secondary_universe: Secondary elements of the problem.
+        """
+        self._universe = universe
+        self._subset_collection = subset_collection
+        self._secondary_universe = secondary_universe
+        self._rows = {
+            subset_id: list(subset) for subset_id, subset in subset_collection.items()
+        }
+        self._columns: Columns = {
+            element: set() for element in [*universe, *secondary_universe]
+        }
+        for subset_id, subset in subset_collection.items():
+            for element in subset:
+                self._columns[element].add(subset_id)
+        self._primary = set(universe)
+        self._forced: RowIds = []
+        self._removed_rows: RowIds = []
+        self._removed_columns: List[Hashable] = []
+        self._feasible = True
+
+    def run(self) -> ReducedProblem:
+        """Apply reduction rules until nothing changes.
+
+        Returns:
+            Reduced problem.
+        """
+        for subset_id, subset in list(self._rows.items()):
+            if self._primary.isdisjoint(subset):
+                self._remove_row(subset_id)
+        changed = True
+        while changed and self._feasible and self._primary:
+            changed = self._force_single_rows()
+            if not self._feasible:
+                break
+            changed = self._reduce_dominated_columns() or changed
+            changed = self._remove_blocking_rows() or changed
+        return ReducedProblem(
+            self._problem_data(),
+            self._forced,
+            self._feasible,
+            self._removed_rows,
+            self._removed_columns,
+        )
+
+    def _force_single_rows(self) -> bool:
+        """Force rows that are the only ones in their column.
+
+        Returns:
+            True if some row was forced.
+        """
+        changed = False
+        for element in self._primary_columns():
+            if element not in self._primary:
+                continue
+            rows = self._columns[element]
+            if not rows:
+                self._feasible = False
+                return changed
+            if len(rows) == 1:
+                self._force_row(next(iter(rows)))
+                changed = True
+        return changed
+
+    def _reduce_dominated_columns(self) -> bool:
+        """Remove rows and columns made redundant by columns with fewer rows.
+
+        Returns:
+            True if some row or column was removed.
+        """
+        changed = False
+        for element in list(self._columns):
+            if element not in self._columns:
+                continue
+            rows = self._columns[element]
+            if element not in self._primary:
+                if len(rows) <= 1 or self._has_superset_column(element):
+                    self._remove_column(element)
+                    changed = True
+                continue
+            if not rows:
+                continue
+            row = next(iter(rows))
+            for other_element in self._rows[row]:
+                if other_element == element or other_element not in self._columns:
+                    continue
+                other_rows = self._columns[other_element]
+                if not rows <= other_rows:
+                    continue
+                for other_row in list(other_rows - rows):
+                    self._remove_row(other_row)
+                self._remove_column(other_element)
+                changed = True
+        return changed
+
+    def _has_superset_column(self, element: Hashable) -> bool:
+        """Check if rows of given column are a subset of another column's rows.
+
+        Args:
+            element: Column to check, should have rows.
+
+        Returns:
+            True if some other live column has all the rows of given column.
+        """
+        rows = self._columns[element]
+        row = next(iter(rows))
+        return any(
+            other_element != element
+            and other_element in self._columns
+            and rows <= self._columns[other_element]
+            for other_element in self._rows[row]
+        )
+
+    def _remove_blocking_rows(self) -> bool:
+        """Remove rows that conflict with every row of some primary column.
+
+        Returns:
+            True if some row was removed.
+        """
+        changed = False
+        for element in self._primary_columns():
+            if element not in self._primary:
+                continue
+            blocked: Optional[RowSet] = None
+            for row in self._columns[element]:
+                neighbours = self._neighbours(row)
+                blocked = neighbours if blocked is None else blocked & neighbours
+                if not blocked:
+                    break
+            for row in blocked or ():
+                self._remove_row(row)
+                changed = True
+        return changed
+
+    def _neighbours(self, row: Hashable) -> RowSet:
+        """Find rows conflicting with given row.
+
+        Args:
+            row: Id of a live row.
+
+        Returns:
+            Rows sharing a live column with given row.
+        """
+        neighbours: RowSet = set()
+        for element in self._rows[row]:
+            if element in self._columns:
+                neighbours.update(self._columns[element])
+        neighbours.discard(row)
+        return neighbours
+
+    def _primary_columns(self) -> List[Hashable]:
+        """List live primary columns in their original order.
+
+        Returns:
+            Live primary columns.
+        """
+        return [element for element in self._columns if element in self._primary]
+
+    def _force_row(self, row: Hashable) -> None:
+        """Pick row to every solution and remove it, its columns and conflicts.
+
+        Args:
+            row: Id of a live row.
+        """
+        self._forced.append(row)
+        for other_row in self._neighbours(row):
+            self._remove_row(other_row)
+        for element in self._rows.pop(row):
+            if element in self._columns:
+                del self._columns[element]
+                self._primary.discard(element)
+
+    def _remove_row(self, row: Hashable) -> None:
+        """Remove row from its columns.
+
+        Args:
+            row: Id of a live row.
+        """
+        for element in self._rows.pop(row):
+            if element in self._columns:
+                self._columns[element].discard(row)
+        self._removed_rows.append(row)
+
+    def _remove_column(self, element: Hashable) -> None:
+        """Remove column without touching its rows.
+
+        Args:
+            element: Live column.
+        """
+        del self._columns[element]
+        self._primary.discard(element)
+        self._removed_columns.append(element)
+
+    def _problem_data(self) -> Optional[ProblemData]:
+        """Create problem data from live rows and columns.
+
+        Returns:
+            Problem data in the original order, None if problem was decided.
+        """
+        if not self._feasible or not self._primary:
+            return None
+        universe = [element for element in self._universe if element in self._primary]
+        subset_collection = {
+            subset_id: [element for element in subset if element in self._columns]
+            for subset_id, subset in self._subset_collection.items()
+            if subset_id in self._rows
+        }
+        secondary_universe = [
+            element for element in self._secondary_universe if element in self._columns
+        ]
+        if secondary_universe:
+            return universe, subset_collection, secondary_universe
+        return universe, subset_collection
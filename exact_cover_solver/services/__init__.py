@@ -3,4 +3,5 @@
 Defines imports for things that can be imported directly from this package.
 """
 
+from .cache import SolutionCache
 from .solver import Solver
@@ -0,0 +1,131 @@
+"""Cache of solutions for problems solved repeatedly.
+
+Problems are keyed by a SHA-256 digest of their canonical encoding, so equal problem
+data built again for every request finds the solutions of an earlier request.
+Solutions are stored as tuples, which are immutable, so callers can't change an
+entry. They are given to callers as lists, the same as algorithms return them.
+"""
+import hashlib
+import sys
+from threading import Lock
+from typing import Hashable, List, Optional, Tuple, Union
+
+from exact_cover_solver.datastructures import LRUCache
+from exact_cover_solver.datastructures.compiled import unpack_problem_data
+from exact_cover_solver.datastructures.problemfile import encode_value
+from exact_cover_solver.types import ProblemData, Solution
+
+CachedSolutions = Tuple[Tuple[Hashable, ...], ...]
+CacheValue = Union[int, CachedSolutions]
+
+
+def problem_key(problem_data: ProblemData, *options: Hashable) -> Optional[bytes]:
+    """Hash problem data and options affecting its solutions.
+
+    Args:
+        problem_data: Data needed to create an exact cover problem matrix.
+        options: Anything else affecting solutions, e.g. name of the algorithm.
+
+    Returns:
+        Digest identifying the problem, None if some element, subset id or option
+        can't be encoded canonically.
+    """
+    universe, subset_collection, secondary_universe = unpack_problem_data(problem_data)
+    encoded = bytearray()
+    try:
+        encode_value(tuple(options), encoded)
+        encode_value(tuple(universe), encoded)
+        encode_value(tuple(secondary_universe), encoded)
+        for subset_id, subset in subset_collection.items():
+            encode_value(subset_id, encoded)
+            encode_value(tuple(subset), encoded)
+    except ValueError:
+        return None
+    return hashlib.sha256(encoded).digest()
+
+
+class SolutionCache:
+    """Thread safe cache of solutions and solution counts.
+
+    Entries are evicted least recently used first when there are too many of them
+    or they take too many bytes.
+    """
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = 64 * 1024**2) -> None:
+        """Initialize empty cache.
+
+        Args:
+            max_entries: How many problems cache can hold.
+            max_bytes: How many bytes stored solutions can take, measured as sizes
+                of the tuples. Subset ids are shared with problem data, so they
+                aren't counted.
+
+        Raises:
+            ValueError: if max entries or max bytes is not positive.
+        """
+        self._entries: "LRUCache[bytes, CacheValue]" = LRUCache(max_entries, max_bytes)
+        self._lock = Lock()
+
+    @property
+    def hits(self) -> int:
+        """Get number of lookups that found an entry.
+
+        Returns:
+            Number of hits.
+        """
+        return self._entries.hits
+
+    @property
+    def misses(self) -> int:
+        """Get number of lookups that didn't find an entry.
+
+        Returns:
+            Number of misses.
+        """
+        return self._entries.misses
+
+    @property
+    def bytes_used(self) -> int:
+        """Get number of bytes stored solutions take.
+
+        Returns:
+            Sum of sizes of the entries.
+        """
+        return self._entries.bytes_used
+
+    def get(self, key: bytes) -> Optional[Union[int, List[Solution]]]:
+        """Get solutions or solution count stored for key.
+
+        Args:
+            key: Key of the problem.
+
+        Returns:
+            Stored count, copy of the stored solutions as lists, or None if there's
+            no entry.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+        if isinstance(value, tuple):
+            return [list(solution) for solution in value]
+        return value
+
+    def put(self, key: bytes, value: CacheValue) -> None:
+        """Store solutions or solution count for key.
+
+        Args:
+            key: Key of the problem.
+            value: Tuple of solutions, each a tuple of subset ids, or a count.
+        """
+        size = sys.getsizeof(key) + sys.getsizeof(value)
+        if isinstance(value, tuple):
+            size += sum(sys.getsizeof(solution) for solution in value)
+        with self._lock:
+            self._entries.put(key, value, size)
+
+    def __len__(self) -> int:
+        """Get number of stored entries.
+
+        Returns:
+            Number of entries.
+        """
+        return len(self._entries)
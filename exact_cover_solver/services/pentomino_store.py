@@ -0,0 +1,185 @@
+"""Precomputed solutions of the pentomino boards.
+
+Pentomino problem has only four boards and their solutions never change, so they
+are searched once offline and stored to a file shipped with the package. Each
+solution is stored as the subset ids of its placements, which are indices of the
+placements in the problem data, two bytes each.
+
+Store is loaded when solutions are requested for the first time. File ends with a
+SHA-256 checksum of its contents, and each board has the key of the problem data it
+was solved from. Board whose problem data has changed since, e.g. because placements
+are generated in a different order, is stale and has to be searched again.
+
+Rebuild the store with invoke pentomino-store.
+"""
+import hashlib
+import os
+import struct
+import sys
+import warnings
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from .cache import problem_key
+from exact_cover_solver.algos import DLX
+from exact_cover_solver.data_creators import PentominoCreator
+from exact_cover_solver.datastructures import DLXMatrix
+from exact_cover_solver.types import ProblemData, Solution
+
+STORE_PATH = os.path.join(os.path.dirname(__file__), "pentomino_solutions.bin")
+BOARDS = [(3, 20), (4, 15), (5, 12), (6, 10)]
+MAGIC = b"ECPS"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHH")
+_BOARD = struct.Struct("<BBBxI32s")
+_CHECKSUM_SIZE = hashlib.sha256().digest_size
+
+Board = Tuple[int, int]
+StoredBoard = Tuple[bytes, int, array]
+
+
+class PentominoStore:
+    """Lazily loaded solutions of pentomino boards."""
+
+    def __init__(self, path: str = STORE_PATH) -> None:
+        """Initialize store without loading it.
+
+        Args:
+            path: Path of the store file.
+        """
+        self._path = path
+        self._boards: Optional[Dict[Board, StoredBoard]] = None
+        self._checked: Dict[Board, bool] = {}
+
+    def solutions(
+        self, height: int, width: int, problem_data: ProblemData
+    ) -> Optional[List[Solution]]:
+        """Get stored solutions of a board.
+
+        Args:
+            height: Height of the pentomino board.
+            width: Width of the pentomino board.
+            problem_data: Current problem data of the board, checked against the
+                key stored with the solutions on the first request.
+
+        Returns:
+            Solutions in the order DLX found them, None if board is not stored, store
+            is missing or corrupted, or solutions are stale.
+        """
+        if self._boards is None:
+            self._boards = self._load()
+        board = (height, width)
+        if board not in self._boards:
+            return None
+        key, pieces, placements = self._boards[board]
+        if board not in self._checked:
+            self._checked[board] = key == problem_key(problem_data)
+            if not self._checked[board]:
+                warnings.warn(
+                    f"Stored solutions of {height}x{width} pentomino board are "
+                    "stale, searching them instead. Rebuild the store."
+                )
+        if not self._checked[board]:
+            return None
+        return [
+            placements[start : start + pieces].tolist()
+            for start in range(0, len(placements), pieces)
+        ]
+
+    def _load(self) -> Dict[Board, StoredBoard]:
+        """Read boards from the store file.
+
+        Returns:
+            Key of the problem data, number of pieces in each solution and
+            placements of the solutions for each board, nothing if file is missing,
+            can't be read or is corrupted.
+        """
+        if not os.path.exists(self._path):
+            return {}
+        try:
+            with open(self._path, "rb") as file:
+                return read_store(file.read())
+        except (ValueError, OSError) as error:
+            warnings.warn(f"Pentomino store {self._path} can't be used: {error}")
+            return {}
+
+
+def read_store(content: bytes) -> Dict[Board, StoredBoard]:
+    """Decode boards from contents of a store file.
+
+    Args:
+        content: Contents of the file.
+
+    Returns:
+        Key of the problem data, number of pieces in each solution and placements
+        of the solutions for each board.
+
+    Raises:
+        ValueError: if checksum doesn't match, file is not a store or its version
+            is not supported.
+    """
+    data, checksum = content[:-_CHECKSUM_SIZE], content[-_CHECKSUM_SIZE:]
+    if hashlib.sha256(data).digest() != checksum:
+        raise ValueError("checksum doesn't match contents.")
+    magic, version, boards_amount = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("file is not a pentomino store.")
+    if version != VERSION:
+        raise ValueError(f"version {version} is not supported.")
+    boards: Dict[Board, StoredBoard] = {}
+    offset = _HEADER.size
+    for _ in range(boards_amount):
+        height, width, pieces, solutions, key = _BOARD.unpack_from(data, offset)
+        offset += _BOARD.size
+        placements = array("H")
+        placements.frombytes(data[offset : offset + solutions * pieces * 2])
+        if sys.byteorder == "big":
+            placements.byteswap()
+        offset += solutions * pieces * 2
+        boards[height, width] = key, pieces, placements
+    return boards
+
+
+def write_store(path: str, boards: Dict[Board, List[Solution]]) -> None:
+    """Write solutions of boards to a store file.
+
+    Args:
+        path: Path of the file, overwritten if it exists.
+        boards: Solutions of each board in the order they should be served.
+
+    Raises:
+        ValueError: if solutions of a board don't all have the same number of
+            placements.
+    """
+    data = bytearray(_HEADER.pack(MAGIC, VERSION, len(boards)))
+    creator = PentominoCreator()
+    for (height, width), solutions in boards.items():
+        pieces = len(solutions[0]) if solutions else 0
+        if any(len(solution) != pieces for solution in solutions):
+            raise ValueError(f"Solutions of {height}x{width} board differ in size.")
+        key = problem_key(creator.create_problem_data(height, width))
+        data += _BOARD.pack(height, width, pieces, len(solutions), key)
+        placements = array("H", [row for solution in solutions for row in solution])
+        if sys.byteorder == "big":
+            placements.byteswap()
+        data += placements.tobytes()
+    with open(path, "wb") as file:
+        file.write(data + hashlib.sha256(data).digest())
+
+
+def build_store(path: str = STORE_PATH, workers: int = 1) -> None:
+    """Search solutions of every pentomino board and write them to a store file.
+
+    Args:
+        path: Path of the file, overwritten if it exists.
+        workers: Number of worker processes to split search to.
+    """
+    creator = PentominoCreator()
+    boards = {
+        (height, width): DLX(workers=workers).solve(
+            DLXMatrix(creator.create_problem_data(height, width), trusted=True)
+        )
+        for height, width in BOARDS
+    }
+    write_store(path, boards)
@@ -1,62 +1,282 @@
 """Solver service, handles different solving modes."""
-from typing import List
+import sys
+import time
+from functools import partial
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from exact_cover_solver.translator import Translator, PentominoBoard, SudokuBoard
-from exact_cover_solver.algos import DictX, DLX
+from exact_cover_solver.algos import (
+    ArrayDLX,
+    BitX,
+    DictX,
+    DLX,
+    STRATEGIES,
+    SearchLimits,
+    SearchResult,
+    SolveStats,
+)
+from exact_cover_solver.algos.algox_base import AlgorithmX
 from exact_cover_solver.data_creators import (
     PentominoCreator,
     SudokuCreator,
     SudokuInput,
 )
-from exact_cover_solver.datastructures import DictMatrix, DLXMatrix
+from exact_cover_solver.datastructures import (
+    ArrayMatrix,
+    BitMatrix,
+    DictMatrix,
+    DLXMatrix,
+)
+from exact_cover_solver.datastructures.compiled import (
+    CompiledProblem,
+    Problem,
+    unpack_problem_data,
+)
+from exact_cover_solver.datastructures.matrix_base import Matrix
+from exact_cover_solver.preprocessing import combine, decompose, reduce, ReducedProblem
 from exact_cover_solver.types import Solution, ProblemData, Subset
+from .cache import problem_key, SolutionCache
+from .pentomino_store import PentominoStore
+
+ALGORITHMS: Dict[str, Tuple[Type[AlgorithmX], Type[Matrix]]] = {
+    "DLX": (DLX, DLXMatrix),
+    "DictX": (DictX, DictMatrix),
+    "ArrayDLX": (ArrayDLX, ArrayMatrix),
+    "BitX": (BitX, BitMatrix),
+}
+STRATEGY_ALGORITHMS = ["DLX", "DictX"]
+INSTRUMENTED_ALGORITHMS = ["DLX", "DictX"]
+
+MatrixFactory = Callable[[Problem], Matrix]
+
+T = TypeVar("T")
+
+PENTOMINO_STORE = PentominoStore()
 
 
 class Solver:
     """Class for solving an exact cover problem from given input."""
 
+    def __init__(
+        self,
+        workers: int = 1,
+        split_depth: int = 2,
+        strategy: str = "MRV",
+        collect_stats: bool = False,
+        reduce: bool = False,
+        decompose: bool = False,
+        cache: Optional[SolutionCache] = None,
+        precomputed: bool = False,
+    ) -> None:
+        """Initialize solver with search options passed to algorithms.
+
+        Args:
+            workers: Number of worker processes to split search to. Solutions and
+                their count are the same as with one worker, but solutions may come
+                in a different order.
+            split_depth: How many levels of search tree to expand for workers.
+            strategy: Name of the column selection strategy, only DLX and DictX
+                support other strategies than MRV.
+            collect_stats: Record statistics of solving to stats attribute of the
+                results, only DLX and DictX support this.
+            reduce: Reduce problems before building matrices. Forced rows are added
+                back to the front of each solution, so solutions are the same as
+                without reduction, but reduced matrix branches differently and
+                solutions may come in a different order.
+            decompose: Split problems to independent connected components, which
+                are searched separately. Solutions are combined as a cross product
+                of component solutions, so they may come in a different order. Node
+                limit is split evenly between components, time limit is shared by
+                them and solution limit applies to the combined solutions.
+            cache: Cache for solutions and solution counts of problems solved
+                without limits and statistics, which can be shared by solvers.
+                Problems are not cached if None.
+            precomputed: Serve pentomino boards from the store of precomputed
+                solutions when searching without limits and statistics. Stored
+                boards come in the order serial DLX finds them, whatever the
+                algorithm, workers, reduce and decompose options are, so the
+                store is used only if asked for.
+
+        Raises:
+            ValueError: There's no strategy with the given name.
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(
+                f"Strategy {strategy} is not valid strategy. "
+                f"Valid strategies are: {list(STRATEGIES)}"
+            )
+        self._workers = workers
+        self._split_depth = split_depth
+        self._strategy = strategy
+        self._collect_stats = collect_stats
+        self._reduce_problems = reduce
+        self._decompose_problems = decompose
+        self._cache = cache
+        self._pentomino_store = PENTOMINO_STORE if precomputed else None
+
     def solve_pentomino_problem(
-        self, algorithm: str, board_height: int, board_width: int
-    ) -> List[PentominoBoard]:
+        self,
+        algorithm: str,
+        board_height: int,
+        board_width: int,
+        limits: Optional[SearchLimits] = None,
+    ) -> SearchResult[PentominoBoard]:
         """Generate needed data, solve cover problem and return solution boards.
 
+        Args:
+            algorithm: Name of the algorithm to use
+            board_height: Height of the pentomino board
+            board_width: Width of the pentomino board
+            limits: Limits for stopping search early, search is exhaustive if None.
+
+        Returns:
+            List of boards with pentominos placed, telling whether search was
+            complete.
+        """
+        pentomino_creator = PentominoCreator()
+        problem_data = pentomino_creator.create_problem_data(board_height, board_width)
+        _, subset_collection, _ = unpack_problem_data(problem_data)
+        stored = None
+        if limits is None:
+            stored = self._stored_pentomino_solutions(
+                algorithm, board_height, board_width, problem_data
+            )
+        if stored is not None:
+            solutions = SearchResult(stored)
+        else:
+            solutions = self._solve(algorithm, problem_data, limits, trusted=True)
+        return self._translate(
+            solutions,
+            lambda solutions: Translator().to_pentomino_boards(
+                solutions, board_height, board_width, subset_collection
+            ),
+        )
+
+    def iter_pentomino_solutions(
+        self, algorithm: str, board_height: int, board_width: int
+    ) -> Iterator[PentominoBoard]:
+        """Generate needed data and yield solution boards as soon as they are found.
+
         Args:
             algorithm: Name of the algorithm to use
             board_height: Height of the pentomino board
             board_width: Width of the pentomino board
 
         Returns:
-            List of boards with pentominos placed
+            Iterator over boards with pentominos placed
         """
         pentomino_creator = PentominoCreator()
         problem_data = pentomino_creator.create_problem_data(board_height, board_width)
-        _, subset_collection = problem_data
-        solutions = self._solve(algorithm, problem_data)
-        return Translator().to_pentomino_boards(
-            solutions, board_height, board_width, subset_collection
+        _, subset_collection, _ = unpack_problem_data(problem_data)
+        stored = self._stored_pentomino_solutions(
+            algorithm, board_height, board_width, problem_data
+        )
+        if stored is not None:
+            solutions: Iterator[Solution] = iter(stored)
+        else:
+            solutions = self._iter_solutions(algorithm, problem_data, trusted=True)
+        return (
+            Translator.to_pentomino_board(
+                solution, board_height, board_width, subset_collection
+            )
+            for solution in solutions
         )
 
+    def count_pentomino_solutions(
+        self, algorithm: str, board_height: int, board_width: int
+    ) -> int:
+        """Generate needed data and count solutions without translating them.
+
+        Args:
+            algorithm: Name of the algorithm to use
+            board_height: Height of the pentomino board
+            board_width: Width of the pentomino board
+
+        Returns:
+            Number of ways to place pentominos on the board
+        """
+        pentomino_creator = PentominoCreator()
+        problem_data = pentomino_creator.create_problem_data(board_height, board_width)
+        stored = self._stored_pentomino_solutions(
+            algorithm, board_height, board_width, problem_data
+        )
+        if stored is not None:
+            return len(stored)
+        return self._count(algorithm, problem_data, trusted=True)
+
     def solve_sudoku_problem(
-        self, algorithm: str, sudoku_input: SudokuInput
-    ) -> List[SudokuBoard]:
+        self,
+        algorithm: str,
+        sudoku_input: SudokuInput,
+        limits: Optional[SearchLimits] = None,
+    ) -> SearchResult[SudokuBoard]:
         """Generate needed data, solve cover problem and return solutions.
 
+        Args:
+            algorithm: Name of the algorithm to use
+            sudoku_input: Two-dimensional sudoku board, where empty cells are marked
+                          with zero and other cells have preselected numbers.
+            limits: Limits for stopping search early, search is exhaustive if None.
+
+        Returns:
+            List of correct sudoku boards, telling whether search was complete.
+        """
+        sudoku_creator = SudokuCreator()
+        problem_data = sudoku_creator.create_problem_data(sudoku_input)
+        solutions = self._solve(algorithm, problem_data, limits)
+        return self._translate(solutions, Translator().to_sudoku_boards)
+
+    def iter_sudoku_solutions(
+        self, algorithm: str, sudoku_input: SudokuInput
+    ) -> Iterator[SudokuBoard]:
+        """Generate needed data and yield solutions as soon as they are found.
+
         Args:
             algorithm: Name of the algorithm to use
             sudoku_input: Two-dimensional sudoku board, where empty cells are marked
                           with zero and other cells have preselected numbers.
 
         Returns:
-            List of correct sudoku boards.
+            Iterator over correct sudoku boards.
         """
         sudoku_creator = SudokuCreator()
         problem_data = sudoku_creator.create_problem_data(sudoku_input)
-        solutions = self._solve(algorithm, problem_data)
-        return Translator().to_sudoku_boards(solutions)
+        solutions = self._iter_solutions(algorithm, problem_data)
+        return (Translator.to_sudoku_board(solution) for solution in solutions)
+
+    def count_sudoku_solutions(self, algorithm: str, sudoku_input: SudokuInput) -> int:
+        """Generate needed data and count solutions without translating them.
+
+        Args:
+            algorithm: Name of the algorithm to use
+            sudoku_input: Two-dimensional sudoku board, where empty cells are marked
+                          with zero and other cells have preselected numbers.
+
+        Returns:
+            Number of correct sudoku boards.
+        """
+        sudoku_creator = SudokuCreator()
+        problem_data = sudoku_creator.create_problem_data(sudoku_input)
+        return self._count(algorithm, problem_data)
 
     def solve_generic_problem(
-        self, algorithm: str, problem_data: ProblemData
-    ) -> List[List[Subset]]:
+        self,
+        algorithm: str,
+        problem_data: Problem,
+        limits: Optional[SearchLimits] = None,
+    ) -> SearchResult[List[Subset]]:
         """Solve cover problem and return solutions.
 
         Args:
@@ -64,37 +284,465 @@ class Solver:
             problem_data: Data needed to create an exact cover problem matrix. Should
                           be a tuple containing list of universe elements and dictionary
                           containing subsets with unique ids as keys and list of
-                          subset elements as values.
+                          subset elements as values. Problem compiled from the data
+                          can be given instead to solve it repeatedly.
+            limits: Limits for stopping search early, search is exhaustive if None.
 
         Returns:
-            List of lists where each list has the subsets picked to solution.
+            List of lists where each list has the subsets picked to solution,
+            telling whether search was complete.
         """
-        solutions = self._solve(algorithm, problem_data)
-        _, subset_collection = problem_data
-        return Translator.to_generic_solutions(solutions, subset_collection)
+        solutions = self._solve(algorithm, problem_data, limits)
+        _, subset_collection, _ = unpack_problem_data(self._uncompiled(problem_data))
+        return self._translate(
+            solutions,
+            lambda solutions: Translator.to_generic_solutions(
+                solutions, subset_collection
+            ),
+        )
 
-    @staticmethod
-    def _solve(algorithm: str, problem_data: ProblemData) -> List[Solution]:
-        """Solve exact cover problem.
+    def iter_generic_solutions(
+        self, algorithm: str, problem_data: Problem
+    ) -> Iterator[List[Subset]]:
+        """Yield solutions to cover problem as soon as they are found.
+
+        Args:
+            algorithm: Name of the algorithm to use
+            problem_data: Data needed to create an exact cover problem matrix, or
+                problem compiled from it.
+
+        Returns:
+            Iterator over lists where each list has the subsets picked to solution.
+        """
+        solutions = self._iter_solutions(algorithm, problem_data)
+        _, subset_collection, _ = unpack_problem_data(self._uncompiled(problem_data))
+        return (
+            Translator.to_generic_solution(solution, subset_collection)
+            for solution in solutions
+        )
+
+    def count_generic_solutions(self, algorithm: str, problem_data: Problem) -> int:
+        """Count solutions to cover problem without translating them.
+
+        Args:
+            algorithm: Name of the algorithm to use
+            problem_data: Data needed to create an exact cover problem matrix, or
+                problem compiled from it.
+
+        Returns:
+            Number of solutions.
+        """
+        return self._count(algorithm, problem_data)
+
+    def _solve(
+        self,
+        algorithm: str,
+        problem_data: Problem,
+        limits: Optional[SearchLimits] = None,
+        trusted: bool = False,
+    ) -> SearchResult[Solution]:
+        """Solve exact cover problem, using cached solutions if there are any.
 
         Args:
             algorithm: Name of the algorithm to use
             problem_data: Data needed to create an exact cover problem matrix.
+            limits: Limits for stopping search early, search is exhaustive if None.
+            trusted: Skip validating data known to be valid.
 
         Returns:
             List of solutions, each solution having a list of ids identifying which
             subsets were picked to solution.
+        """
+        key = None
+        if limits is None and not self._collect_stats:
+            key = self._cache_key("solve", algorithm, problem_data)
+        if key is not None:
+            cached = self._cache.get(key)  # type: ignore
+            if cached is not None:
+                return SearchResult(cast(List[Solution], cached))
+        solutions = self._solve_uncached(algorithm, problem_data, limits, trusted)
+        if key is not None:
+            self._cache.put(  # type: ignore
+                key, tuple(tuple(solution) for solution in solutions)
+            )
+        return solutions
 
-        Raises:
-            ValueError: There's no algorithm with the given name.
+    def _solve_uncached(
+        self,
+        algorithm: str,
+        problem_data: Problem,
+        limits: Optional[SearchLimits] = None,
+        trusted: bool = False,
+    ) -> SearchResult[Solution]:
+        """Solve exact cover problem.
+
+        Args:
+            algorithm: Name of the algorithm to use
+            problem_data: Data needed to create an exact cover problem matrix.
+            limits: Limits for stopping search early, search is exhaustive if None.
+            trusted: Skip validating data known to be valid.
+
+        Returns:
+            List of solutions, each solution having a list of ids identifying which
+            subsets were picked to solution. Tells whether search was complete and
+            has statistics of solving if they are collected.
+        """
+        algo, create_matrix = self._create_algorithm(algorithm, trusted)
+        start_time = time.perf_counter()
+        reduced = self._reduce(problem_data)
+        time_reducing = time.perf_counter() - start_time
+        if reduced is not None:
+            if reduced.problem_data is None:
+                return SearchResult(reduced.solutions)
+            problem_data = reduced.problem_data
+        start_time = time.perf_counter()
+        components = self._decompose(problem_data)
+        time_decomposing = time.perf_counter() - start_time
+        deadline = None
+        if limits is not None and limits.time_limit is not None:
+            deadline = time.monotonic() + limits.time_limit
+        results = []
+        for component in components:
+            start_time = time.perf_counter()
+            matrix = create_matrix(component)
+            time_creating = time.perf_counter() - start_time
+            component_limits = self._component_limits(limits, len(components), deadline)
+            result = algo.solve(matrix, component_limits)
+            if not isinstance(result, SearchResult):
+                result = SearchResult(result)
+            if result.stats is not None:
+                result.stats.phase_times["matrix"] = time_creating
+            results.append(result)
+            if not result:
+                break
+        solutions = results[0] if len(results) == 1 else self._combine(results, limits)
+        if solutions.stats is not None:
+            if reduced is not None:
+                solutions.stats.phase_times["reduce"] = time_reducing
+            if self._decompose_problems:
+                solutions.stats.phase_times["decompose"] = time_decomposing
+        if reduced is None:
+            return solutions
+        return SearchResult(
+            [reduced.expand(solution) for solution in solutions],
+            solutions.complete,
+            solutions.stats,
+        )
+
+    @staticmethod
+    def _component_limits(
+        limits: Optional[SearchLimits],
+        components_amount: int,
+        deadline: Optional[float],
+    ) -> Optional[SearchLimits]:
+        """Share limits of the whole search between its components.
+
+        Node limit is split evenly and each component gets the time left until
+        the deadline. Solution limit is kept as it is: first solutions of the
+        combined problem never need more solutions than that from a component,
+        and the limit is applied to the combined solutions afterwards.
+
+        Args:
+            limits: Limits of the whole search, None if search is exhaustive.
+            components_amount: Number of components searched.
+            deadline: Monotonic time the whole search has to end by, if any.
+
+        Returns:
+            Limits for searching the next component.
+        """
+        if limits is None or components_amount == 1:
+            return limits
+        max_nodes = None
+        if limits.max_nodes is not None:
+            max_nodes = max(1, limits.max_nodes // components_amount)
+        time_limit = None
+        if deadline is not None:
+            time_limit = max(deadline - time.monotonic(), sys.float_info.min)
+        return SearchLimits(max_nodes, time_limit, limits.max_solutions)
+
+    @staticmethod
+    def _combine(
+        results: List[SearchResult[Solution]], limits: Optional[SearchLimits]
+    ) -> SearchResult[Solution]:
+        """Combine solutions of components to solutions of the whole problem.
+
+        Args:
+            results: Solutions of each component.
+            limits: Limits of the search, only solution limit is applied here.
+
+        Returns:
+            Solutions of the whole problem, telling whether search of every
+            component was complete and with statistics of the components merged.
+        """
+        max_solutions = limits.max_solutions if limits is not None else None
+        solutions = list(islice(combine(results), max_solutions))
+        total = 1
+        for result in results:
+            total *= len(result)
+        complete = len(solutions) == total and all(
+            result.complete for result in results
+        )
+        stats = None
+        if results[0].stats is not None:
+            stats = SolveStats()
+            for result in results:
+                if result.stats is not None:
+                    stats.merge(result.stats)
+            stats.solutions = len(solutions)
+        return SearchResult(solutions, complete, stats)
+
+    @staticmethod
+    def _translate(
+        solutions: SearchResult[Solution],
+        translate: Callable[[List[Solution]], List[T]],
+    ) -> SearchResult[T]:
+        """Translate solutions keeping the information about the search.
+
+        Args:
+            solutions: Solutions found by the algorithm.
+            translate: Function translating the solutions.
+
+        Returns:
+            Translated solutions, telling whether search was complete and with
+            statistics including translation time if they are collected.
         """
-        if algorithm == "DLX":
-            return DLX().solve(DLXMatrix(problem_data))
-        elif algorithm == "DictX":
-            return DictX().solve(DictMatrix(problem_data))
+        start_time = time.perf_counter()
+        translated = translate(solutions)
+        if solutions.stats is not None:
+            solutions.stats.phase_times["translate"] = time.perf_counter() - start_time
+        return SearchResult(translated, solutions.complete, solutions.stats)
+
+    def _iter_solutions(
+        self, algorithm: str, problem_data: Problem, trusted: bool = False
+    ) -> Iterator[Solution]:
+        """Create matrix and return lazy iterator over its solutions.
+
+        Matrix is created eagerly, so invalid input raises before iteration starts.
+
+        Args:
+            algorithm: Name of the algorithm to use
+            problem_data: Data needed to create an exact cover problem matrix.
+            trusted: Skip validating data known to be valid.
+
+        Returns:
+            Iterator over solutions, each solution having a list of ids identifying
+            which subsets were picked to solution.
+        """
+        algo, create_matrix = self._create_algorithm(algorithm, trusted)
+        reduced = self._reduce(problem_data)
+        if reduced is not None:
+            if reduced.problem_data is None:
+                return iter(reduced.solutions)
+            problem_data = reduced.problem_data
+        matrices = [
+            create_matrix(component) for component in self._decompose(problem_data)
+        ]
+        if len(matrices) == 1:
+            solutions = algo.iter_solutions(matrices[0])
         else:
-            valid_names = ["DLX", "DictX"]
+            solutions = combine(algo.iter_solutions(matrix) for matrix in matrices)
+        if reduced is None:
+            return solutions
+        return (reduced.expand(solution) for solution in solutions)
+
+    def _count(
+        self, algorithm: str, problem_data: Problem, trusted: bool = False
+    ) -> int:
+        """Count solutions to exact cover problem, using cached count if there's one.
+
+        Args:
+            algorithm: Name of the algorithm to use
+            problem_data: Data needed to create an exact cover problem matrix.
+            trusted: Skip validating data known to be valid.
+
+        Returns:
+            Number of solutions.
+        """
+        key = self._cache_key("count", algorithm, problem_data)
+        if key is not None:
+            cached = self._cache.get(key)  # type: ignore
+            if cached is not None:
+                return cast(int, cached)
+        count = self._count_uncached(algorithm, problem_data, trusted)
+        if key is not None:
+            self._cache.put(key, count)  # type: ignore
+        return count
+
+    def _count_uncached(
+        self, algorithm: str, problem_data: Problem, trusted: bool = False
+    ) -> int:
+        """Count solutions to exact cover problem.
+
+        Args:
+            algorithm: Name of the algorithm to use
+            problem_data: Data needed to create an exact cover problem matrix.
+            trusted: Skip validating data known to be valid.
+
+        Returns:
+            Number of solutions.
+        """
+        algo, create_matrix = self._create_algorithm(algorithm, trusted)
+        reduced = self._reduce(problem_data)
+        if reduced is not None:
+            if reduced.problem_data is None:
+                return len(reduced.solutions)
+            problem_data = reduced.problem_data
+        count = 1
+        for component in self._decompose(problem_data):
+            count *= algo.count(create_matrix(component))
+            if not count:
+                break
+        return count
+
+    def _stored_pentomino_solutions(
+        self, algorithm: str, height: int, width: int, problem_data: ProblemData
+    ) -> Optional[List[Solution]]:
+        """Get precomputed solutions of a pentomino board if solver serves them.
+
+        Algorithm and options are validated as if the board was searched.
+
+        Args:
+            algorithm: Name of the algorithm to use
+            height: Height of the pentomino board
+            width: Width of the pentomino board
+            problem_data: Data of the pentomino problem.
+
+        Returns:
+            Solutions of the board, None if board has to be searched.
+        """
+        self._create_algorithm(algorithm, trusted=True)
+        if self._pentomino_store is None or self._collect_stats:
+            return None
+        return self._pentomino_store.solutions(height, width, problem_data)
+
+    def _cache_key(
+        self, mode: str, algorithm: str, problem_data: Problem
+    ) -> Optional[bytes]:
+        """Get key of the problem in cache.
+
+        Options changing the order of solutions are part of the key.
+
+        Args:
+            mode: Whether solutions are solved or counted.
+            algorithm: Name of the algorithm to use
+            problem_data: Data needed to create an exact cover problem matrix, or
+                problem compiled from it.
+
+        Returns:
+            Key of the problem, None if solver has no cache or problem can't be
+            keyed.
+        """
+        if self._cache is None:
+            return None
+        return problem_key(
+            self._uncompiled(problem_data),
+            mode,
+            algorithm,
+            self._workers,
+            self._split_depth,
+            self._strategy,
+            self._reduce_problems,
+            self._decompose_problems,
+        )
+
+    def _reduce(self, problem_data: Problem) -> Optional[ReducedProblem]:
+        """Reduce problem if solver is set to do so.
+
+        Args:
+            problem_data: Data needed to create an exact cover problem matrix, or
+                problem compiled from it.
+
+        Returns:
+            Reduced problem, None if problems are not reduced.
+        """
+        if not self._reduce_problems:
+            return None
+        return reduce(self._uncompiled(problem_data))
+
+    def _decompose(self, problem_data: Problem) -> List[Problem]:
+        """Split problem to connected components if solver is set to do so.
+
+        Args:
+            problem_data: Data needed to create an exact cover problem matrix, or
+                problem compiled from it.
+
+        Returns:
+            Problem data of each component, problem itself if problems are not
+            decomposed or it has only one component.
+        """
+        if not self._decompose_problems:
+            return [problem_data]
+        uncompiled = self._uncompiled(problem_data)
+        components: List[Problem] = list(decompose(uncompiled))
+        if len(components) == 1 and components[0] is uncompiled:
+            return [problem_data]
+        return components
+
+    @staticmethod
+    def _uncompiled(problem_data: Problem) -> ProblemData:
+        """Get data problem was compiled from.
+
+        Args:
+            problem_data: Data needed to create an exact cover problem matrix, or
+                problem compiled from it.
+
+        Returns:
+            Data of the problem.
+        """
+        if isinstance(problem_data, CompiledProblem):
+            return problem_data.problem_data
+        return problem_data
+
+    def _create_algorithm(
+        self, algorithm: str, trusted: bool = False
+    ) -> Tuple[AlgorithmX, MatrixFactory]:
+        """Create algorithm and get factory of the matrix it consumes.
+
+        Matrices are created with size buckets if strategy uses them. Matrices skip
+        validation if data is trusted or it's validated already by reduction or
+        decomposition.
+
+        Args:
+            algorithm: Name of the algorithm to use
+            trusted: Whether problem data is known to be valid.
+
+        Returns:
+            Tuple containing algorithm and function creating matrix from problem
+            data.
+
+        Raises:
+            ValueError: There's no algorithm with the given name or algorithm
+                doesn't support chosen strategy or collecting statistics.
+        """
+        if algorithm not in ALGORITHMS:
+            valid_names = list(ALGORITHMS)
             raise ValueError(
                 f"Algorithm {algorithm} is not valid algorithm. "
                 f"Valid algorithms are: {valid_names}"
             )
+        algo_class, matrix_class = ALGORITHMS[algorithm]
+        options: Dict[str, Any] = {
+            "workers": self._workers,
+            "split_depth": self._split_depth,
+        }
+        matrix_options: Dict[str, Any] = {
+            "trusted": trusted or self._reduce_problems or self._decompose_problems
+        }
+        if algorithm in STRATEGY_ALGORITHMS:
+            strategy = STRATEGIES[self._strategy]()
+            options["strategy"] = strategy
+            if strategy.uses_size_buckets:
+                matrix_options["size_buckets"] = True
+        elif self._strategy != "MRV":
+            raise ValueError(
+                f"Algorithm {algorithm} does not support strategy {self._strategy}. "
+                f"Algorithms supporting strategies are: {STRATEGY_ALGORITHMS}"
+            )
+        if algorithm in INSTRUMENTED_ALGORITHMS:
+            options["instrument"] = self._collect_stats
+        elif self._collect_stats:
+            raise ValueError(
+                f"Algorithm {algorithm} does not support collecting statistics. "
+                f"Algorithms supporting it are: {INSTRUMENTED_ALGORITHMS}"
+            )
+        return algo_class(**options), partial(matrix_class, **matrix_options)
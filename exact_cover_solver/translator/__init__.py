@@ -10,8 +10,9 @@ SudokuBoard = List[List[int]]
 class Translator:
     """Translator for decoding solutions to understandable output format."""
 
-    @staticmethod
+    @classmethod
     def to_pentomino_boards(
+        cls,
         solutions: List[Solution],
         board_height: int,
         board_width: int,
@@ -28,18 +29,40 @@ class Translator:
         Returns:
              List of pentomino boards with pentominos placed to correct places.
         """
-        boards: List[PentominoBoard] = []
-        for solution in solutions:
-            board: PentominoBoard = [[""] * board_width for _ in range(board_height)]
-            for subset_id in solution:
-                pentomino_name, *points = subset_collection[subset_id]
-                for x, y in points:
-                    board[y][x] = pentomino_name
-            boards.append(board)
-        return boards
+        return [
+            cls.to_pentomino_board(
+                solution, board_height, board_width, subset_collection
+            )
+            for solution in solutions
+        ]
 
     @staticmethod
-    def to_sudoku_boards(solutions: List[Solution]) -> List[SudokuBoard]:
+    def to_pentomino_board(
+        solution: Solution,
+        board_height: int,
+        board_width: int,
+        subset_collection: SubsetCollection,
+    ) -> PentominoBoard:
+        """Convert single solution to pentomino board.
+
+        Args:
+            solution: Solution generated by algorithm X
+            board_height: Pentomino board height
+            board_width: Pentomino board width
+            subset_collection: Original pentomino placement possibilities
+
+        Returns:
+             Pentomino board with pentominos placed to correct places.
+        """
+        board: PentominoBoard = [[""] * board_width for _ in range(board_height)]
+        for subset_id in solution:
+            pentomino_name, *points = subset_collection[subset_id]
+            for x, y in points:
+                board[y][x] = pentomino_name
+        return board
+
+    @classmethod
+    def to_sudoku_boards(cls, solutions: List[Solution]) -> List[SudokuBoard]:
         """Convert list of solutions to sudoku boards.
 
         Args:
@@ -48,18 +71,28 @@ class Translator:
         Returns:
              List of sudoku boards correct solution.
         """
-        boards: List[SudokuBoard] = []
-        for solution in solutions:
-            size = int(len(solution) ** 0.5)
-            board: SudokuBoard = [[0] * size for _ in range(size)]
-            for subset_id in solution:
-                y, x, value = subset_id
-                board[y][x] = value
-            boards.append(board)
-        return boards
+        return [cls.to_sudoku_board(solution) for solution in solutions]
 
     @staticmethod
+    def to_sudoku_board(solution: Solution) -> SudokuBoard:
+        """Convert single solution to sudoku board.
+
+        Args:
+            solution: Solution generated by algorithm X
+
+        Returns:
+             Correctly filled sudoku board.
+        """
+        size = int(len(solution) ** 0.5)
+        board: SudokuBoard = [[0] * size for _ in range(size)]
+        for subset_id in solution:
+            y, x, value = subset_id
+            board[y][x] = value
+        return board
+
+    @classmethod
     def to_generic_solutions(
+        cls,
         solutions: List[Solution],
         subset_collection: SubsetCollection,
     ) -> List[List[Subset]]:
@@ -73,6 +106,21 @@ class Translator:
             List of lists where each list has the subsets picked to solution.
         """
         return [
-            [subset_collection[subset_id] for subset_id in solution]
+            cls.to_generic_solution(solution, subset_collection)
             for solution in solutions
         ]
+
+    @staticmethod
+    def to_generic_solution(
+        solution: Solution, subset_collection: SubsetCollection
+    ) -> List[Subset]:
+        """Extend single solution to have subsets instead of subset ids.
+
+        Args:
+            solution: Solution generated by algorithm X
+            subset_collection: Original set collection used to create the matrix
+
+        Returns:
+            List of subsets picked to solution.
+        """
+        return [subset_collection[subset_id] for subset_id in solution]
@@ -10,10 +10,16 @@ Types used:
 - SubsetCollection: A collection of subsets.
 - Solution: List of SubsetNames that identify which disjoint subsets were picked to
   solution.
-- ProblemData: Data needed to create an exact cover problem matrix.
+- SecondaryUniverse: A collection of secondary universe elements. Secondary elements
+  don't have to be covered, but they can be covered at most once.
+- Color: Color of a secondary element in a subset. Subsets can share a secondary
+  element if they give it the same color.
+- SubsetColors: Colors of secondary elements for each subset that has any.
+- ProblemData: Data needed to create an exact cover problem matrix: universe, subset
+  collection and optionally secondary universe as a third item.
 """
 
-from typing import Dict, List, Tuple, TypeVar, Hashable
+from typing import Dict, List, Tuple, TypeVar, Hashable, Union
 
 UniverseElement = TypeVar("UniverseElement")
 Universe = List[UniverseElement]
@@ -21,4 +27,10 @@ SubsetId = TypeVar("SubsetId", bound=Hashable)
 Subset = List[UniverseElement]
 SubsetCollection = Dict[SubsetId, Subset]
 Solution = List[SubsetId]
-ProblemData = Tuple[Universe, SubsetCollection]
+SecondaryUniverse = List[UniverseElement]
+Color = Hashable
+SubsetColors = Dict[SubsetId, Dict[UniverseElement, Color]]
+ProblemData = Union[
+    Tuple[Universe, SubsetCollection],
+    Tuple[Universe, SubsetCollection, SecondaryUniverse],
+]
@@ -6,7 +6,38 @@ https://en.wikipedia.org/wiki/Pentomino#Constructing_rectangular_dimensions
 from typing import List
 
 from exact_cover_solver import Solver
+from exact_cover_solver.algos import (
+    ArrayDLX,
+    BitX,
+    BucketMRV,
+    DLX,
+    DictX,
+    MRV,
+    RandomMRV,
+    STRATEGIES,
+    SearchLimits,
+    XCC,
+)
+from exact_cover_solver.data_creators import PentominoCreator, SudokuCreator
+from exact_cover_solver.datastructures import (
+    ArrayMatrix,
+    BitMatrix,
+    compile_problem,
+    DLXMatrix,
+    DictMatrix,
+    load_problem,
+    read_dlx,
+    save_problem,
+    write_dlx,
+    XCCMatrix,
+)
+from exact_cover_solver.preprocessing import reduce
+from exact_cover_solver.services import SolutionCache
+import os
+import random
+import tempfile
 import time
+import tracemalloc
 
 
 def generate_pentomino_board_solutions(
@@ -136,12 +167,23 @@ def run_one_generic_test(n, m):
         time_solving = time.time() - start_time
         rounded_time = round(time_solving, 2)
 
-        assert len(solutions) == m ** 10
+        assert len(solutions) == m**10
         print(
             f"Algorithm {algo} found {len(solutions)} solutions in {rounded_time} "
             f"seconds for input size {n * m * 10}."
         )
 
+        start_time = time.time()
+        amount = solver.count_generic_solutions(algo, problem_data)
+        time_counting = time.time() - start_time
+        rounded_time = round(time_counting, 2)
+
+        assert amount == m**10
+        print(
+            f"Algorithm {algo} counted {amount} solutions in {rounded_time} "
+            f"seconds for input size {n * m * 10}."
+        )
+
 
 def run_generic_tests():
     """Test with different sized inputs."""
@@ -150,11 +192,869 @@ def run_generic_tests():
             run_one_generic_test(n, m)
 
 
+def count_search_nodes(algo_class, matrix, **options):
+    """Count nodes visited by the recursive search of given algorithm."""
+
+    class NodeCountingAlgo(algo_class):
+        nodes = 0
+
+        def _search(self, *args):
+            self.nodes += 1
+            super()._search(*args)
+
+    algo = NodeCountingAlgo(**options)
+    algo.solve(matrix)
+    return algo.nodes
+
+
+def compare_search_modes(name, problem_data):
+    """Compare node throughput of recursive and iterative search."""
+    for algo_class, matrix_class in [(DLX, DLXMatrix), (DictX, DictMatrix)]:
+        nodes = count_search_nodes(algo_class, matrix_class(problem_data))
+        for iterative in [False, True]:
+            algo = algo_class(iterative=iterative)
+            matrix = matrix_class(problem_data)
+
+            start_time = time.time()
+            solutions = algo.solve(matrix)
+            time_solving = time.time() - start_time
+
+            mode = "iterative" if iterative else "recursive"
+            throughput = round(nodes / time_solving)
+            print(
+                f"Algorithm {algo_class.__name__} ({mode}) visited {nodes} nodes and "
+                f"found {len(solutions)} solutions for {name} in "
+                f"{round(time_solving, 2)} seconds ({throughput} nodes/s)."
+            )
+
+
+def run_search_mode_tests():
+    """Test recursive and iterative search on pentomino and generic inputs."""
+    pentomino_data = PentominoCreator().create_problem_data(6, 10)
+    compare_search_modes("6x10 pentomino", pentomino_data)
+    for n, m in [(100, 3), (1000, 3)]:
+        compare_search_modes(
+            f"generic input size {n * m * 10}", generate_generic_sample_data(n, m)
+        )
+
+
+def measure_matrix_memory(matrix_class, problem_data):
+    """Measure memory allocated while creating matrix, None if not traceable."""
+    try:
+        tracemalloc.start()
+    except Exception:
+        return None
+    matrix = matrix_class(problem_data)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del matrix
+    return allocated
+
+
+def compare_engines(name, problem_data):
+    """Compare counting speed and matrix memory of different engines."""
+    engines = [(DLX, DLXMatrix), (ArrayDLX, ArrayMatrix), (BitX, BitMatrix)]
+    for algo_class, matrix_class in engines:
+        memory = measure_matrix_memory(matrix_class, problem_data)
+        matrix = matrix_class(problem_data)
+
+        start_time = time.time()
+        amount = algo_class().count(matrix)
+        time_solving = time.time() - start_time
+
+        memory_info = "n/a" if memory is None else f"{round(memory / 1024)} KiB"
+        print(
+            f"Algorithm {algo_class.__name__} counted {amount} solutions for {name} "
+            f"in {round(time_solving, 2)} seconds, matrix takes {memory_info}."
+        )
+
+
+def run_engine_tests():
+    """Test array and bitset based engines against object based DLX."""
+    pentomino_data = PentominoCreator().create_problem_data(6, 10)
+    compare_engines("6x10 pentomino", pentomino_data)
+    sudoku_with_24_hints = [
+        [1, 2, 3, 4, 5, 6, 7, 8, 9],
+        [4, 5, 6, 7, 8, 9, 1, 2, 3],
+        [7, 8, 9, 1, 2, 3, 4, 5, 6],
+        [2, 3, 4, 5, 6, 7, 8, 9, 1],
+        [0, 0, 0, 0, 0, 0, 0, 0, 0],
+        [0, 0, 0, 0, 0, 0, 0, 0, 0],
+        [0, 0, 0, 0, 0, 0, 0, 0, 0],
+        [0, 0, 0, 0, 0, 0, 0, 0, 0],
+        [0, 0, 0, 0, 0, 0, 0, 0, 0],
+    ]
+    sudoku_data = SudokuCreator().create_problem_data(sudoku_with_24_hints)
+    compare_engines("sudoku with 24 hints", sudoku_data)
+    generic_data = generate_generic_sample_data(10000, 2)
+    compare_engines("generic input size 200000", generic_data)
+
+
+def compare_worker_amounts(name, solve):
+    """Compare solving times with different amounts of worker processes."""
+    serial_time = None
+    for workers in [1, 2, 4, 8]:
+        solver = Solver(workers=workers)
+
+        start_time = time.time()
+        amount = solve(solver)
+        time_solving = time.time() - start_time
+        serial_time = serial_time or time_solving
+
+        speedup = round(serial_time / time_solving, 2)
+        print(
+            f"Solver with {workers} workers counted {amount} solutions for {name} in "
+            f"{round(time_solving, 2)} seconds (speedup {speedup}x)."
+        )
+
+
+def run_parallel_tests():
+    """Test speedup of splitting search to worker processes."""
+    compare_worker_amounts(
+        "6x10 pentomino with DLX",
+        lambda solver: solver.count_pentomino_solutions("DLX", 6, 10),
+    )
+    generic_data = generate_generic_sample_data(1000, 4)
+    compare_worker_amounts(
+        "generic input size 40000 with DLX",
+        lambda solver: solver.count_generic_solutions("DLX", generic_data),
+    )
+
+
+def compare_plain_and_memoized_counting(name, problem_data):
+    """Compare plain counting with counting that memoizes subproblems."""
+    for algo_class, matrix_class in [(DLX, DLXMatrix), (DictX, DictMatrix)]:
+        matrix = matrix_class(problem_data)
+        algo = algo_class()
+        for mode, count in [("plain", algo.count), ("memoized", algo.count_memoized)]:
+            start_time = time.time()
+            amount = count(matrix)
+            time_counting = time.time() - start_time
+            print(
+                f"Algorithm {algo_class.__name__} ({mode}) counted {amount} solutions "
+                f"for {name} in {round(time_counting, 2)} seconds."
+            )
+
+
+def run_memoized_counting_tests():
+    """Test memoized counting on pentomino and generic inputs."""
+    pentomino_data = PentominoCreator().create_problem_data(6, 10)
+    compare_plain_and_memoized_counting("6x10 pentomino", pentomino_data)
+    generic_data = generate_generic_sample_data(1000, 4)
+    compare_plain_and_memoized_counting("generic input size 40000", generic_data)
+
+
+def generate_queens_problem_data(n, slack_rows):
+    """Generate n queens problem with diagonals as secondary elements.
+
+    With slack rows diagonals are encoded as primary elements instead, and a
+    singleton subset is added for each of them to cover the ones left empty.
+    """
+    universe = [("row", i) for i in range(n)] + [("column", i) for i in range(n)]
+    diagonals = [("diagonal", i) for i in range(2 * n - 1)] + [
+        ("antidiagonal", i) for i in range(2 * n - 1)
+    ]
+    subset_collection = {
+        (row, column): [
+            ("row", row),
+            ("column", column),
+            ("diagonal", row + column),
+            ("antidiagonal", row - column + n - 1),
+        ]
+        for row in range(n)
+        for column in range(n)
+    }
+    if not slack_rows:
+        return universe, subset_collection, diagonals
+    for diagonal in diagonals:
+        subset_collection[diagonal] = [diagonal]
+    return universe + diagonals, subset_collection
+
+
+def compare_secondary_and_slack_encodings(n):
+    """Compare native secondary columns with slack rows on n queens problem."""
+    for algo_class, matrix_class in [(DLX, DLXMatrix), (DictX, DictMatrix)]:
+        for encoding, slack_rows in [
+            ("secondary columns", False),
+            ("slack rows", True),
+        ]:
+            problem_data = generate_queens_problem_data(n, slack_rows)
+            nodes = count_search_nodes(algo_class, matrix_class(problem_data))
+            algo = algo_class()
+            matrix = matrix_class(problem_data)
+
+            start_time = time.time()
+            amount = algo.count(matrix)
+            time_counting = time.time() - start_time
+
+            print(
+                f"Algorithm {algo_class.__name__} ({encoding}) visited {nodes} nodes "
+                f"and counted {amount} solutions for {n} queens in "
+                f"{round(time_counting, 2)} seconds."
+            )
+
+
+def run_secondary_column_tests():
+    """Test secondary columns against slack rows with different board sizes."""
+    for n in [8, 10]:
+        compare_secondary_and_slack_encodings(n)
+
+
+def generate_word_problem_data(words, height, width):
+    """Generate problem of placing words to grid with cells as colored elements."""
+    cells = [(y, x) for y in range(height) for x in range(width)]
+    subset_collection, colors = {}, {}
+    for word in words:
+        for y, x in cells:
+            for dy, dx in [(0, 1), (1, 0)]:
+                word_cells = [(y + dy * i, x + dx * i) for i in range(len(word))]
+                if all(cy < height and cx < width for cy, cx in word_cells):
+                    subset_collection[(word, y, x, dy)] = [word, *word_cells]
+                    colors[(word, y, x, dy)] = dict(zip(word_cells, word))
+    return (list(words), subset_collection, cells), colors
+
+
+def generate_plain_word_problem_data(problem_data, colors):
+    """Encode colored cells without colors.
+
+    Each cell gets a primary column choosing its letter, and each row using a cell
+    its own secondary column, which is covered by choosing another letter. Cells
+    left empty can get any letter, so same placement may be found several times.
+    """
+    universe, subset_collection, cells = problem_data
+    letters = {cell: {} for cell in cells}
+    plain_collection = {}
+    for subset_id, subset in subset_collection.items():
+        plain_collection[subset_id] = [subset[0]] + [
+            ("use", cell, subset_id) for cell in subset[1:]
+        ]
+        for cell in subset[1:]:
+            letters[cell][subset_id] = colors[subset_id][cell]
+    for cell, used_letters in letters.items():
+        for letter in set(used_letters.values()):
+            plain_collection[("choose", cell, letter)] = [("letter", cell)] + [
+                ("use", cell, subset_id)
+                for subset_id, used_letter in used_letters.items()
+                if used_letter != letter
+            ]
+    plain_universe = universe + [("letter", cell) for cell in cells if letters[cell]]
+    plain_secondary = [
+        ("use", cell, subset_id)
+        for cell, used_letters in letters.items()
+        for subset_id in used_letters
+    ]
+    return plain_universe, plain_collection, plain_secondary
+
+
+def compare_colors_and_plain_encoding(name, words, height, width):
+    """Compare XCC on colored cells with DLX on the plain encoding."""
+    problem_data, colors = generate_word_problem_data(words, height, width)
+    plain_problem_data = generate_plain_word_problem_data(problem_data, colors)
+    times = []
+    for algo_class, matrix in [
+        (XCC, XCCMatrix(problem_data, colors)),
+        (DLX, DLXMatrix(plain_problem_data)),
+    ]:
+        nodes = count_search_nodes(algo_class, matrix)
+        start_time = time.time()
+        solutions = algo_class().solve(matrix)
+        time_solving = time.time() - start_time
+        times.append(time_solving)
+        print(
+            f"Algorithm {algo_class.__name__} visited {nodes} nodes and found "
+            f"{len(solutions)} solutions for {name} in "
+            f"{round(time_solving, 2)} seconds."
+        )
+    color_time, plain_time = times
+    print(
+        f"Colors were {round(plain_time / max(color_time, 1e-9), 1)} times as fast "
+        f"as the plain encoding for {name}."
+    )
+
+
+def run_color_tests():
+    """Test colored secondary columns on word placement problems."""
+    compare_colors_and_plain_encoding(
+        "5 words on 3x4 grid", ["ABC", "BCA", "CAB", "AAB", "BBC"], 3, 4
+    )
+    compare_colors_and_plain_encoding(
+        "6 words on 4x4 grid", ["ABCD", "BCDA", "CDAB", "DABC", "ABC", "DCB"], 4, 4
+    )
+
+
+def compare_strategies(name, problem_data):
+    """Compare nodes and time of column selection strategies.
+
+    Random strategy is seeded, so both runs make the same choices.
+    """
+
+    def create_strategy(strategy_class):
+        return strategy_class(0) if strategy_class is RandomMRV else strategy_class()
+
+    for algo_class, matrix_class in [(DLX, DLXMatrix), (DictX, DictMatrix)]:
+        for strategy_name, strategy_class in STRATEGIES.items():
+            size_buckets = strategy_class.uses_size_buckets
+            nodes = count_search_nodes(
+                algo_class,
+                matrix_class(problem_data, size_buckets=size_buckets),
+                strategy=create_strategy(strategy_class),
+            )
+            algo = algo_class(strategy=create_strategy(strategy_class))
+            matrix = matrix_class(problem_data, size_buckets=size_buckets)
+
+            start_time = time.time()
+            solutions = algo.solve(matrix)
+            time_solving = time.time() - start_time
+
+            print(
+                f"Algorithm {algo_class.__name__} ({strategy_name}) visited {nodes} "
+                f"nodes and found {len(solutions)} solutions for {name} in "
+                f"{round(time_solving, 2)} seconds."
+            )
+
+
+def run_strategy_tests():
+    """Test column selection strategies on sudoku and tiling inputs."""
+    hardest_sudoku_ever = [
+        [8, 0, 0, 0, 0, 0, 0, 0, 0],
+        [0, 0, 3, 6, 0, 0, 0, 0, 0],
+        [0, 7, 0, 0, 9, 0, 2, 0, 0],
+        [0, 5, 0, 0, 0, 7, 0, 0, 0],
+        [0, 0, 0, 0, 4, 5, 7, 0, 0],
+        [0, 0, 0, 1, 0, 0, 0, 3, 0],
+        [0, 0, 1, 0, 0, 0, 0, 6, 8],
+        [0, 0, 8, 5, 0, 0, 0, 1, 0],
+        [0, 9, 0, 0, 0, 0, 4, 0, 0],
+    ]
+    sudoku_data = SudokuCreator().create_problem_data(hardest_sudoku_ever)
+    compare_strategies("hardest sudoku ever", sudoku_data)
+    pentomino_data = PentominoCreator().create_problem_data(3, 20)
+    compare_strategies("3x20 pentomino", pentomino_data)
+
+
+def compare_search_with_and_without_limits(name, problem_data):
+    """Compare exhaustive search to search with limits that are never hit.
+
+    Search with limits is always iterative, so it's compared to iterative search.
+    """
+    limits = SearchLimits(max_nodes=10**12, time_limit=10**6)
+    for algo, matrix_class in [
+        (DLX(iterative=True), DLXMatrix),
+        (DictX(iterative=True), DictMatrix),
+        (ArrayDLX(), ArrayMatrix),
+        (BitX(), BitMatrix),
+    ]:
+        matrix = matrix_class(problem_data)
+
+        start_time = time.time()
+        solutions = algo.solve(matrix)
+        time_without_limits = time.time() - start_time
+
+        start_time = time.time()
+        limited_solutions = algo.solve(matrix, limits)
+        time_with_limits = time.time() - start_time
+
+        print(
+            f"Algorithm {type(algo).__name__} found {len(solutions)} solutions for "
+            f"{name} in {round(time_without_limits, 2)} seconds without limits and "
+            f"{len(limited_solutions)} solutions in {round(time_with_limits, 2)} "
+            f"seconds with limits."
+        )
+
+
+def run_limit_tests():
+    """Test overhead of checking search limits and how fast search stops."""
+    pentomino_data = PentominoCreator().create_problem_data(3, 20)
+    compare_search_with_and_without_limits("3x20 pentomino", pentomino_data)
+    pentomino_data = PentominoCreator().create_problem_data(6, 10)
+    for limits in [SearchLimits(max_solutions=10), SearchLimits(time_limit=1)]:
+        start_time = time.time()
+        solutions = DLX().solve(DLXMatrix(pentomino_data), limits)
+        time_solving = time.time() - start_time
+        print(
+            f"Algorithm DLX found {len(solutions)} solutions for 6x10 pentomino "
+            f"in {round(time_solving, 2)} seconds before stopping, search complete: "
+            f"{solutions.complete}."
+        )
+
+
+def compare_plain_and_instrumented_search(name, problem_data):
+    """Compare iterative search to instrumented search and print the statistics."""
+    for algo_class, matrix_class in [(DLX, DLXMatrix), (DictX, DictMatrix)]:
+        matrix = matrix_class(problem_data)
+
+        start_time = time.time()
+        algo_class(iterative=True).solve(matrix)
+        time_plain = time.time() - start_time
+
+        start_time = time.time()
+        stats = algo_class(instrument=True).solve(matrix).stats
+        time_instrumented = time.time() - start_time
+
+        branching = ", ".join(
+            f"{factor:.1f}" for factor in stats.branching_factors[:10]
+        )
+        print(
+            f"Algorithm {algo_class.__name__} solved {name} in "
+            f"{round(time_plain, 2)} seconds without and in "
+            f"{round(time_instrumented, 2)} seconds with instrumentation. Search "
+            f"visited {stats.nodes} nodes, made {stats.updates} updates and "
+            f"reached depth {len(stats.nodes_per_depth) - 1}. Branching factors "
+            f"on first levels: {branching}."
+        )
+
+
+def run_instrumentation_tests():
+    """Test overhead of instrumentation and show statistics of different inputs."""
+    hardest_sudoku_ever = [
+        [8, 0, 0, 0, 0, 0, 0, 0, 0],
+        [0, 0, 3, 6, 0, 0, 0, 0, 0],
+        [0, 7, 0, 0, 9, 0, 2, 0, 0],
+        [0, 5, 0, 0, 0, 7, 0, 0, 0],
+        [0, 0, 0, 0, 4, 5, 7, 0, 0],
+        [0, 0, 0, 1, 0, 0, 0, 3, 0],
+        [0, 0, 1, 0, 0, 0, 0, 6, 8],
+        [0, 0, 8, 5, 0, 0, 0, 1, 0],
+        [0, 9, 0, 0, 0, 0, 4, 0, 0],
+    ]
+    sudoku_data = SudokuCreator().create_problem_data(hardest_sudoku_ever)
+    compare_plain_and_instrumented_search("hardest sudoku ever", sudoku_data)
+    pentomino_data = PentominoCreator().create_problem_data(3, 20)
+    compare_plain_and_instrumented_search("3x20 pentomino", pentomino_data)
+
+
+def compare_estimate_to_search(name, problem_data, probes):
+    """Compare estimated tree size to real size and time of estimating to solving."""
+    for algo_class, matrix_class in [(DLX, DLXMatrix), (DictX, DictMatrix)]:
+        matrix = matrix_class(problem_data)
+
+        start_time = time.time()
+        estimate = algo_class().estimate(matrix, probes, seed=0)
+        time_estimating = time.time() - start_time
+
+        start_time = time.time()
+        stats = algo_class(instrument=True).solve(matrix).stats
+        time_solving = time.time() - start_time
+
+        nodes_low, nodes_high = estimate.nodes_bounds
+        solutions_low, solutions_high = estimate.solutions_bounds
+        print(
+            f"Algorithm {algo_class.__name__} estimated {round(estimate.nodes)} "
+            f"nodes ({round(nodes_low)} - {round(nodes_high)}) and "
+            f"{round(estimate.solutions)} solutions ({round(solutions_low)} - "
+            f"{round(solutions_high)}) for {name} with {probes} probes in "
+            f"{round(time_estimating, 2)} seconds. Search visited {stats.nodes} "
+            f"nodes and found {stats.solutions} solutions in "
+            f"{round(time_solving, 2)} seconds."
+        )
+
+
+def run_estimate_tests():
+    """Test how well tree size estimates match different inputs."""
+    queens_data = generate_queens_problem_data(8, False)
+    compare_estimate_to_search("8 queens", queens_data, 1000)
+    pentomino_data = PentominoCreator().create_problem_data(3, 20)
+    compare_estimate_to_search("3x20 pentomino", pentomino_data, 1000)
+
+
+def compare_reduced_and_original_problem(name, sudoku):
+    """Compare size and solving time of sudoku problem with and without reduction."""
+    problem_data = SudokuCreator().create_problem_data(sudoku)
+    start_time = time.time()
+    reduced = reduce(problem_data)
+    time_reducing = time.time() - start_time
+    universe, subset_collection = problem_data
+    if reduced.problem_data is None:
+        reduced_universe, reduced_collection = [], {}
+    else:
+        reduced_universe, reduced_collection, *_ = reduced.problem_data
+    print(
+        f"Reduction of {name} took {round(time_reducing, 3)} seconds. Problem "
+        f"shrank from {len(universe)} columns and {len(subset_collection)} rows to "
+        f"{len(reduced_universe)} columns and {len(reduced_collection)} rows, "
+        f"{len(reduced.forced)} rows were forced."
+    )
+    for algo in ["DLX", "DictX", "ArrayDLX", "BitX"]:
+        start_time = time.time()
+        Solver().solve_sudoku_problem(algo, sudoku)
+        time_solving = time.time() - start_time
+
+        start_time = time.time()
+        Solver(reduce=True).solve_sudoku_problem(algo, sudoku)
+        time_reduced = time.time() - start_time
+
+        print(
+            f"Algorithm {algo} solved {name} in {round(time_solving, 3)} seconds "
+            f"without and in {round(time_reduced, 3)} seconds with reduction."
+        )
+
+
+def run_reduction_tests():
+    """Test how much reduction shrinks the sudoku inputs."""
+    hardest_sudoku_ever = [
+        [8, 0, 0, 0, 0, 0, 0, 0, 0],
+        [0, 0, 3, 6, 0, 0, 0, 0, 0],
+        [0, 7, 0, 0, 9, 0, 2, 0, 0],
+        [0, 5, 0, 0, 0, 7, 0, 0, 0],
+        [0, 0, 0, 0, 4, 5, 7, 0, 0],
+        [0, 0, 0, 1, 0, 0, 0, 3, 0],
+        [0, 0, 1, 0, 0, 0, 0, 6, 8],
+        [0, 0, 8, 5, 0, 0, 0, 1, 0],
+        [0, 9, 0, 0, 0, 0, 4, 0, 0],
+    ]
+    compare_reduced_and_original_problem("hardest sudoku ever", hardest_sudoku_ever)
+    easy_sudoku = [
+        [5, 3, 0, 0, 7, 0, 0, 0, 0],
+        [6, 0, 0, 1, 9, 5, 0, 0, 0],
+        [0, 9, 8, 0, 0, 0, 0, 6, 0],
+        [8, 0, 0, 0, 6, 0, 0, 0, 3],
+        [4, 0, 0, 8, 0, 3, 0, 0, 1],
+        [7, 0, 0, 0, 2, 0, 0, 0, 6],
+        [0, 6, 0, 0, 0, 0, 2, 8, 0],
+        [0, 0, 0, 4, 1, 9, 0, 0, 5],
+        [0, 0, 0, 0, 8, 0, 0, 7, 9],
+    ]
+    compare_reduced_and_original_problem("easy sudoku", easy_sudoku)
+
+
+def compare_decomposed_and_whole_problem(n, m):
+    """Compare counting solutions of generic data with and without decomposing."""
+    problem_data = generate_generic_sample_data(n, m)
+    for algo in ["DLX", "DictX"]:
+        start_time = time.time()
+        amount = Solver().count_generic_solutions(algo, problem_data)
+        time_whole = time.time() - start_time
+        start_time = time.time()
+        decomposed_amount = Solver(decompose=True).count_generic_solutions(
+            algo, problem_data
+        )
+        time_decomposed = time.time() - start_time
+        assert amount == decomposed_amount == m**10
+        print(
+            f"Algorithm {algo} counted {amount} solutions for input size "
+            f"{n * m * 10} in {round(time_whole, 3)} seconds without and in "
+            f"{round(time_decomposed, 3)} seconds with decomposing."
+        )
+
+
+def run_decomposition_tests():
+    """Test how much solving independent components separately helps."""
+    for m in range(1, 4):
+        compare_decomposed_and_whole_problem(1000, m)
+
+
+def compare_merged_and_distinct_rows(n, m):
+    """Compare counting generic data with duplicates merged and kept apart.
+
+    Giving each subset its own secondary element keeps the duplicates from being
+    merged, while the number of solutions stays the same.
+    """
+    universe, subset_collection = generate_generic_sample_data(n, m)
+    distinct_data = (
+        universe,
+        {
+            subset_id: [*subset, ("own", subset_id)]
+            for subset_id, subset in subset_collection.items()
+        },
+        [("own", subset_id) for subset_id in subset_collection],
+    )
+    for algo_class, matrix_class in [(DLX, DLXMatrix), (DictX, DictMatrix)]:
+        start_time = time.time()
+        matrix = matrix_class((universe, subset_collection))
+        amount = algo_class().count(matrix)
+        time_merged = time.time() - start_time
+        start_time = time.time()
+        distinct_amount = algo_class().count(matrix_class(distinct_data))
+        time_distinct = time.time() - start_time
+        assert amount == distinct_amount == m**10
+        print(
+            f"Algorithm {algo_class.__name__} counted {amount} solutions from "
+            f"{len(subset_collection)} subsets in {round(time_merged, 3)} seconds "
+            f"with {len(matrix.row_groups)} merged rows and in "
+            f"{round(time_distinct, 3)} seconds without merging."
+        )
+
+
+def run_duplicate_row_tests():
+    """Test how much merging duplicate subsets helps searching."""
+    for m in range(1, 4):
+        compare_merged_and_distinct_rows(1000, m)
+
+
+def generate_domino_problem_data(width):
+    """Generate problem data for tiling a 2 x width strip with dominoes."""
+    universe = [(y, x) for y in range(2) for x in range(width)]
+    subset_collection = {}
+    for x in range(width):
+        subset_collection[("vertical", x)] = [(0, x), (1, x)]
+        if x + 1 < width:
+            for y in range(2):
+                subset_collection[("horizontal", y, x)] = [(y, x), (y, x + 1)]
+    return universe, subset_collection
+
+
+def compare_scanning_and_size_buckets(width):
+    """Compare finding first solutions with scanning MRV and size buckets.
+
+    Tiling has a solution on depth width, so each solution needs width column
+    choices over up to 2 * width columns.
+    """
+    problem_data = generate_domino_problem_data(width)
+    limits = SearchLimits(max_solutions=100)
+    for algo_class, matrix_class in [(DLX, DLXMatrix), (DictX, DictMatrix)]:
+        for strategy_class in [MRV, BucketMRV]:
+            size_buckets = strategy_class.uses_size_buckets
+            algo = algo_class(iterative=True, strategy=strategy_class())
+            matrix = matrix_class(problem_data, size_buckets=size_buckets)
+
+            start_time = time.time()
+            solutions = algo.solve(matrix, limits)
+            time_solving = time.time() - start_time
+
+            print(
+                f"Algorithm {algo_class.__name__} ({strategy_class.__name__}) found "
+                f"{len(solutions)} solutions for 2x{width} domino tiling with "
+                f"{len(problem_data[0])} columns in {round(time_solving, 3)} "
+                f"seconds."
+            )
+
+
+def run_size_bucket_tests():
+    """Test how column selection time scales with number of columns."""
+    for width in [50, 500, 5000]:
+        compare_scanning_and_size_buckets(width)
+
+
+def compare_validated_and_trusted_construction(n):
+    """Compare time of creating matrices with and without validating data."""
+    problem_data = generate_generic_sample_data(n, 1)
+    for matrix_class in [DLXMatrix, DictMatrix, ArrayMatrix]:
+        times = []
+        for trusted in [False, True]:
+            start_time = time.time()
+            matrix_class(problem_data, trusted=trusted)
+            times.append(time.time() - start_time)
+        print(
+            f"Creating {matrix_class.__name__} with {n} columns took "
+            f"{round(times[0], 3)} seconds with validation and "
+            f"{round(times[1], 3)} seconds trusted."
+        )
+
+
+def run_construction_tests():
+    """Test matrix construction time with different amount of columns."""
+    for n in [1000, 10000, 100000]:
+        compare_validated_and_trusted_construction(n)
+
+
+def compare_raw_and_compiled_construction(name, problem_data, repeats):
+    """Compare creating matrices from data to creating them from compiled problem.
+
+    Problem is compiled once, like when solving the same problem repeatedly.
+    """
+    start_time = time.time()
+    compiled = compile_problem(problem_data)
+    time_compiling = time.time() - start_time
+    print(f"Compiling {name} took {round(time_compiling, 3)} seconds.")
+    for matrix_class in [DLXMatrix, DictMatrix, ArrayMatrix, BitMatrix]:
+        times = []
+        for problem in [problem_data, compiled]:
+            start_time = time.time()
+            for _ in range(repeats):
+                matrix_class(problem)
+            times.append(time.time() - start_time)
+        print(
+            f"Creating {matrix_class.__name__} {repeats} times for {name} took "
+            f"{round(times[0], 3)} seconds from data and {round(times[1], 3)} "
+            "seconds from compiled problem."
+        )
+
+
+def run_compiled_problem_tests():
+    """Test how much compiling problem once helps creating matrices repeatedly."""
+    pentomino_data = PentominoCreator().create_problem_data(6, 10)
+    compare_raw_and_compiled_construction("6x10 pentomino", pentomino_data, 10)
+    sudoku_data = SudokuCreator().create_problem_data([[0] * 9 for _ in range(9)])
+    compare_raw_and_compiled_construction("empty sudoku", sudoku_data, 10)
+
+
+def compare_compiling_and_loading(name, problem_data):
+    """Compare compiling problem from data to loading it from a problem file.
+
+    Loading memory maps the row arrays, so it shouldn't depend on the problem size.
+    """
+    start_time = time.time()
+    compiled = compile_problem(problem_data)
+    time_compiling = time.time() - start_time
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "problem.ecp")
+        start_time = time.time()
+        save_problem(compiled, path)
+        time_saving = time.time() - start_time
+        start_time = time.time()
+        loaded = load_problem(path)
+        time_loading = time.time() - start_time
+        start_time = time.time()
+        matrix = DLXMatrix(loaded)
+        time_creating = time.time() - start_time
+        size = os.path.getsize(path)
+        del loaded, matrix
+    print(
+        f"Compiling {name} with {len(compiled.indices)} elements in subsets took "
+        f"{round(time_compiling, 3)} seconds, saving it to a {size // 1024} KiB "
+        f"file {round(time_saving, 3)} seconds and loading it "
+        f"{round(time_loading, 5)} seconds. Creating DLXMatrix from loaded problem "
+        f"took {round(time_creating, 3)} seconds."
+    )
+
+
+def run_problem_file_tests():
+    """Test how fast compiled problems are saved to and loaded from problem files."""
+    pentomino_data = PentominoCreator().create_problem_data(6, 10)
+    compare_compiling_and_loading("6x10 pentomino", pentomino_data)
+    for n, m in [(100000, 1), (1000000, 1), (1000000, 3)]:
+        problem_data = generate_generic_sample_data(n, m)
+        compare_compiling_and_loading(f"generic n={n} m={m}", problem_data)
+
+
+def generate_random_problem_data(items, options, option_size):
+    """Generate problem with options of random items, like benchmark instances."""
+    random_generator = random.Random(0)
+    universe = [f"i{item}" for item in range(items)]
+    subset_collection = {
+        option: random_generator.sample(universe, option_size)
+        for option in range(options)
+    }
+    return universe, subset_collection
+
+
+def measure_dlx_format_throughput(items, options, option_size):
+    """Measure how fast problems are written to and read from DLX files.
+
+    Peak memory of reading is measured separately, since tracing slows reading down.
+    """
+    problem_data = generate_random_problem_data(items, options, option_size)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "problem.dlx")
+        start_time = time.time()
+        write_dlx(problem_data, path)
+        time_writing = time.time() - start_time
+        megabytes = os.path.getsize(path) / 1024**2
+        start_time = time.time()
+        read_dlx(path)
+        time_reading = time.time() - start_time
+        tracemalloc.start()
+        read_dlx(path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    print(
+        f"DLX file with {options} options of {option_size} items out of {items} "
+        f"is {round(megabytes, 1)} MB. Writing took {round(time_writing, 3)} "
+        f"seconds ({round(megabytes / time_writing, 1)} MB/s) and reading "
+        f"{round(time_reading, 3)} seconds ({round(megabytes / time_reading, 1)} "
+        f"MB/s), using at most {round(peak / 1024 ** 2, 1)} MB of memory."
+    )
+
+
+def run_dlx_format_tests():
+    """Test throughput of reading and writing DLX files."""
+    for items, options, option_size in [
+        (1000, 100000, 5),
+        (1000, 1000000, 5),
+        (100000, 100000, 50),
+    ]:
+        measure_dlx_format_throughput(items, options, option_size)
+
+
+def compare_cached_and_uncached_solving(name, solve, repeats):
+    """Compare solving the same problem repeatedly with and without a cache.
+
+    Cached solves still build problem data to key it and translate solutions.
+    """
+    for cache in [None, SolutionCache()]:
+        solver = Solver(cache=cache)
+        start_time = time.time()
+        for _ in range(repeats):
+            solve(solver)
+        total_time = time.time() - start_time
+        mode = "without cache" if cache is None else "with cache"
+        hits = "" if cache is None else f", {cache.hits} hits, {cache.misses} misses"
+        print(
+            f"Solving {name} {repeats} times {mode} took {round(total_time, 3)} "
+            f"seconds{hits}."
+        )
+
+
+def run_cache_tests():
+    """Test how much caching helps solving popular problems repeatedly."""
+    compare_cached_and_uncached_solving(
+        "3x20 pentomino",
+        lambda solver: solver.solve_pentomino_problem("DLX", 3, 20),
+        5,
+    )
+    hardest_sudoku_ever = [
+        [8, 0, 0, 0, 0, 0, 0, 0, 0],
+        [0, 0, 3, 6, 0, 0, 0, 0, 0],
+        [0, 7, 0, 0, 9, 0, 2, 0, 0],
+        [0, 5, 0, 0, 0, 7, 0, 0, 0],
+        [0, 0, 0, 0, 4, 5, 7, 0, 0],
+        [0, 0, 0, 1, 0, 0, 0, 3, 0],
+        [0, 0, 1, 0, 0, 0, 0, 6, 8],
+        [0, 0, 8, 5, 0, 0, 0, 1, 0],
+        [0, 9, 0, 0, 0, 0, 4, 0, 0],
+    ]
+    compare_cached_and_uncached_solving(
+        "hardest sudoku",
+        lambda solver: solver.solve_sudoku_problem("DLX", hardest_sudoku_ever),
+        20,
+    )
+
+
+def compare_stored_and_searched_pentominoes(height, width):
+    """Compare serving a pentomino board from the store with searching it."""
+    for precomputed in [False, True]:
+        solver = Solver(precomputed=precomputed)
+        start_time = time.time()
+        amount = len(solver.solve_pentomino_problem("DLX", height, width))
+        total_time = time.time() - start_time
+        mode = "from the store" if precomputed else "by searching"
+        print(
+            f"Getting {amount} solutions of {height}x{width} pentomino board {mode} "
+            f"took {round(total_time, 3)} seconds."
+        )
+
+
+def run_pentomino_store_tests():
+    """Test how much faster precomputed pentomino solutions are served."""
+    for height, width in [(3, 20), (4, 15), (5, 12), (6, 10)]:
+        compare_stored_and_searched_pentominoes(height, width)
+
+
 def main() -> None:
     """Run different type of big input performance tests against algorithms."""
     run_pentomino_tests()
     run_sudoku_tests()
     run_generic_tests()
+    run_search_mode_tests()
+    run_engine_tests()
+    run_parallel_tests()
+    run_memoized_counting_tests()
+    run_secondary_column_tests()
+    run_color_tests()
+    run_strategy_tests()
+    run_limit_tests()
+    run_instrumentation_tests()
+    run_estimate_tests()
+    run_reduction_tests()
+    run_decomposition_tests()
+    run_duplicate_row_tests()
+    run_size_bucket_tests()
+    run_construction_tests()
+    run_compiled_problem_tests()
+    run_problem_file_tests()
+    run_dlx_format_tests()
+    run_cache_tests()
+    run_pentomino_store_tests()
 
 
 if __name__ == "__main__":
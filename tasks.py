@@ -38,3 +38,13 @@ def docs(ctx):
     ctx.run("pdoc --html --force --output-dir pdoc exact_cover_solver")
     ctx.run("cp -vaR pdoc/exact_cover_solver/. pdoc/")
     ctx.run("rm -r pdoc/exact_cover_solver")
+
+
+@task
+def pentomino_store(ctx):
+    """Search solutions of every pentomino board and store them to the package."""
+    ctx.run(
+        "python3 -c 'import os; "
+        "from exact_cover_solver.services.pentomino_store import build_store; "
+        "build_store(workers=os.cpu_count() or 1)'"
+    )
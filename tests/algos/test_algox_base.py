@@ -1,7 +1,27 @@
 import pytest
 from exact_cover_solver.algos.algox_base import AlgorithmX
+from exact_cover_solver.algos.arraydlx import ArrayDLX
+from exact_cover_solver.algos.bitx import BitX
+from exact_cover_solver.algos.dictx import DictX
+from exact_cover_solver.algos.dlx import DLX
+from exact_cover_solver.algos.limits import SearchLimits
+from exact_cover_solver.algos.xcc import XCC
+from exact_cover_solver.datastructures.arraymatrix import ArrayMatrix
+from exact_cover_solver.datastructures.bitmatrix import BitMatrix
+from exact_cover_solver.datastructures.compiled import compile_problem
+from exact_cover_solver.datastructures.dictmatrix import DictMatrix
+from exact_cover_solver.datastructures.dlxmatrix import DLXMatrix
+from exact_cover_solver.datastructures.xccmatrix import XCCMatrix
 from unittest.mock import Mock
 
+ENGINES = [
+    (DLX, DLXMatrix),
+    (DictX, DictMatrix),
+    (ArrayDLX, ArrayMatrix),
+    (BitX, BitMatrix),
+    (XCC, XCCMatrix),
+]
+
 
 def test_not_possible_to_call_solve_without_real_implementation():
     class FakeAlgoX(AlgorithmX):
@@ -11,3 +31,46 @@ def test_not_possible_to_call_solve_without_real_implementation():
     with pytest.raises(NotImplementedError):
         algo = FakeAlgoX()
         algo.solve(Mock())
+
+
+def test_default_iter_solutions_yields_solutions_from_solve():
+    class FakeAlgoX(AlgorithmX):
+        def solve(self, matrix):
+            return [[1, 2], [3]]
+
+    assert list(FakeAlgoX().iter_solutions(Mock())) == [[1, 2], [3]]
+
+
+def test_default_count_consumes_solutions():
+    class FakeAlgoX(AlgorithmX):
+        def solve(self, matrix):
+            return [[1, 2], [3]]
+
+    assert FakeAlgoX().count(Mock()) == 2
+
+
+@pytest.mark.parametrize("algo_class, matrix_class", ENGINES)
+def test_solutions_of_merged_rows_are_expanded(algo_class, matrix_class):
+    problem_data = ([1, 2], {"a": [1], "b": [2], "c": [1], "d": [1, 2], "e": [2]})
+    matrix = matrix_class(problem_data)
+    correct = [["a", "b"], ["a", "e"], ["b", "c"], ["c", "e"], ["d"]]
+    assert sorted(map(sorted, algo_class().solve(matrix))) == correct
+    assert sorted(map(sorted, algo_class().iter_solutions(matrix))) == correct
+    assert algo_class().count(matrix) == 5
+    limited = algo_class().solve(matrix, SearchLimits(max_solutions=3))
+    assert len(limited) == 3
+    assert not limited.complete
+
+
+def test_all_engines_solve_matrices_of_one_compiled_problem():
+    problem_data = (
+        [1, 2, 3],
+        {"a": [1, "x"], "b": [2], "c": [3], "d": [2, 3, "x"], "e": [1]},
+        ["x"],
+    )
+    compiled = compile_problem(problem_data)
+    correct = [["a", "b", "c"], ["b", "c", "e"], ["d", "e"]]
+    for algo_class, matrix_class in ENGINES:
+        for _ in range(2):
+            solutions = algo_class().solve(matrix_class(compiled))
+            assert sorted(map(sorted, solutions)) == correct
@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 
 from exact_cover_solver.algos.dlx import DLX
@@ -55,6 +57,26 @@ def problem_data_with_solution(request):
         )
 
 
+@pytest.fixture
+def queens_problem_data():
+    """Place eight queens, diagonals are secondary since they may stay empty."""
+    universe = [("row", i) for i in range(8)] + [("column", i) for i in range(8)]
+    secondary_universe = [("diagonal", i) for i in range(15)] + [
+        ("antidiagonal", i) for i in range(15)
+    ]
+    subset_collection = {
+        (row, column): [
+            ("row", row),
+            ("column", column),
+            ("diagonal", row + column),
+            ("antidiagonal", row - column + 7),
+        ]
+        for row in range(8)
+        for column in range(8)
+    }
+    return universe, subset_collection, secondary_universe
+
+
 def calc_dlx_node_amount(root):
     """Calculate column size sum from given root, helper function for tests."""
     amount = 0
@@ -192,3 +214,155 @@ def test_uncovering_restores_correct_amount_of_objects(
 
     assert amount_after_cover != original_amount
     assert amount_after_uncover == original_amount
+
+
+@pytest.mark.parametrize(
+    "problem_data_with_solution",
+    ["single", "multiple"],
+    indirect=["problem_data_with_solution"],
+)
+def test_iterative_search_finds_same_solutions_in_same_order(
+    problem_data_with_solution, algo_and_matrix_class
+):
+    algo_class, matrix_class = algo_and_matrix_class
+    recursive_solutions = algo_class().solve(matrix_class(problem_data_with_solution))
+    iterative_solutions = algo_class(iterative=True).solve(
+        matrix_class(problem_data_with_solution)
+    )
+
+    assert iterative_solutions == recursive_solutions
+
+
+def test_iterative_search_is_not_limited_by_recursion_depth(algo_and_matrix_class):
+    algo_class, matrix_class = algo_and_matrix_class
+    depth = sys.getrecursionlimit() + 100
+    universe = list(range(depth))
+    subset_collection = {element: [element] for element in universe}
+    matrix = matrix_class((universe, subset_collection))
+    solutions = algo_class(iterative=True).solve(matrix)
+
+    assert len(solutions) == 1
+    assert sorted(solutions[0]) == universe
+
+
+@pytest.mark.parametrize(
+    "problem_data_with_solution",
+    ["single", "multiple"],
+    indirect=["problem_data_with_solution"],
+)
+def test_iter_solutions_yields_same_solutions_as_solve(
+    problem_data_with_solution, algo_and_matrix_class
+):
+    algo_class, matrix_class = algo_and_matrix_class
+    solutions = algo_class(iterative=True).solve(
+        matrix_class(problem_data_with_solution)
+    )
+    iterated_solutions = list(
+        algo_class().iter_solutions(matrix_class(problem_data_with_solution))
+    )
+
+    assert iterated_solutions == solutions
+
+
+def test_abandoned_iteration_restores_matrix(algo_and_matrix_class):
+    algo_class, matrix_class = algo_and_matrix_class
+    universe = list(range(6))
+    subset_collection = {i: [element] for i, element in enumerate(universe * 2)}
+    matrix = matrix_class((universe, subset_collection))
+    algo = algo_class()
+
+    solutions = algo.iter_solutions(matrix)
+    first_solution = next(solutions)
+    solutions.close()
+
+    assert len(first_solution) == len(universe)
+    assert len(algo.solve(matrix)) == 2 ** len(universe)
+
+
+@pytest.mark.parametrize(
+    "problem_data_with_solution, correct_amount",
+    [("single", 1), ("multiple", 3)],
+    indirect=["problem_data_with_solution"],
+)
+def test_count_returns_amount_of_solutions(
+    problem_data_with_solution, correct_amount, algo_and_matrix_class
+):
+    algo_class, matrix_class = algo_and_matrix_class
+    matrix = matrix_class(problem_data_with_solution)
+    algo = algo_class()
+
+    assert algo.count(matrix) == correct_amount
+    assert len(algo.solve(matrix)) == correct_amount
+
+
+@pytest.mark.parametrize("cache_size", [1, 1000])
+def test_memoized_count_matches_plain_count(cache_size, algo_and_matrix_class):
+    algo_class, matrix_class = algo_and_matrix_class
+    universe = list(range(12))
+    subset_collection = {
+        i: [element, (element + 1) % 12] for i, element in enumerate(universe * 3)
+    }
+    matrix = matrix_class((universe, subset_collection))
+    algo = algo_class()
+
+    amount = algo.count(matrix)
+    assert amount == 2 * 3**6
+    assert algo.count_memoized(matrix, cache_size) == amount
+
+
+@pytest.mark.parametrize(
+    "problem_data_no_solution",
+    ["numbers", "strings"],
+    indirect=["problem_data_no_solution"],
+)
+def test_memoized_count_is_zero_without_solutions(
+    problem_data_no_solution, algo_and_matrix_class
+):
+    algo_class, matrix_class = algo_and_matrix_class
+    matrix = matrix_class(problem_data_no_solution)
+    assert algo_class().count_memoized(matrix) == 0
+
+
+def test_secondary_columns_are_covered_at_most_once(
+    queens_problem_data, algo_and_matrix_class
+):
+    algo_class, matrix_class = algo_and_matrix_class
+    solutions = algo_class().solve(matrix_class(queens_problem_data))
+    assert len(solutions) == 92
+    for solution in solutions:
+        assert len({row + column for row, column in solution}) == 8
+        assert len({row - column for row, column in solution}) == 8
+
+
+@pytest.mark.parametrize("iterative", [False, True])
+def test_counting_with_secondary_columns(
+    iterative, queens_problem_data, algo_and_matrix_class
+):
+    algo_class, matrix_class = algo_and_matrix_class
+    algo = algo_class(iterative)
+    assert algo.count(matrix_class(queens_problem_data)) == 92
+    assert algo.count_memoized(matrix_class(queens_problem_data)) == 92
+
+
+def test_secondary_columns_are_not_needed_in_solution(algo_and_matrix_class):
+    algo_class, matrix_class = algo_and_matrix_class
+    problem_data = ([1, 2], {"a": [1, "x"], "b": [2, "x"], "c": [2]}, ["x", "y"])
+    solutions = algo_class().solve(matrix_class(problem_data))
+    assert solutions == [["a", "c"]]
+
+
+@pytest.mark.parametrize("iterative", [False, True])
+def test_duplicate_rows_are_searched_once(iterative, algo_and_matrix_class):
+    algo_class, matrix_class = algo_and_matrix_class
+    universe = list(range(4))
+    subset_collection = {i: [i % 4] for i in range(12)}
+    matrix = matrix_class((universe, subset_collection))
+    algo = algo_class(iterative)
+
+    solutions = algo.solve(matrix)
+    assert len({frozenset(solution) for solution in solutions}) == 81
+    assert algo.count(matrix) == 81
+    assert algo.count_memoized(matrix) == 81
+    instrumented = algo_class(instrument=True).solve(matrix)
+    assert instrumented.stats.nodes == 5
+    assert sorted(map(sorted, instrumented)) == sorted(map(sorted, solutions))
@@ -0,0 +1,75 @@
+import pytest
+
+from exact_cover_solver.algos.arraydlx import ArrayDLX
+from exact_cover_solver.algos.dlx import DLX
+from exact_cover_solver.datastructures.arraymatrix import ArrayMatrix
+from exact_cover_solver.datastructures.dlxmatrix import DLXMatrix
+from exact_cover_solver.data_creators import SudokuCreator
+
+
+@pytest.fixture
+def problem_data():
+    return (
+        [1, 2, 3, 4, 5, 6, 7],
+        {
+            1: [4, 7],
+            2: [3],
+            3: [2, 6],
+            4: [1, 3, 5],
+            5: [1, 4, 5, 7],
+            6: [1, 2, 4, 5, 6, 7],
+        },
+    )
+
+
+@pytest.fixture
+def sudoku_problem_data():
+    sudoku = [[(y * 3 + y // 3 + x) % 9 + 1 for x in range(9)] for y in range(9)]
+    for y in range(6, 9):
+        sudoku[y] = [0] * 9
+    return SudokuCreator().create_problem_data(sudoku)
+
+
+def test_correct_solutions_are_found(problem_data):
+    solutions = ArrayDLX().solve(ArrayMatrix(problem_data))
+    assert sorted(sorted(solution) for solution in solutions) == [
+        [1, 3, 4],
+        [2, 3, 5],
+        [2, 6],
+    ]
+
+
+def test_non_valid_solutions_are_not_reported():
+    problem_data = (
+        [1, 2, 3, 4, 5],
+        {1: [1, 2], 2: [3, 4], 3: [5, 1], 4: [2, 3], 5: [4, 5]},
+    )
+    assert ArrayDLX().solve(ArrayMatrix(problem_data)) == []
+
+
+def test_solutions_are_found_in_same_order_as_dlx(sudoku_problem_data):
+    solutions = ArrayDLX().solve(ArrayMatrix(sudoku_problem_data))
+    assert solutions == DLX().solve(DLXMatrix(sudoku_problem_data))
+    assert len(solutions) == 1728
+
+
+def test_counting_and_iterating_agree_with_solving(sudoku_problem_data):
+    matrix = ArrayMatrix(sudoku_problem_data)
+    algo = ArrayDLX()
+    solutions = algo.solve(matrix)
+    assert list(algo.iter_solutions(matrix)) == solutions
+    assert algo.count(matrix) == len(solutions)
+
+
+def test_search_does_not_modify_matrix(sudoku_problem_data):
+    matrix = ArrayMatrix(sudoku_problem_data)
+    links = [list(matrix.left), list(matrix.up), list(matrix.size)]
+    solutions = ArrayDLX().iter_solutions(matrix)
+    next(solutions)
+    solutions.close()
+    assert [list(matrix.left), list(matrix.up), list(matrix.size)] == links
+
+
+def test_secondary_columns_are_covered_at_most_once():
+    problem_data = ([1, 2], {"a": [1, "x"], "b": [2, "x"], "c": [2]}, ["x", "y"])
+    assert ArrayDLX().solve(ArrayMatrix(problem_data)) == [["a", "c"]]
@@ -0,0 +1,75 @@
+import pytest
+
+from exact_cover_solver.algos.bitx import BitX
+from exact_cover_solver.algos.dlx import DLX
+from exact_cover_solver.datastructures.bitmatrix import BitMatrix
+from exact_cover_solver.datastructures.dlxmatrix import DLXMatrix
+from exact_cover_solver.data_creators import SudokuCreator
+
+
+@pytest.fixture
+def problem_data():
+    return (
+        [1, 2, 3, 4, 5, 6, 7],
+        {
+            1: [4, 7],
+            2: [3],
+            3: [2, 6],
+            4: [1, 3, 5],
+            5: [1, 4, 5, 7],
+            6: [1, 2, 4, 5, 6, 7],
+        },
+    )
+
+
+@pytest.fixture
+def sudoku_problem_data():
+    sudoku = [[(y * 3 + y // 3 + x) % 9 + 1 for x in range(9)] for y in range(9)]
+    for y in range(6, 9):
+        sudoku[y] = [0] * 9
+    return SudokuCreator().create_problem_data(sudoku)
+
+
+def test_correct_solutions_are_found(problem_data):
+    solutions = BitX().solve(BitMatrix(problem_data))
+    assert sorted(sorted(solution) for solution in solutions) == [
+        [1, 3, 4],
+        [2, 3, 5],
+        [2, 6],
+    ]
+
+
+def test_non_valid_solutions_are_not_reported():
+    problem_data = (
+        [1, 2, 3, 4, 5],
+        {1: [1, 2], 2: [3, 4], 3: [5, 1], 4: [2, 3], 5: [4, 5]},
+    )
+    assert BitX().solve(BitMatrix(problem_data)) == []
+
+
+def test_solutions_are_found_in_same_order_as_dlx(sudoku_problem_data):
+    solutions = BitX().solve(BitMatrix(sudoku_problem_data))
+    assert solutions == DLX().solve(DLXMatrix(sudoku_problem_data))
+    assert len(solutions) == 1728
+
+
+def test_counting_and_iterating_agree_with_solving(sudoku_problem_data):
+    matrix = BitMatrix(sudoku_problem_data)
+    algo = BitX()
+    solutions = algo.solve(matrix)
+    assert list(algo.iter_solutions(matrix)) == solutions
+    assert algo.count(matrix) == len(solutions)
+
+
+@pytest.mark.parametrize(
+    "live, correct_column", [(0b111111, 1), (0b110110, 2), (0b000011, 0)]
+)
+def test_optimal_column_is_chosen(problem_data, live, correct_column):
+    matrix = BitMatrix(problem_data)
+    column = BitX._choose_optimal_column(matrix.column_masks, live, matrix.all_columns)
+    assert column == correct_column
+
+
+def test_secondary_columns_are_covered_at_most_once():
+    problem_data = ([1, 2], {"a": [1, "x"], "b": [2, "x"], "c": [2]}, ["x", "y"])
+    assert BitX().solve(BitMatrix(problem_data)) == [["a", "c"]]
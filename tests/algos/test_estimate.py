@@ -0,0 +1,91 @@
+import pytest
+
+from exact_cover_solver.algos.dictx import DictX
+from exact_cover_solver.algos.dlx import DLX
+from exact_cover_solver.algos.estimate import TreeSizeEstimate
+from exact_cover_solver.datastructures.dictmatrix import DictMatrix
+from exact_cover_solver.datastructures.dlxmatrix import DLXMatrix
+
+ENGINES = [(DLX, DLXMatrix), (DictX, DictMatrix)]
+
+
+def create_queens_problem_data(n):
+    universe = [("row", i) for i in range(n)] + [("column", i) for i in range(n)]
+    secondary_universe = [("diagonal", i) for i in range(2 * n - 1)] + [
+        ("antidiagonal", i) for i in range(2 * n - 1)
+    ]
+    subset_collection = {
+        (row, column): [
+            ("row", row),
+            ("column", column),
+            ("diagonal", row + column),
+            ("antidiagonal", row - column + n - 1),
+        ]
+        for row in range(n)
+        for column in range(n)
+    }
+    return universe, subset_collection, secondary_universe
+
+
+def test_estimate_needs_at_least_two_probes():
+    with pytest.raises(ValueError):
+        TreeSizeEstimate([(1, 1)])
+
+
+def test_bounds_are_clamped_to_possible_values():
+    estimate = TreeSizeEstimate([(1, 0), (1, 0), (100, 2)])
+    assert estimate.nodes == 34
+    assert estimate.nodes_bounds[0] == 1
+    assert estimate.solutions_bounds[0] == 0
+    assert estimate.probes == 3
+
+
+@pytest.mark.parametrize("algo_class, matrix_class", ENGINES)
+def test_estimate_is_exact_for_uniform_tree(algo_class, matrix_class):
+    problem_data = (
+        list(range(4)),
+        {i: [i % 4, ("own", i)] for i in range(12)},
+        [("own", i) for i in range(12)],
+    )
+    estimate = algo_class().estimate(matrix_class(problem_data), probes=5)
+    assert estimate.nodes == 1 + 3 + 9 + 27 + 81
+    assert estimate.nodes_bounds == (estimate.nodes, estimate.nodes)
+    assert estimate.solutions == 81
+    assert estimate.solutions_bounds == (81, 81)
+
+
+@pytest.mark.parametrize("algo_class, matrix_class", ENGINES)
+def test_estimate_counts_solutions_of_merged_rows(algo_class, matrix_class):
+    problem_data = (list(range(4)), {i: [i % 4] for i in range(12)})
+    estimate = algo_class().estimate(matrix_class(problem_data), probes=5)
+    assert estimate.nodes == 5
+    assert estimate.solutions == 81
+
+
+@pytest.mark.parametrize("algo_class, matrix_class", ENGINES)
+def test_estimate_bounds_contain_real_solution_count(algo_class, matrix_class):
+    matrix = matrix_class(create_queens_problem_data(6))
+    estimate = algo_class().estimate(matrix, probes=2000, seed=0)
+    low, high = estimate.solutions_bounds
+    assert low <= 4 <= high
+
+
+def test_estimate_bounds_contain_real_tree_size():
+    matrix = DLXMatrix(create_queens_problem_data(6))
+    low, high = DLX().estimate(matrix, probes=2000, seed=0).nodes_bounds
+    nodes = DLX(instrument=True).solve(matrix).stats.nodes
+    assert low <= nodes <= high
+
+
+@pytest.mark.parametrize("algo_class, matrix_class", ENGINES)
+def test_matrix_is_restored_after_estimating(algo_class, matrix_class):
+    matrix = matrix_class(create_queens_problem_data(6))
+    algo_class().estimate(matrix, probes=50, seed=1)
+    assert algo_class().count(matrix) == 4
+
+
+def test_same_seed_gives_same_estimate():
+    matrix = DLXMatrix(create_queens_problem_data(6))
+    first = DLX().estimate(matrix, probes=50, seed=1)
+    second = DLX().estimate(matrix, probes=50, seed=1)
+    assert (first.nodes, first.solutions) == (second.nodes, second.solutions)
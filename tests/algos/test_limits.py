@@ -0,0 +1,116 @@
+import pytest
+
+from exact_cover_solver.algos.arraydlx import ArrayDLX
+from exact_cover_solver.algos.bitx import BitX
+from exact_cover_solver.algos.dictx import DictX
+from exact_cover_solver.algos.dlx import DLX
+from exact_cover_solver.algos.limits import LimitTracker, SearchLimits, SearchResult
+from exact_cover_solver.algos.xcc import XCC
+from exact_cover_solver.datastructures.arraymatrix import ArrayMatrix
+from exact_cover_solver.datastructures.bitmatrix import BitMatrix
+from exact_cover_solver.datastructures.dictmatrix import DictMatrix
+from exact_cover_solver.datastructures.dlxmatrix import DLXMatrix
+from exact_cover_solver.datastructures.xccmatrix import XCCMatrix
+
+ENGINES = [
+    (DLX, DLXMatrix),
+    (DictX, DictMatrix),
+    (ArrayDLX, ArrayMatrix),
+    (BitX, BitMatrix),
+    (XCC, XCCMatrix),
+]
+
+
+@pytest.fixture
+def problem_data():
+    """Pick one of three rows for each of four columns, 81 solutions.
+
+    Rows have their own secondary elements, so they aren't merged as duplicates.
+    """
+    universe = list(range(4))
+    subset_collection = {i: [i % 4, ("own", i)] for i in range(12)}
+    return universe, subset_collection, [("own", i) for i in range(12)]
+
+
+def is_part_of(solutions, all_solutions):
+    """Check solutions are distinct and found by exhaustive search too."""
+    found = {tuple(sorted(solution)) for solution in solutions}
+    return len(found) == len(solutions) and found <= {
+        tuple(sorted(solution)) for solution in all_solutions
+    }
+
+
+@pytest.mark.parametrize("limit", ["max_nodes", "time_limit", "max_solutions"])
+@pytest.mark.parametrize("value", [0, -1])
+def test_limits_must_be_positive(limit, value):
+    with pytest.raises(ValueError):
+        SearchLimits(**{limit: value})
+
+
+def test_node_limit_allows_exactly_given_amount_of_visits():
+    for max_nodes in [1, 5, LimitTracker.check_interval, 3000]:
+        tracker = LimitTracker(SearchLimits(max_nodes=max_nodes))
+        assert all(tracker.visit() for _ in range(max_nodes))
+        assert not tracker.truncated
+        assert not tracker.visit()
+        assert tracker.truncated
+
+
+def test_time_limit_stops_search_on_next_check(monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr("exact_cover_solver.algos.limits.time.monotonic", clock.pop)
+    tracker = LimitTracker(SearchLimits(time_limit=1))
+    clock.append(2.0)
+    visits = 1
+    while tracker.visit():
+        visits += 1
+    assert visits == LimitTracker.check_interval
+    assert tracker.truncated
+
+
+@pytest.mark.parametrize("algo_class, matrix_class", ENGINES)
+def test_search_without_hitting_limits_is_complete(
+    algo_class, matrix_class, problem_data
+):
+    limits = SearchLimits(max_nodes=10**6, time_limit=60, max_solutions=100)
+    solutions = algo_class().solve(matrix_class(problem_data), limits)
+    assert isinstance(solutions, SearchResult)
+    assert solutions.complete
+    assert sorted(solutions) == sorted(algo_class().solve(matrix_class(problem_data)))
+
+
+@pytest.mark.parametrize("algo_class, matrix_class", ENGINES)
+def test_solution_limit_truncates_search(algo_class, matrix_class, problem_data):
+    matrix = matrix_class(problem_data)
+    solutions = algo_class().solve(matrix, SearchLimits(max_solutions=5))
+    assert not solutions.complete
+    assert len(solutions) == 5
+    assert is_part_of(solutions, algo_class().solve(matrix))
+
+
+@pytest.mark.parametrize("algo_class, matrix_class", ENGINES)
+def test_node_limit_truncates_search(algo_class, matrix_class, problem_data):
+    matrix = matrix_class(problem_data)
+    solutions = algo_class().solve(matrix, SearchLimits(max_nodes=10))
+    assert not solutions.complete
+    assert 0 < len(solutions) < 81
+    assert is_part_of(solutions, algo_class().solve(matrix))
+
+
+@pytest.mark.parametrize("algo_class, matrix_class", ENGINES)
+def test_matrix_is_restored_after_truncated_search(
+    algo_class, matrix_class, problem_data
+):
+    matrix = matrix_class(problem_data)
+    algo_class().solve(matrix, SearchLimits(max_nodes=7))
+    assert algo_class().count(matrix) == 81
+
+
+@pytest.mark.parametrize("algo_class, matrix_class", ENGINES[:4])
+def test_limits_are_not_allowed_with_multiple_workers(
+    algo_class, matrix_class, problem_data
+):
+    with pytest.raises(ValueError):
+        algo_class(workers=2).solve(
+            matrix_class(problem_data), SearchLimits(max_nodes=10)
+        )
@@ -0,0 +1,141 @@
+import pytest
+
+from exact_cover_solver.algos import ArrayDLX, BitX, DictX, DLX
+from exact_cover_solver.algos.parallel import (
+    split_problem,
+    solve_subproblem,
+    count_subproblem,
+)
+from exact_cover_solver.datastructures import (
+    ArrayMatrix,
+    BitMatrix,
+    DictMatrix,
+    DLXMatrix,
+)
+from exact_cover_solver.data_creators import SudokuCreator
+
+algo_and_matrix_classes = [
+    (DLX, DLXMatrix),
+    (DictX, DictMatrix),
+    (ArrayDLX, ArrayMatrix),
+    (BitX, BitMatrix),
+]
+
+
+@pytest.fixture(params=algo_and_matrix_classes)
+def algo_and_matrix_class(request):
+    return request.param
+
+
+@pytest.fixture
+def problem_data():
+    return (
+        [1, 2, 3, 4, 5, 6, 7],
+        {
+            1: [4, 7],
+            2: [3],
+            3: [2, 6],
+            4: [1, 3, 5],
+            5: [1, 4, 5, 7],
+            6: [1, 2, 4, 5, 6, 7],
+        },
+    )
+
+
+@pytest.fixture
+def sudoku_problem_data():
+    sudoku = [[(y * 3 + y // 3 + x) % 9 + 1 for x in range(9)] for y in range(9)]
+    for y in range(7, 9):
+        sudoku[y] = [0] * 9
+    return SudokuCreator().create_problem_data(sudoku)
+
+
+def test_split_expands_optimal_column_in_row_order(problem_data):
+    subproblems = split_problem(problem_data, 1)
+    assert [prefix for prefix, _ in subproblems] == [[3], [6]]
+    _, (universe, subset_collection) = subproblems[0]
+    assert universe == [1, 3, 4, 5, 7]
+    assert subset_collection == {1: [4, 7], 2: [3], 4: [1, 3, 5], 5: [1, 4, 5, 7]}
+
+
+def test_split_keeps_solved_and_dead_branches(problem_data):
+    subproblems = split_problem(problem_data, 3)
+    prefixes = [prefix for prefix, _ in subproblems]
+    assert [6, 2] in prefixes
+    assert all(len(prefix) <= 3 for prefix in prefixes)
+    solved = [prefix for prefix, (universe, _) in subproblems if not universe]
+    assert sorted(sorted(prefix) for prefix in solved) == [
+        [1, 3, 4],
+        [2, 3, 5],
+        [2, 6],
+    ]
+
+
+def test_subproblem_helpers_handle_solved_and_empty_subproblems():
+    solved = ([1, 2], ([], {}))
+    dead = ([1], ([3], {}))
+    assert solve_subproblem(DLX, DLXMatrix, solved) == [[1, 2]]
+    assert count_subproblem(DLX, DLXMatrix, solved) == 1
+    assert solve_subproblem(DLX, DLXMatrix, dead) == []
+    assert count_subproblem(DLX, DLXMatrix, dead) == 0
+
+
+def test_parallel_output_is_identical_to_serial(
+    sudoku_problem_data, algo_and_matrix_class
+):
+    algo_class, matrix_class = algo_and_matrix_class
+    serial = algo_class().solve(matrix_class(sudoku_problem_data))
+    parallel_algo = algo_class(workers=2)
+    parallel = parallel_algo.solve(matrix_class(sudoku_problem_data))
+
+    if algo_class is DictX:
+        assert sorted(parallel) == sorted(serial)
+    else:
+        assert parallel == serial
+    assert parallel_algo.count(matrix_class(sudoku_problem_data)) == len(serial)
+
+
+def test_parallel_iteration_can_be_abandoned(sudoku_problem_data):
+    solutions = DLX(workers=2, split_depth=1).iter_solutions(
+        DLXMatrix(sudoku_problem_data)
+    )
+    first_solution = next(solutions)
+    solutions.close()
+    assert len(first_solution) == 81
+
+
+@pytest.mark.parametrize("workers, split_depth", [(0, 2), (2, 0)])
+def test_non_positive_parallelism_options_are_not_allowed(workers, split_depth):
+    with pytest.raises(ValueError):
+        DLX(workers=workers, split_depth=split_depth)
+
+
+def test_split_carries_uncovered_secondary_elements():
+    problem_data = ([1, 2], {"a": [1, "x"], "b": [1], "c": [2, "x"]}, ["x", "y"])
+    subproblems = split_problem(problem_data, 1)
+    assert subproblems == [(["c"], ([1], {"b": [1]}, ["y"]))]
+
+
+def test_parallel_output_is_identical_to_serial_with_secondary_columns(
+    algo_and_matrix_class,
+):
+    algo_class, matrix_class = algo_and_matrix_class
+    universe = [("row", i) for i in range(6)] + [("column", i) for i in range(6)]
+    secondary_universe = [("diagonal", i) for i in range(11)] + [
+        ("antidiagonal", i) for i in range(11)
+    ]
+    subset_collection = {
+        (row, column): [
+            ("row", row),
+            ("column", column),
+            ("diagonal", row + column),
+            ("antidiagonal", row - column + 5),
+        ]
+        for row in range(6)
+        for column in range(6)
+    }
+    problem_data = (universe, subset_collection, secondary_universe)
+    serial = algo_class().solve(matrix_class(problem_data))
+    parallel = algo_class(workers=2).solve(matrix_class(problem_data))
+    assert sorted(map(sorted, parallel)) == sorted(map(sorted, serial))
+    assert len(serial) == 4
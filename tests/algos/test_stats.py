@@ -0,0 +1,110 @@
+import pytest
+
+from exact_cover_solver.algos.dictx import DictX
+from exact_cover_solver.algos.dlx import DLX
+from exact_cover_solver.algos.limits import SearchLimits
+from exact_cover_solver.algos.stats import SolveStats
+from exact_cover_solver.datastructures.dictmatrix import DictMatrix
+from exact_cover_solver.datastructures.dlxmatrix import DLXMatrix
+
+
+@pytest.fixture
+def problem_data():
+    return [1, 2], {"a": [1], "b": [2], "c": [1, 2]}
+
+
+def test_stats_are_empty_at_start():
+    stats = SolveStats()
+    assert stats.nodes == 0
+    assert stats.branching_factors == []
+    assert stats.phase_times == {}
+
+
+def test_branching_factors_are_averaged_per_depth():
+    stats = SolveStats()
+    stats.visit(0)
+    stats.choose(0, 4)
+    for rows in [1, 2]:
+        stats.visit(1)
+        stats.choose(1, rows)
+    stats.visit(2)
+    assert stats.nodes_per_depth == [1, 2, 1]
+    assert stats.branching_factors == [4.0, 1.5, 0.0]
+    assert stats.nodes == 4
+
+
+@pytest.mark.parametrize(
+    "algo_class, matrix_class, updates",
+    [(DLX, DLXMatrix, 8), (DictX, DictMatrix, 12)],
+)
+def test_instrumented_search_records_nodes_and_updates(
+    algo_class, matrix_class, updates, problem_data
+):
+    solutions = algo_class(instrument=True).solve(matrix_class(problem_data))
+    stats = solutions.stats
+    assert sorted(map(sorted, solutions)) == [["a", "b"], ["c"]]
+    assert stats.nodes_per_depth == [1, 2, 1]
+    assert stats.choices_per_depth == [1, 1, 0]
+    assert stats.rows_per_depth == [2, 1, 0]
+    assert stats.updates == updates
+    assert stats.solutions == 2
+    assert "search" in stats.phase_times
+
+
+@pytest.mark.parametrize(
+    "algo_class, matrix_class", [(DLX, DLXMatrix), (DictX, DictMatrix)]
+)
+def test_instrumented_search_finds_same_solutions(algo_class, matrix_class):
+    universe = list(range(6))
+    subset_collection = {i: [i % 6, (i + 1) % 6] for i in range(12)}
+    problem_data = (universe, subset_collection, [6])
+    matrix = matrix_class(problem_data)
+    solutions = algo_class(instrument=True).solve(matrix)
+    assert sorted(map(sorted, solutions)) == sorted(
+        map(sorted, algo_class().solve(matrix))
+    )
+    assert solutions.stats.solutions == len(solutions)
+
+
+@pytest.mark.parametrize(
+    "algo_class, matrix_class", [(DLX, DLXMatrix), (DictX, DictMatrix)]
+)
+def test_instrumented_search_respects_limits(algo_class, matrix_class):
+    problem_data = (
+        list(range(4)),
+        {i: [i % 4, ("own", i)] for i in range(12)},
+        [("own", i) for i in range(12)],
+    )
+    matrix = matrix_class(problem_data)
+    solutions = algo_class(instrument=True).solve(matrix, SearchLimits(max_nodes=10))
+    assert not solutions.complete
+    assert solutions.stats.nodes == 10
+    assert algo_class().count(matrix) == 81
+
+
+@pytest.mark.parametrize("algo_class", [DLX, DictX])
+def test_instrumentation_is_not_allowed_with_multiple_workers(algo_class):
+    with pytest.raises(ValueError):
+        algo_class(workers=2, instrument=True)
+
+
+def test_merged_stats_are_added_together():
+    stats = SolveStats()
+    stats.visit(0)
+    stats.choose(0, 2)
+    stats.updates = 4
+    stats.phase_times["matrix"] = 1.0
+    other = SolveStats()
+    for depth in range(3):
+        other.visit(depth)
+    other.choose(0, 3)
+    other.updates = 6
+    other.solutions = 1
+    other.phase_times = {"matrix": 0.5, "search": 2.0}
+    stats.merge(other)
+    assert stats.nodes_per_depth == [2, 1, 1]
+    assert stats.choices_per_depth == [2, 0, 0]
+    assert stats.rows_per_depth == [5, 0, 0]
+    assert stats.updates == 10
+    assert stats.solutions == 1
+    assert stats.phase_times == {"matrix": 1.5, "search": 2.0}
@@ -0,0 +1,131 @@
+import pytest
+
+from exact_cover_solver.algos.dictx import DictX
+from exact_cover_solver.algos.dlx import DLX
+from exact_cover_solver.algos.strategies import (
+    BucketMRV,
+    ColumnSelectionStrategy,
+    DegreeMRV,
+    EarlyExitMRV,
+    MRV,
+    RandomMRV,
+    STRATEGIES,
+)
+from exact_cover_solver.datastructures.dictmatrix import DictMatrix
+from exact_cover_solver.datastructures.dlxmatrix import DLXMatrix
+
+
+def choose_with_both_matrices(strategy, problem_data):
+    root = DLXMatrix(problem_data).root
+    column_dict, set_collection = DictMatrix(problem_data).data
+    return (
+        strategy.choose_column_object(root).id,
+        strategy.choose_column(column_dict, set_collection),
+    )
+
+
+@pytest.mark.parametrize(
+    "strategy, correct_column",
+    [
+        (MRV(), 2),
+        (EarlyExitMRV(), 1),
+        (DegreeMRV(), 2),
+        (RandomMRV(), 2),
+        (BucketMRV(), 2),
+    ],
+)
+def test_column_with_fewest_rows_is_chosen(strategy, correct_column):
+    problem_data = ([1, 2, 3], {"a": [1, 3], "b": [3]})
+    chosen = choose_with_both_matrices(strategy, problem_data)
+    assert chosen == (correct_column, correct_column)
+
+
+@pytest.mark.parametrize("strategy, correct_column", [(MRV(), 3), (DegreeMRV(), 4)])
+def test_ties_are_broken_by_degree(strategy, correct_column):
+    problem_data = ([1, 2, 3, 4], {"a": [1], "b": [1], "c": [2, 3], "d": [2, 4, 1]})
+    chosen = choose_with_both_matrices(strategy, problem_data)
+    assert chosen == (correct_column, correct_column)
+
+
+def test_random_ties_are_reproducible_with_seed():
+    problem_data = ([1, 2, 3, 4], {"a": [1, 2], "b": [3, 4]})
+    chosen = {
+        choose_with_both_matrices(RandomMRV(seed), problem_data) for seed in range(20)
+    }
+    assert {column for column, _ in chosen} == {1, 2, 3, 4}
+    assert choose_with_both_matrices(RandomMRV(1), problem_data) == (
+        choose_with_both_matrices(RandomMRV(1), problem_data)
+    )
+
+
+def test_secondary_columns_are_not_chosen():
+    column_dict = {"x": set(), 1: {"a", "b"}}
+    for strategy_class in STRATEGIES.values():
+        chosen = strategy_class().choose_column(column_dict, {}, frozenset(["x"]))
+        assert chosen == 1
+
+
+def test_choosing_from_empty_matrix_is_not_possible():
+    for strategy_class in STRATEGIES.values():
+        with pytest.raises(ValueError):
+            strategy_class().choose_column({}, {})
+        with pytest.raises(ValueError):
+            strategy_class().choose_column_object(DLXMatrix(([1], {1: [1]})).root.left)
+
+
+def test_not_possible_to_use_strategy_without_real_implementation():
+    with pytest.raises(TypeError):
+        ColumnSelectionStrategy()
+
+
+@pytest.mark.parametrize("strategy_class", STRATEGIES.values())
+@pytest.mark.parametrize(
+    "algo_class, matrix_class", [(DLX, DLXMatrix), (DictX, DictMatrix)]
+)
+def test_all_strategies_find_same_solutions(strategy_class, algo_class, matrix_class):
+    universe = list(range(6))
+    subset_collection = {i: [i % 6, (i + 1) % 6] for i in range(12)}
+    problem_data = (universe, subset_collection)
+    algo = algo_class(strategy=strategy_class())
+    solutions = algo.solve(matrix_class(problem_data))
+    correct = algo_class().solve(matrix_class(problem_data))
+    assert sorted(map(sorted, solutions)) == sorted(map(sorted, correct))
+    assert algo_class(True, strategy=strategy_class()).count(
+        matrix_class(problem_data)
+    ) == len(correct)
+
+
+def test_strategy_is_passed_to_worker_processes():
+    algo = DLX(workers=2, strategy=DegreeMRV())
+    worker_algo = algo._worker_algorithm()()
+    assert isinstance(worker_algo._strategy, DegreeMRV)
+    assert worker_algo._workers == 1
+
+
+def test_bucket_strategy_chooses_from_size_buckets():
+    problem_data = ([1, 2, 3, 4], {"a": [1, 2], "b": [2, 3], "c": [3, 4], "d": [4]})
+    root = DLXMatrix(problem_data, size_buckets=True).root
+    column_dict, set_collection = DictMatrix(problem_data, size_buckets=True).data
+    assert BucketMRV().choose_column_object(root).id == 1
+    assert BucketMRV().choose_column(column_dict, set_collection) == 1
+    root.right.detach()
+    del column_dict[1]
+    assert BucketMRV().choose_column_object(root).id == 2
+    column_dict.pop(2)
+    assert BucketMRV().choose_column(column_dict, set_collection) == 3
+
+
+@pytest.mark.parametrize("iterative", [False, True])
+@pytest.mark.parametrize(
+    "algo_class, matrix_class", [(DLX, DLXMatrix), (DictX, DictMatrix)]
+)
+def test_bucket_strategy_finds_same_solutions(iterative, algo_class, matrix_class):
+    universe = list(range(8))
+    subset_collection = {i: [i % 8, (i * 3 + 1) % 8] for i in range(16)}
+    subset_collection.update({i: [i % 8] for i in range(16, 20)})
+    matrix = matrix_class((universe, subset_collection), size_buckets=True)
+    algo = algo_class(iterative, strategy=BucketMRV())
+    correct = algo_class().solve(matrix_class((universe, subset_collection)))
+    assert sorted(map(sorted, algo.solve(matrix))) == sorted(map(sorted, correct))
+    assert algo.count(matrix) == len(correct)
+    assert algo.count_memoized(matrix) == len(correct)
@@ -0,0 +1,131 @@
+from exact_cover_solver.algos.dlx import DLX
+from exact_cover_solver.algos.xcc import XCC
+from exact_cover_solver.datastructures.dlxmatrix import DLXMatrix
+from exact_cover_solver.datastructures.xccmatrix import XCCMatrix
+
+
+def create_word_problem(words, height, width):
+    """Place each word once to grid, crossing words must agree on the letter."""
+    cells = [(y, x) for y in range(height) for x in range(width)]
+    subset_collection, colors = {}, {}
+    for word in words:
+        for y, x in cells:
+            for dy, dx in [(0, 1), (1, 0)]:
+                word_cells = [(y + dy * i, x + dx * i) for i in range(len(word))]
+                if all(cy < height and cx < width for cy, cx in word_cells):
+                    subset_collection[(word, y, x, dy)] = [word, *word_cells]
+                    colors[(word, y, x, dy)] = dict(zip(word_cells, word))
+    return (list(words), subset_collection, cells), colors
+
+
+def create_plain_problem(problem_data, colors):
+    """Encode colors with primary columns choosing color of each secondary element.
+
+    Each row using a colored element gets its own secondary column for it, and
+    choosing a color covers the columns of rows using another color.
+    """
+    universe, subset_collection, secondary_universe = problem_data
+    users = {element: {} for element in secondary_universe}
+    plain_collection = {}
+    for subset_id, subset in subset_collection.items():
+        plain_collection[subset_id] = [
+            ("use", element, subset_id) if element in users else element
+            for element in subset
+        ]
+        for element in subset:
+            if element in users:
+                users[element][subset_id] = colors[subset_id][element]
+    for element, used_colors in users.items():
+        for color in set(used_colors.values()):
+            plain_collection[("choose", element, color)] = [("color", element)] + [
+                ("use", element, subset_id)
+                for subset_id, used_color in used_colors.items()
+                if used_color != color
+            ]
+    plain_universe = universe + [("color", element) for element in users]
+    plain_secondary = [
+        ("use", element, subset_id)
+        for element, used_colors in users.items()
+        for subset_id in used_colors
+    ]
+    return plain_universe, plain_collection, plain_secondary
+
+
+def count_nodes_and_solve(algo_class, matrix):
+    class NodeCountingAlgo(algo_class):
+        nodes = 0
+
+        def _search(self, *args):
+            self.nodes += 1
+            super()._search(*args)
+
+    algo = NodeCountingAlgo()
+    solutions = algo.solve(matrix)
+    return solutions, algo.nodes
+
+
+def test_rows_with_same_color_can_share_secondary_element():
+    problem_data = ([1, 2], {"a": [1, "x"], "b": [2, "x"], "c": [2]}, ["x"])
+    matrix = XCCMatrix(problem_data, {"a": {"x": "red"}, "b": {"x": "red"}})
+    assert XCC().solve(matrix) == [["a", "b"], ["a", "c"]]
+
+
+def test_rows_with_different_color_conflict():
+    problem_data = ([1, 2], {"a": [1, "x"], "b": [2, "x"], "c": [2]}, ["x"])
+    matrix = XCCMatrix(problem_data, {"a": {"x": "red"}, "b": {"x": "blue"}})
+    assert XCC().solve(matrix) == [["a", "c"]]
+
+
+def test_uncolored_element_conflicts_with_colored_ones():
+    problem_data = ([1, 2], {"a": [1, "x"], "b": [2, "x"], "c": [2]}, ["x"])
+    matrix = XCCMatrix(problem_data, {"a": {"x": "red"}})
+    assert XCC().solve(matrix) == [["a", "c"]]
+
+
+def test_solutions_match_dlx_without_colors():
+    universe = [("row", i) for i in range(6)] + [("column", i) for i in range(6)]
+    secondary_universe = [("diagonal", i) for i in range(11)] + [
+        ("antidiagonal", i) for i in range(11)
+    ]
+    subset_collection = {
+        (row, column): [
+            ("row", row),
+            ("column", column),
+            ("diagonal", row + column),
+            ("antidiagonal", row - column + 5),
+        ]
+        for row in range(6)
+        for column in range(6)
+    }
+    problem_data = (universe, subset_collection, secondary_universe)
+    solutions = XCC().solve(XCCMatrix(problem_data))
+    assert solutions == DLX().solve(DLXMatrix(problem_data))
+    assert len(solutions) == 4
+
+
+def test_matrix_is_restored_after_search():
+    problem_data, colors = create_word_problem(["CAT", "ATE", "TEA", "EAT"], 3, 3)
+    matrix = XCCMatrix(problem_data, colors)
+    algo = XCC()
+    first = [solution[:] for solution in algo.solve(matrix)]
+    assert len(first) == 8
+    assert algo.solve(matrix) == first
+    assert algo.count(matrix) == 8
+
+
+def test_colors_search_fewer_nodes_than_plain_encoding():
+    words = ["ABC", "BCA", "CAB", "AAB", "BBC"]
+    problem_data, colors = create_word_problem(words, 3, 4)
+    plain_problem_data = create_plain_problem(problem_data, colors)
+
+    solutions, nodes = count_nodes_and_solve(XCC, XCCMatrix(problem_data, colors))
+    plain_solutions, plain_nodes = count_nodes_and_solve(
+        DLX, DLXMatrix(plain_problem_data)
+    )
+
+    picked_rows = {
+        tuple(sorted(row for row in solution if row[0] != "choose"))
+        for solution in plain_solutions
+    }
+    assert {tuple(sorted(solution)) for solution in solutions} == picked_rows
+    assert nodes < plain_nodes
@@ -0,0 +1,79 @@
+import pytest
+
+from exact_cover_solver.datastructures.arraymatrix import ArrayMatrix, ROOT
+
+
+@pytest.fixture
+def problem_data(request):
+    if request.param == "numbers":
+        return (
+            [1, 2, 3, 4, 5],
+            {1: [1, 2], 2: [3, 4], 3: [5, 1], 4: [2, 3], 5: [4, 5]},
+        )
+    elif request.param == "strings":
+        return (
+            ["Make", "Pera", "Mä"],
+            {"1st": ["Make", "Pera"], "2nd": ["Pera", "Mä"], "3rd": ["Mä", "Make"]},
+        )
+
+
+@pytest.mark.parametrize("problem_data", ["numbers", "strings"], indirect=True)
+def test_headers_are_circularly_linked_to_root(problem_data):
+    matrix = ArrayMatrix(problem_data)
+    universe, _ = problem_data
+    column = matrix.right[ROOT]
+    for element in universe:
+        assert matrix.column_ids[column - 1] == element
+        assert matrix.right[matrix.left[column]] == column
+        column = matrix.right[column]
+    assert column == ROOT
+    assert matrix.left[ROOT] == len(universe)
+
+
+@pytest.mark.parametrize("problem_data", ["numbers", "strings"], indirect=True)
+def test_each_column_has_correct_size_and_nodes(problem_data):
+    matrix = ArrayMatrix(problem_data)
+    universe, subset_collection = problem_data
+    for column, element in enumerate(universe, start=1):
+        rows = []
+        node = matrix.down[column]
+        while node != column:
+            assert matrix.column[node] == column
+            rows.append(matrix.row_ids[matrix.row[node]])
+            node = matrix.down[node]
+        assert matrix.size[column] == len(rows)
+        assert rows == [
+            subset_id
+            for subset_id, subset in subset_collection.items()
+            if element in subset
+        ]
+
+
+@pytest.mark.parametrize("problem_data", ["numbers", "strings"], indirect=True)
+def test_data_nodes_are_circularly_linked_together(problem_data):
+    matrix = ArrayMatrix(problem_data)
+    universe, subset_collection = problem_data
+    node = len(universe) + 1
+    for subset_id, subset_elements in subset_collection.items():
+        first = node
+        for element in subset_elements:
+            assert matrix.row_ids[matrix.row[node]] == subset_id
+            assert matrix.column_ids[matrix.column[node] - 1] == element
+            node = matrix.right[node]
+        assert node == first
+        assert matrix.left[first] == first + len(subset_elements) - 1
+        node = first + len(subset_elements)
+
+
+def test_data_node_creation_fails_with_empty_subset():
+    with pytest.raises(ValueError):
+        ArrayMatrix(([1], {1: [1], 2: []}), trusted=True)
+
+
+def test_secondary_headers_are_only_linked_to_themselves():
+    matrix = ArrayMatrix(([1, 2], {1: [1, "a"], 2: [2, "a"], 3: [2]}, ["a"]))
+    assert matrix.column_ids == [1, 2, "a"]
+    assert [matrix.right[ROOT], matrix.right[1], matrix.right[2]] == [1, 2, ROOT]
+    assert matrix.left[ROOT] == 2
+    assert matrix.left[3] == matrix.right[3] == 3
+    assert matrix.size[3] == 2
@@ -0,0 +1,62 @@
+import pytest
+
+from exact_cover_solver.datastructures.bitmatrix import BitMatrix
+
+
+@pytest.fixture
+def problem_data(request):
+    if request.param == "numbers":
+        return (
+            [1, 2, 3, 4, 5],
+            {1: [1, 2], 2: [3, 4], 3: [5, 1], 4: [2, 3], 5: [4, 5]},
+        )
+    elif request.param == "strings":
+        return (
+            ["Make", "Pera", "Mä"],
+            {"1st": ["Make", "Pera"], "2nd": ["Pera", "Mä"], "3rd": ["Mä", "Make"]},
+        )
+
+
+@pytest.mark.parametrize("problem_data", ["numbers", "strings"], indirect=True)
+def test_row_masks_have_subset_elements(problem_data):
+    matrix = BitMatrix(problem_data)
+    universe, subset_collection = problem_data
+    for row, subset_elements in enumerate(subset_collection.values()):
+        elements = [
+            element
+            for column, element in enumerate(universe)
+            if matrix.row_masks[row] >> column & 1
+        ]
+        assert sorted(elements) == sorted(subset_elements)
+
+
+@pytest.mark.parametrize("problem_data", ["numbers", "strings"], indirect=True)
+def test_column_masks_have_rows_where_element_appears(problem_data):
+    matrix = BitMatrix(problem_data)
+    universe, subset_collection = problem_data
+    for column, element in enumerate(universe):
+        subset_ids = [
+            subset_id
+            for row, subset_id in enumerate(matrix.row_ids)
+            if matrix.column_masks[column] >> row & 1
+        ]
+        assert subset_ids == [
+            subset_id
+            for subset_id, subset in subset_collection.items()
+            if element in subset
+        ]
+
+
+def test_conflict_masks_have_rows_sharing_columns():
+    matrix = BitMatrix(([1, 2, 3], {"a": [1], "b": [1, 2], "c": [3]}))
+    assert matrix.conflict_masks == [0b011, 0b011, 0b100]
+    assert matrix.all_rows == 0b111
+    assert matrix.all_columns == 0b111
+
+
+def test_secondary_columns_conflict_but_are_not_in_all_columns():
+    matrix = BitMatrix(([1, 2], {"a": [1, "x"], "b": [2, "x"], "c": [2]}, ["x"]))
+    assert matrix.column_ids == [1, 2, "x"]
+    assert matrix.row_masks == [0b101, 0b110, 0b010]
+    assert matrix.conflict_masks == [0b011, 0b111, 0b110]
+    assert matrix.all_columns == 0b011
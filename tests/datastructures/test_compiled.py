@@ -0,0 +1,68 @@
+import pytest
+
+from exact_cover_solver.datastructures.compiled import (
+    CompiledProblem,
+    compile_problem,
+    unpack_problem_data,
+)
+
+
+def test_problem_data_is_unpacked_with_empty_secondary_universe_by_default():
+    assert unpack_problem_data(([1], {1: [1]})) == ([1], {1: [1]}, [])
+    assert unpack_problem_data(([1], {1: [1, 2]}, [2])) == ([1], {1: [1, 2]}, [2])
+
+
+def test_rows_are_compiled_to_sparse_rows_of_column_indices():
+    problem_data = ([2, 1], {"x": [1, "a"], "y": [2], "z": ["b", 2, 1]}, ["b", "a"])
+    compiled = compile_problem(problem_data)
+    assert compiled.column_ids == [2, 1, "b", "a"]
+    assert compiled.primary_amount == 2
+    assert compiled.row_ids == ["x", "y", "z"]
+    assert list(compiled.indptr) == [0, 2, 3, 6]
+    assert list(compiled.indices) == [1, 3, 0, 2, 0, 1]
+    assert list(compiled.row(2)) == [2, 0, 1]
+    assert compiled.rows_amount == 3
+
+
+def test_elements_and_subset_ids_are_mapped_both_ways():
+    compiled = compile_problem(([("cell", 0), ("cell", 1)], {"a": [("cell", 1)]}))
+    assert compiled.column_index == {("cell", 0): 0, ("cell", 1): 1}
+    assert compiled.row_index == {"a": 0}
+    assert compiled.decode([0, 0]) == ["a", "a"]
+
+
+def test_problem_data_is_decoded_if_not_given():
+    compiled = CompiledProblem([1, 2, "s"], 2, ["a", "b"], [0, 2, 4], [0, 2, 1, 2])
+    assert compiled.problem_data == ([1, 2], {"a": [1, "s"], "b": [2, "s"]}, ["s"])
+    assert compiled.column_index == {1: 0, 2: 1, "s": 2}
+    compiled = CompiledProblem([1], 1, ["a"], [0, 1], [0])
+    assert compiled.problem_data == ([1], {"a": [1]})
+
+
+def test_compiled_problem_keeps_original_data():
+    problem_data = ([1], {"a": [1]})
+    assert compile_problem(problem_data).problem_data is problem_data
+
+
+@pytest.mark.parametrize(
+    "problem_data, message",
+    [
+        (([], {}), "empty universe"),
+        (([1], {}), "empty subset collection"),
+        (([1, 1], {1: [1]}), "Universe should only have unique elements"),
+        (([1], {1: [1]}, [2, 2]), "Secondary universe should only have unique"),
+        (([1], {1: [1]}, [1]), "both in universe and in secondary universe"),
+        (([1], {1: []}), "Empty subsets are not allowed"),
+        (([1], {1: [1, 1]}), "Subset should only have unique elements"),
+        (([1], {1: [1, 2]}), "are not elements of the universe"),
+    ],
+)
+def test_invalid_data_is_not_compiled(problem_data, message):
+    with pytest.raises(ValueError) as error:
+        compile_problem(problem_data)
+    assert message in str(error.value)
+
+
+def test_trusted_data_is_compiled_without_validation():
+    compiled = compile_problem(([1], {1: [1, 1], 2: []}), trusted=True)
+    assert list(compiled.indptr) == [0, 2, 2]
@@ -40,3 +40,35 @@ def test_correct_data_is_returned_from_data_property(problem_data):
     matrix = DictMatrix(problem_data)
     _, subset_collection = problem_data
     assert matrix.data == (matrix._column_dict, subset_collection)
+
+
+def test_secondary_elements_have_columns_too():
+    matrix = DictMatrix(([1, 2], {1: [1, "a"], 2: [2, "a"], 3: [2]}, ["a"]))
+    column_dict, _ = matrix.data
+    assert column_dict == {1: {1}, 2: {2, 3}, "a": {1, 2}}
+    assert matrix.secondary == {"a"}
+
+
+def test_size_buckets_follow_column_dictionary():
+    problem_data = (
+        [1, 2, 3],
+        {"a": [1, 2], "b": [2, 3], "c": [3], "d": [1, "x"]},
+        ["x"],
+    )
+    column_dict, _ = DictMatrix(problem_data, size_buckets=True).data
+    buckets = column_dict.buckets
+    assert buckets.first().element == 1
+    column_dict[2].remove("a")
+    column_dict[2].remove("b")
+    assert buckets.first().element == 2
+    column = column_dict.pop(2)
+    assert buckets.first().element == 1
+    column_dict[2] = column
+    assert buckets.first().element == 2
+    column.add("a")
+    assert buckets.first().element == 2
+    column_dict[1].remove("a")
+    assert buckets.first().element == 2
+    column_dict[1].remove("d")
+    column_dict["x"].remove("d")
+    assert buckets.first().element == 1
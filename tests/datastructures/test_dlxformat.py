@@ -0,0 +1,115 @@
+import pytest
+
+from exact_cover_solver.algos import DLX, XCC
+from exact_cover_solver.datastructures import dlxformat, DLXMatrix, XCCMatrix
+from exact_cover_solver.datastructures.dlxformat import read_dlx, write_dlx
+
+
+@pytest.fixture
+def dlx_path(tmp_path):
+    return str(tmp_path / "problem.dlx")
+
+
+def test_items_and_options_are_read(tmp_path, dlx_path):
+    (tmp_path / "problem.dlx").write_text(
+        "| Knuth's example from Dancing Links\n"
+        "a b c d e f g\n"
+        "c e\n"
+        "a d g\n"
+        "\n"
+        "  | comment inside options\n"
+        "b c f\n"
+        "a d f\n"
+        "b g\n"
+        "d e g\n"
+    )
+    compiled, colors = read_dlx(dlx_path)
+    assert compiled.column_ids == ["a", "b", "c", "d", "e", "f", "g"]
+    assert compiled.primary_amount == 7
+    assert list(compiled.row_ids) == [0, 1, 2, 3, 4, 5]
+    assert list(compiled.row(1)) == [0, 3, 6]
+    assert colors == {}
+    assert DLX().solve(DLXMatrix(compiled, trusted=True)) == [[3, 4, 0]]
+
+
+def test_secondary_items_and_colors_are_read(tmp_path, dlx_path):
+    (tmp_path / "problem.dlx").write_text("p q | x y\np x:A\nq x:A y\nq x:B\np q y:C\n")
+    compiled, colors = read_dlx(dlx_path)
+    assert compiled.column_ids == ["p", "q", "x", "y"]
+    assert compiled.primary_amount == 2
+    assert list(compiled.row(1)) == [1, 2, 3]
+    assert colors == {0: {"x": "A"}, 1: {"x": "A"}, 2: {"x": "B"}, 3: {"y": "C"}}
+    solutions = XCC().solve(XCCMatrix(compiled, colors))
+    assert sorted(map(sorted, solutions)) == [[0, 1], [3]]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "| only a comment\n",
+        "| a b\n",
+        "a a\n",
+        "a | b | c\n",
+        "a 2:3|b\n",
+        "a b\na c\n",
+        "a b\na a\n",
+        "a | x\na:red\n",
+    ],
+)
+def test_invalid_file_raises_error(tmp_path, dlx_path, text):
+    (tmp_path / "problem.dlx").write_text(text)
+    with pytest.raises(ValueError):
+        read_dlx(dlx_path)
+
+
+def test_written_problem_is_read_back(dlx_path):
+    problem_data = (
+        ["a", "b", "c"],
+        {"first": ["a", "x"], "second": ["b", "c"], "third": ["c", "a", "y"]},
+        ["x", "y"],
+    )
+    colors = {"first": {"x": "red"}}
+    write_dlx(problem_data, dlx_path, colors)
+    compiled, read_colors = read_dlx(dlx_path)
+    assert compiled.problem_data == (
+        ["a", "b", "c"],
+        {0: ["a", "x"], 1: ["b", "c"], 2: ["c", "a", "y"]},
+        ["x", "y"],
+    )
+    assert read_colors == {0: {"x": "red"}}
+
+
+def test_elements_are_named_without_whitespace_and_separators(tmp_path, dlx_path):
+    problem_data = ([("cell", 0, 1), "a:b", 5], {0: [("cell", 0, 1), "a:b"], 1: [5]})
+    write_dlx(problem_data, dlx_path)
+    assert (tmp_path / "problem.dlx").read_text().splitlines() == [
+        "('cell',0,1) #1 5",
+        "('cell',0,1) #1",
+        "5",
+    ]
+
+
+def test_non_ascii_names_are_read_back_with_any_locale(dlx_path, monkeypatch):
+    def open_with_locale(path, mode="r", encoding=None):
+        if "b" in mode:
+            return open(path, mode)
+        return open(path, mode, encoding=encoding or "cp1252")
+
+    monkeypatch.setattr(dlxformat, "open", open_with_locale, raising=False)
+    write_dlx((["ä", "€"], {0: ["ä", "€"]}), dlx_path)
+    compiled, _ = read_dlx(dlx_path)
+    assert compiled.column_ids == ["ä", "€"]
+
+
+@pytest.mark.parametrize(
+    "problem_data",
+    [
+        (["a b", "ab"], {0: ["a b"]}),
+        (["a"], {0: []}),
+        (["a"], {0: ["b"]}),
+    ],
+)
+def test_problem_that_cant_be_written_raises_error(dlx_path, problem_data):
+    with pytest.raises(ValueError):
+        write_dlx(problem_data, dlx_path)
@@ -1,5 +1,3 @@
-from unittest.mock import Mock
-
 import pytest
 from exact_cover_solver.datastructures.dlxmatrix import DLXMatrix
 
@@ -57,10 +55,8 @@ def test_data_objects_are_circularly_linked_together(problem_data):
 
 
 def test_data_object_creation_fails_with_empty_subset():
-    mocked_matrix = Mock(DLXMatrix)
-    mocked_matrix._subset_collection = {1: []}
     with pytest.raises(ValueError):
-        DLXMatrix._create_data_objects(mocked_matrix)
+        DLXMatrix(([1], {1: [1], 2: []}), trusted=True)
 
 
 @pytest.mark.parametrize("problem_data", ["numbers", "strings"], indirect=True)
@@ -70,3 +66,47 @@ def test_column_search_fails_with_wrong_element(problem_data):
     element = universe[0] * 1337
     with pytest.raises(ValueError):
         matrix._find_column(element)
+
+
+def test_secondary_columns_are_not_linked_to_header_list():
+    matrix = DLXMatrix(([1, 2], {1: [1, "a"], 2: [2, "a"], 3: [2]}, ["a"]))
+    assert [matrix.root.right.id, matrix.root.right.right.id] == [1, 2]
+    assert matrix.root.left.id == 2
+    [secondary_column] = matrix.secondary_columns
+    assert secondary_column is matrix._find_column("a")
+    assert secondary_column.left is secondary_column.right is secondary_column
+    assert secondary_column.size == 2
+
+
+def test_size_buckets_follow_covering():
+    problem_data = (
+        [1, 2, 3],
+        {"a": [1, 2], "b": [2, 3], "c": [3], "d": [1, "x"]},
+        ["x"],
+    )
+    matrix = DLXMatrix(problem_data, size_buckets=True)
+    buckets = matrix.root.buckets
+    column = buckets.first()
+    assert (column.id, column.size) == (1, 2)
+    column.detach()
+    row = column.down
+    while row is not column:
+        node = row.right
+        while node is not row:
+            node.detach()
+            node = node.right
+        row = row.down
+    assert [buckets.first().id, buckets.first().size] == [2, 1]
+    row = column.up
+    while row is not column:
+        node = row.left
+        while node is not row:
+            node.attach()
+            node = node.left
+        row = row.up
+    column.attach()
+    assert [buckets.first().id, buckets.first().size] == [3, 2]
+
+
+def test_matrix_has_no_size_buckets_by_default():
+    assert DLXMatrix(([1], {"a": [1]})).root.buckets is None
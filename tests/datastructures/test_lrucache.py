@@ -0,0 +1,60 @@
+import pytest
+
+from exact_cover_solver.datastructures.lrucache import LRUCache
+
+
+def test_stored_values_are_found():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    assert cache.get("b") == 2
+    assert cache.get("c") is None
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_non_positive_size_is_not_allowed():
+    with pytest.raises(ValueError):
+        LRUCache(0)
+
+
+def test_entries_are_evicted_when_values_take_too_many_bytes():
+    cache = LRUCache(10, max_bytes=10)
+    cache.put("a", 1, 4)
+    cache.put("b", 2, 4)
+    cache.get("a")
+    cache.put("c", 3, 4)
+    assert cache.bytes_used == 8
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    cache.put("a", 4, 2)
+    assert cache.bytes_used == 6
+
+
+def test_value_larger_than_max_bytes_is_not_stored():
+    cache = LRUCache(10, max_bytes=10)
+    cache.put("a", 1, 4)
+    cache.put("b", 2, 11)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.bytes_used == 4
+    cache.put("a", 3, 11)
+    assert cache.get("a") is None
+    assert (len(cache), cache.bytes_used) == (0, 0)
+
+
+def test_non_positive_byte_size_is_not_allowed():
+    with pytest.raises(ValueError):
+        LRUCache(1, max_bytes=0)
@@ -1,14 +1,10 @@
 import pytest
 from unittest.mock import Mock
+from exact_cover_solver.datastructures.compiled import CompiledProblem
 from exact_cover_solver.datastructures.matrix_base import Matrix
 
 
 class FakeMatrixWithCreate(Matrix):
-    @staticmethod
-    def _validate_problem_data(problem_data):
-        """Fake validating and just return passed data."""
-        return problem_data
-
     def _create(self):
         """Call not implemented abstract method."""
         super(FakeMatrixWithCreate, self)._create()
@@ -21,11 +17,9 @@ class FakeMatrixWithoutCreate(Matrix):
 
 
 def test_not_possible_to_call_create_without_real_implementation():
-    mocked_universe = Mock()
-    mocked_subset_collection = Mock()
-    mocked_problem_data = (mocked_universe, mocked_subset_collection)
+    compiled_problem = CompiledProblem([Mock()], 1, [1], [0, 1], [0])
     with pytest.raises(NotImplementedError):
-        FakeMatrixWithCreate(mocked_problem_data)
+        FakeMatrixWithCreate(compiled_problem)
 
 
 @pytest.mark.parametrize(
@@ -38,6 +32,8 @@ def test_not_possible_to_call_create_without_real_implementation():
                 {"1st": ["Make", "Pera"], "2nd": ["Pera", "Mä"], "3rd": ["Mä", "Make"]},
             )
         ),
+        (([1, 2], {1: [1, "a"], 2: [2], 3: ["b"]}, ["a", "b"])),
+        (([1, 2], {1: [1], 2: [2]}, [])),
     ],
 )
 def test_validation_passes_with_valid_data(problem_data):
@@ -53,9 +49,67 @@ def test_validation_passes_with_valid_data(problem_data):
         (([1, 2], {1: []}), "Empty subsets are not allowed."),
         (([1, 2], {1: [1, 1]}), "Subset should only have unique elements"),
         (([1, 2], {1: [1, 2], 2: [3]}), "are not elements of the universe"),
+        (([1, 2], {1: [1]}, [3, 3]), "Secondary universe should only have unique"),
+        (([1, 2], {1: [1]}, [2, 3]), "both in universe and in secondary universe"),
+        (([1, 2], {1: [1, 3]}, [4]), "are not elements of the universe"),
     ],
 )
 def test_validation_fails_with_invalid_data(problem_data, message):
     with pytest.raises(ValueError) as error:
         FakeMatrixWithoutCreate(problem_data)
         assert message in str(error.value)
+
+
+def test_problem_data_keeps_secondary_universe_only_if_given():
+    subset_collection = {1: [1], 2: [2]}
+    matrix = FakeMatrixWithoutCreate(([1, 2], subset_collection))
+    assert matrix.problem_data == ([1, 2], subset_collection)
+    subset_collection = {1: [1, "a"], 2: [2]}
+    matrix = FakeMatrixWithoutCreate(([1, 2], subset_collection, ["a"]))
+    assert matrix.problem_data == ([1, 2], subset_collection, ["a"])
+
+
+def test_identical_subsets_are_merged_to_first_one():
+    problem_data = ([1, 2], {"a": [1], "b": [2], "c": [1], "d": [2, 1], "e": [1]})
+    matrix = FakeMatrixWithoutCreate(problem_data)
+    assert matrix.compiled.decode(matrix._merged_rows) == ["a", "b", "d"]
+    assert matrix.row_groups == {"a": ["a", "c", "e"]}
+    assert matrix.problem_data == problem_data
+
+
+def test_solutions_of_merged_rows_are_expanded_and_weighted():
+    problem_data = ([1, 2], {"a": [1], "b": [2], "c": [1], "d": [2], "e": [1]})
+    matrix = FakeMatrixWithoutCreate(problem_data)
+    assert list(matrix.expand(["a", "b"])) == [
+        ["a", "b"],
+        ["a", "d"],
+        ["c", "b"],
+        ["c", "d"],
+        ["e", "b"],
+        ["e", "d"],
+    ]
+    assert matrix.weight(["a", "b"]) == 6
+    assert matrix.row_weight("b") == 2
+
+
+def test_solutions_without_merged_rows_are_copied():
+    matrix = FakeMatrixWithoutCreate(([1, 2], {"a": [1], "b": [2]}))
+    solution = ["a", "b"]
+    expanded = list(matrix.expand(solution))
+    assert expanded == [solution]
+    assert expanded[0] is not solution
+    assert matrix.weight(solution) == 1
+
+
+def test_trusted_data_is_not_validated():
+    problem_data = ([1, 1], {1: [1, 1], 2: []})
+    with pytest.raises(ValueError):
+        FakeMatrixWithoutCreate(problem_data)
+    matrix = FakeMatrixWithoutCreate(problem_data, trusted=True)
+    assert matrix.problem_data == problem_data
+
+
+def test_matrix_reuses_compiled_problem():
+    matrix = FakeMatrixWithoutCreate(([1, 2], {"a": [1], "b": [2]}))
+    other_matrix = FakeMatrixWithoutCreate(matrix.compiled)
+    assert other_matrix.compiled is matrix.compiled
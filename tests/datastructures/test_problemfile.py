@@ -0,0 +1,134 @@
+import struct
+
+import pytest
+
+from exact_cover_solver.algos import DictX, DLX
+from exact_cover_solver.datastructures import DictMatrix, DLXMatrix
+from exact_cover_solver.datastructures.compiled import CompiledProblem, compile_problem
+from exact_cover_solver.datastructures.problemfile import (
+    load_problem,
+    save_problem,
+    VERSION,
+)
+
+
+def save_and_load(compiled, tmp_path):
+    path = str(tmp_path / "problem.ecp")
+    save_problem(compiled, path)
+    return load_problem(path)
+
+
+def test_problem_with_integer_ids_is_loaded_as_saved(tmp_path):
+    compiled = compile_problem(([1, 2, 3], {0: [1, 2], 1: [3], 2: [2, 1, 4]}, [4]))
+    loaded = save_and_load(compiled, tmp_path)
+    assert list(loaded.column_ids) == [1, 2, 3, 4]
+    assert loaded.primary_amount == 3
+    assert list(loaded.row_ids) == [0, 1, 2]
+    assert list(loaded.indptr) == [0, 2, 3, 6]
+    assert list(loaded.indices) == [0, 1, 2, 1, 0, 3]
+    assert loaded.problem_data == compiled.problem_data
+
+
+def test_integer_arrays_are_not_copied_when_loaded(tmp_path):
+    loaded = save_and_load(compile_problem(([1, 2], {0: [1], 1: [2]})), tmp_path)
+    for values in [loaded.column_ids, loaded.row_ids, loaded.indptr, loaded.indices]:
+        assert isinstance(values, memoryview)
+        assert values.readonly
+
+
+def test_elements_and_subset_ids_of_other_types_are_loaded_as_saved(tmp_path):
+    elements = [("cell", 0, 1), "x", 2**70, -5, None, True, 1.5, b"b", ((1,), ())]
+    subset_collection = {("piece", i): [element] for i, element in enumerate(elements)}
+    compiled = compile_problem((elements, subset_collection))
+    loaded = save_and_load(compiled, tmp_path)
+    assert loaded.column_ids == elements
+    assert loaded.row_ids == list(subset_collection)
+    assert loaded.problem_data == (elements, subset_collection)
+
+
+def test_saving_unsupported_element_raises_error(tmp_path):
+    compiled = compile_problem(([frozenset([1])], {"a": [frozenset([1])]}))
+    with pytest.raises(ValueError):
+        save_problem(compiled, str(tmp_path / "problem.ecp"))
+
+
+def test_loaded_problem_is_solved_like_original(tmp_path):
+    problem_data = (
+        [1, 2, 3, 4, 5, 6, 7],
+        {
+            "A": [1, 4, 7],
+            "B": [1, 4],
+            "C": [4, 5, 7],
+            "D": [3, 5, 6],
+            "E": [2, 3, 6, 7],
+            "F": [2, 7],
+        },
+    )
+    loaded = save_and_load(compile_problem(problem_data), tmp_path)
+    assert list(DLX().solve(DLXMatrix(loaded))) == [["B", "D", "F"]]
+    assert list(DictX().solve(DictMatrix(loaded))) == [["B", "D", "F"]]
+
+
+def test_loading_file_of_other_format_raises_error(tmp_path):
+    path = tmp_path / "problem.ecp"
+    path.write_bytes(b"not a problem file" * 10)
+    with pytest.raises(ValueError):
+        load_problem(str(path))
+    path.write_bytes(b"")
+    with pytest.raises(ValueError):
+        load_problem(str(path))
+
+
+def test_loading_file_of_other_version_raises_error(tmp_path):
+    path = str(tmp_path / "problem.ecp")
+    save_problem(CompiledProblem([1], 1, [0], [0, 1], [0]), path)
+    with open(path, "r+b") as file:
+        file.seek(4)
+        file.write(struct.pack("<H", VERSION + 1))
+    with pytest.raises(ValueError):
+        load_problem(path)
+
+
+def test_loading_truncated_file_raises_error(tmp_path):
+    path = tmp_path / "problem.ecp"
+    save_problem(compile_problem((["a", "b"], {"x": ["a"], "y": ["b"]})), str(path))
+    path.write_bytes(path.read_bytes()[:-4])
+    with pytest.raises(ValueError):
+        load_problem(str(path))
+
+
+@pytest.mark.parametrize(
+    "compiled",
+    [
+        CompiledProblem([1], 1, [0], [0, 1], [1]),
+        CompiledProblem([1], 1, [0], [0, 1], [-1]),
+        CompiledProblem([1, 2], 2, [0, 1], [0, 2, 1], [0]),
+        CompiledProblem([1], 1, [0], [1, 1], [0]),
+        CompiledProblem([1], 2, [0], [0, 1], [0]),
+    ],
+)
+def test_loading_rows_out_of_bounds_raises_error(tmp_path, compiled):
+    path = str(tmp_path / "problem.ecp")
+    save_problem(compiled, path)
+    with pytest.raises(ValueError):
+        load_problem(path)
+
+
+def test_loading_too_deeply_nested_values_raises_error(tmp_path):
+    path = tmp_path / "problem.ecp"
+    name = "a" * 5000
+    save_problem(compile_problem(([name], {0: [name]})), str(path))
+    content = path.read_bytes()
+    start = content.index(name.encode()) - 5
+    nested = b"(" + struct.pack("<I", 1)
+    path.write_bytes(content[:start] + nested * 1001 + content[start + 5005 :])
+    with pytest.raises(ValueError):
+        load_problem(str(path))
+
+
+def test_saving_too_deeply_nested_values_raises_error(tmp_path):
+    element = ()
+    for _ in range(200):
+        element = (element,)
+    with pytest.raises(ValueError):
+        save_problem(compile_problem(([element], {0: [element]})), str(tmp_path / "p"))
@@ -0,0 +1,35 @@
+import pytest
+
+from exact_cover_solver.datastructures.sizebuckets import BucketNode, SizeBuckets
+
+
+def test_first_node_of_smallest_bucket_is_found():
+    buckets = SizeBuckets(3)
+    nodes = [BucketNode() for _ in range(3)]
+    for node, size in zip(nodes, [2, 1, 1]):
+        buckets.insert(node, size)
+    assert buckets.first() is nodes[1]
+    buckets.remove(nodes[1])
+    assert buckets.first() is nodes[2]
+    buckets.remove(nodes[2])
+    assert buckets.first() is nodes[0]
+
+
+def test_node_moved_to_smaller_bucket_is_found():
+    buckets = SizeBuckets(3)
+    nodes = [BucketNode() for _ in range(2)]
+    buckets.insert(nodes[0], 2)
+    buckets.insert(nodes[1], 3)
+    assert buckets.first() is nodes[0]
+    buckets.remove(nodes[1])
+    buckets.insert(nodes[1], 0)
+    assert buckets.first() is nodes[1]
+
+
+def test_empty_buckets_have_no_first_node():
+    buckets = SizeBuckets(2)
+    node = BucketNode()
+    buckets.insert(node, 1)
+    buckets.remove(node)
+    with pytest.raises(ValueError):
+        buckets.first()
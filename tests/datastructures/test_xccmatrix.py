@@ -0,0 +1,48 @@
+import pytest
+
+from exact_cover_solver.datastructures.xccmatrix import XCCMatrix
+
+
+@pytest.fixture
+def problem_data():
+    return ([1, 2], {"a": [1, "x"], "b": [2, "x"], "c": [2]}, ["x"])
+
+
+def test_data_objects_get_color_of_their_element(problem_data):
+    matrix = XCCMatrix(problem_data, {"a": {"x": "red"}})
+    column = matrix._find_column("x")
+    assert [column.down.id, column.down.color] == ["a", "red"]
+    assert [column.down.down.id, column.down.down.color] == ["b", None]
+    assert column.down.left.color is None
+    assert not column.down.purified
+
+
+def test_matrix_without_colors_has_uncolored_data_objects(problem_data):
+    matrix = XCCMatrix(problem_data)
+    column = matrix._find_column(2)
+    assert [column.down.color, column.down.down.color] == [None, None]
+
+
+@pytest.mark.parametrize(
+    "colors, message",
+    [
+        ({"d": {"x": "red"}}, "unknown subset"),
+        ({"c": {"x": "red"}}, "not in subset"),
+        ({"a": {1: "red"}}, "Only secondary elements"),
+    ],
+)
+def test_invalid_colors_are_not_allowed(problem_data, colors, message):
+    with pytest.raises(ValueError) as error:
+        XCCMatrix(problem_data, colors)
+    assert message in str(error.value)
+
+
+def test_colors_of_trusted_data_are_not_validated(problem_data):
+    matrix = XCCMatrix(problem_data, {"a": {1: "red"}}, trusted=True)
+    assert matrix._find_column(1).down.color == "red"
+
+
+def test_only_subsets_with_same_colors_are_merged():
+    problem_data = ([1], {"a": [1, "x"], "b": [1, "x"], "c": [1, "x"]}, ["x"])
+    matrix = XCCMatrix(problem_data, {"a": {"x": "red"}, "c": {"x": "red"}})
+    assert matrix.row_groups == {"a": ["a", "c"]}
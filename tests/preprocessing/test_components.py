@@ -0,0 +1,68 @@
+import pytest
+
+from exact_cover_solver.algos.dlx import DLX
+from exact_cover_solver.datastructures.dlxmatrix import DLXMatrix
+from exact_cover_solver.preprocessing.components import combine, decompose
+
+
+def test_invalid_problem_data_is_not_allowed():
+    with pytest.raises(ValueError):
+        decompose(([1], {"a": [2]}))
+
+
+def test_problem_is_split_to_connected_components():
+    problem_data = (
+        [1, 2, 3, 4, 5],
+        {"a": [1, 3], "b": [2], "c": [3], "d": [1], "e": [4, "x"], "f": [5, "x"]},
+        ["x", "y"],
+    )
+    assert decompose(problem_data) == [
+        ([1, 3], {"a": [1, 3], "c": [3], "d": [1]}),
+        ([2], {"b": [2]}),
+        ([4, 5], {"e": [4, "x"], "f": [5, "x"]}, ["x"]),
+    ]
+
+
+def test_connected_problem_is_not_split():
+    problem_data = ([1, 2, 3], {"a": [1, 2], "b": [2, 3]})
+    assert decompose(problem_data) == [problem_data]
+
+
+def test_problem_with_uncoverable_column_is_not_split():
+    problem_data = ([1, 2, 3], {"a": [1], "b": [2]})
+    assert decompose(problem_data) == [problem_data]
+
+
+def test_components_without_primary_columns_are_left_out():
+    problem_data = ([1, 2], {"a": [1], "b": [2], "c": ["x"]}, ["x"])
+    assert decompose(problem_data) == [([1], {"a": [1]}), ([2], {"b": [2]})]
+
+
+def test_solutions_are_combined_lazily_as_cross_product():
+    combined = combine([[["a"], ["b", "c"]], [["d"]], [["e"], ["f"]]])
+    assert next(combined) == ["a", "d", "e"]
+    assert list(combined) == [
+        ["a", "d", "f"],
+        ["b", "c", "d", "e"],
+        ["b", "c", "d", "f"],
+    ]
+    assert list(combine([[["a"]], []])) == []
+
+
+def test_combined_solutions_match_solving_whole_problem():
+    universe = list(range(12))
+    subset_collection = {
+        (cycle, i): [cycle * 4 + i, cycle * 4 + (i + 1) % 4]
+        for cycle in range(3)
+        for i in range(4)
+    }
+    subset_collection.update({element: [element] for element in universe})
+    problem_data = (universe, subset_collection)
+    components = decompose(problem_data)
+    assert len(components) == 3
+    combined = list(
+        combine(DLX().solve(DLXMatrix(component)) for component in components)
+    )
+    whole = DLX().solve(DLXMatrix(problem_data))
+    assert len(combined) == len(whole) == 7**3
+    assert set(map(frozenset, combined)) == set(map(frozenset, whole))
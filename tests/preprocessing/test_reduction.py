@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from exact_cover_solver.algos.dlx import DLX
+from exact_cover_solver.datastructures.dlxmatrix import DLXMatrix
+from exact_cover_solver.preprocessing.reduction import reduce
+
+
+def solve(problem_data):
+    return sorted(sorted(solution) for solution in DLX().solve(DLXMatrix(problem_data)))
+
+
+def solve_reduced(problem_data):
+    reduced = reduce(problem_data)
+    if reduced.problem_data is None:
+        solutions = reduced.solutions
+    else:
+        solutions = map(reduced.expand, DLX().solve(DLXMatrix(reduced.problem_data)))
+    return sorted(sorted(solution) for solution in solutions)
+
+
+def test_invalid_problem_data_is_not_allowed():
+    with pytest.raises(ValueError):
+        reduce(([1], {"a": [2]}))
+
+
+def test_single_row_of_column_is_forced():
+    reduced = reduce(([1, 2, 3, 4], {"a": [1, 2], "b": [2, 3], "c": [3], "d": [4]}))
+    assert reduced.forced == ["a", "c", "d"]
+    assert reduced.removed_rows == ["b"]
+
+
+def test_problem_solved_by_forcing_has_forced_rows_as_solution():
+    reduced = reduce(([1, 2], {"a": [1], "b": [2]}))
+    assert reduced.problem_data is None
+    assert reduced.solutions == [["a", "b"]]
+    assert reduced.expand([]) == ["a", "b"]
+
+
+def test_column_without_rows_makes_problem_infeasible():
+    reduced = reduce(([1, 2, 3], {"a": [1, 2], "b": [2, 3], "c": [1, 3]}))
+    assert reduced.problem_data is None
+    assert not reduced.feasible
+    assert reduced.solutions == []
+
+
+def test_row_conflicting_with_whole_column_is_removed():
+    problem_data = (
+        [1, 2, 3, 4],
+        {"a": [1, 2], "b": [1, 3], "c": [2, 3, 4], "d": [3, 4], "e": [2, 4]},
+    )
+    reduced = reduce(problem_data)
+    assert "c" in reduced.removed_rows
+    assert solve_reduced(problem_data) == solve(problem_data)
+
+
+def test_rows_outside_subset_column_are_removed():
+    problem_data = (
+        [1, 2, 3, 4],
+        {"a": [1, 2], "b": [1, 2, 3], "c": [2, 4], "d": [3, 4], "e": [3], "f": [4]},
+    )
+    reduced = reduce(problem_data)
+    assert "c" in reduced.removed_rows
+    assert 2 in reduced.removed_columns
+    assert 2 not in reduced.problem_data[0]
+    assert solve_reduced(problem_data) == solve(problem_data)
+
+
+def test_secondary_columns_that_rule_out_nothing_are_removed():
+    problem_data = (
+        [1, 2, 3],
+        {"a": [1, "x"], "b": [2, "y"], "c": [3, "y"], "d": [1, 2], "e": [2], "f": [3]},
+        ["x", "y"],
+    )
+    reduced = reduce(problem_data)
+    assert reduced.removed_columns == ["x"]
+    assert reduced.problem_data[2] == ["y"]
+    assert solve_reduced(problem_data) == solve(problem_data)
+
+
+def test_reduced_problem_has_same_solutions_as_original():
+    generator = random.Random(0)
+    for _ in range(500):
+        universe = list(range(generator.randint(1, 6)))
+        secondary_universe = [("s", i) for i in range(generator.randint(0, 3))]
+        elements = universe + secondary_universe
+        subset_collection = {
+            i: generator.sample(elements, generator.randint(1, min(4, len(elements))))
+            for i in range(generator.randint(1, 10))
+        }
+        problem_data = (universe, subset_collection, secondary_universe)
+        assert solve_reduced(problem_data) == solve(problem_data)
@@ -0,0 +1,61 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from exact_cover_solver.services.cache import problem_key, SolutionCache
+
+
+def test_equal_problems_get_the_same_key():
+    first = ([1, 2], {"a": [1], "b": [(2, "x")]})
+    second = ([1, 2], {"a": [1], "b": [(2, "x")]})
+    assert problem_key(first, "DLX") == problem_key(second, "DLX")
+    assert len(problem_key(first, "DLX")) == 32
+
+
+@pytest.mark.parametrize(
+    "other, options",
+    [
+        (([1, 2], {"a": [1], "b": [(2, "x")]}), ("DictX",)),
+        (([1, 2], {"b": [(2, "x")], "a": [1]}), ("DLX",)),
+        (([1, 2], {"a": [1], "b": [(2, "y")]}), ("DLX",)),
+        (([1], {"a": [1], "b": [(2, "x")]}, [(2, "x")]), ("DLX",)),
+        (([1, 2], {"a": [1], "b": [2, "x"]}), ("DLX",)),
+    ],
+)
+def test_different_problems_or_options_get_different_keys(other, options):
+    problem_data = ([1, 2], {"a": [1], "b": [(2, "x")]})
+    assert problem_key(problem_data, "DLX") != problem_key(other, *options)
+
+
+def test_problem_with_unsupported_elements_gets_no_key():
+    assert problem_key(([frozenset()], {"a": [frozenset()]}), "DLX") is None
+
+
+def test_stored_entries_are_found_and_counted():
+    cache = SolutionCache()
+    solutions = (("a", "b"), ("c",))
+    cache.put(b"key", solutions)
+    assert cache.get(b"key") == [["a", "b"], ["c"]]
+    assert cache.get(b"other") is None
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+    assert cache.bytes_used > 0
+
+
+def test_entries_are_evicted_by_bytes():
+    cache = SolutionCache(max_entries=100, max_bytes=2000)
+    for key in range(10):
+        cache.put(bytes([key]), tuple((row,) for row in range(10)))
+    assert 0 < len(cache) < 10
+    assert cache.bytes_used <= 2000
+    assert cache.get(bytes([9])) is not None
+    assert cache.get(bytes([0])) is None
+
+
+def test_entries_are_copied_for_each_thread():
+    cache = SolutionCache()
+    cache.put(b"key", tuple((row,) for row in range(100)))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: cache.get(b"key"), range(100)))
+    assert all(result == [[row] for row in range(100)] for result in results)
+    assert len({id(result) for result in results}) == 100
+    assert cache.hits == 100
@@ -0,0 +1,110 @@
+from collections import Counter
+from unittest.mock import Mock
+
+import pytest
+
+from exact_cover_solver.algos import SearchLimits
+from exact_cover_solver.data_creators import PentominoCreator
+from exact_cover_solver.services.pentomino_store import (
+    PentominoStore,
+    read_store,
+    write_store,
+)
+from exact_cover_solver.services.solver import Solver
+
+
+@pytest.fixture
+def problem_data():
+    return PentominoCreator().create_problem_data(3, 20)
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    path = str(tmp_path / "store.bin")
+    write_store(path, {(3, 20): [list(range(12)), list(range(12, 24))]})
+    return path
+
+
+def test_stored_solutions_are_loaded(store_path, problem_data):
+    store = PentominoStore(store_path)
+    solutions = store.solutions(3, 20, problem_data)
+    assert solutions == [list(range(12)), list(range(12, 24))]
+    assert store.solutions(6, 10, problem_data) is None
+
+
+def test_missing_store_has_no_solutions(tmp_path, problem_data):
+    store = PentominoStore(str(tmp_path / "missing.bin"))
+    assert store.solutions(3, 20, problem_data) is None
+
+
+def test_unreadable_store_is_not_used(tmp_path, problem_data):
+    store = PentominoStore(str(tmp_path))
+    with pytest.warns(UserWarning):
+        assert store.solutions(3, 20, problem_data) is None
+
+
+def test_stale_solutions_are_not_served(store_path, problem_data):
+    universe, subset_collection = problem_data
+    changed = (universe, dict(reversed(list(subset_collection.items()))))
+    store = PentominoStore(store_path)
+    with pytest.warns(UserWarning):
+        assert store.solutions(3, 20, changed) is None
+
+
+def test_corrupted_store_is_not_used(store_path, problem_data):
+    with open(store_path, "r+b") as file:
+        file.seek(20)
+        file.write(b"\xff")
+    with pytest.raises(ValueError):
+        with open(store_path, "rb") as file:
+            read_store(file.read())
+    with pytest.warns(UserWarning):
+        assert PentominoStore(store_path).solutions(3, 20, problem_data) is None
+
+
+def test_solver_serves_boards_from_store(store_path, monkeypatch):
+    solver = Solver()
+    monkeypatch.setattr(solver, "_pentomino_store", PentominoStore(store_path))
+    monkeypatch.setattr(solver, "_solve", Mock(side_effect=AssertionError))
+    monkeypatch.setattr(solver, "_iter_solutions", Mock(side_effect=AssertionError))
+    monkeypatch.setattr(solver, "_count", Mock(side_effect=AssertionError))
+    boards = solver.solve_pentomino_problem("DictX", 3, 20)
+    assert len(boards) == 2
+    assert boards.complete
+    assert list(solver.iter_pentomino_solutions("BitX", 3, 20)) == boards
+    assert solver.count_pentomino_solutions("ArrayDLX", 3, 20) == 2
+    with pytest.raises(ValueError):
+        solver.solve_pentomino_problem("Unknown", 3, 20)
+
+
+def test_store_is_not_used_with_limits_or_stats(monkeypatch, problem_data):
+    store = Mock()
+    solver = Solver()
+    monkeypatch.setattr(solver, "_pentomino_store", store)
+    boards = solver.solve_pentomino_problem("DLX", 3, 20, SearchLimits(max_nodes=50))
+    assert boards == []
+    assert not boards.complete
+    solver = Solver(collect_stats=True)
+    monkeypatch.setattr(solver, "_pentomino_store", store)
+    assert solver._stored_pentomino_solutions("DLX", 3, 20, problem_data) is None
+    assert not store.solutions.called
+    assert Solver()._pentomino_store is None
+
+
+@pytest.mark.parametrize(
+    "height, width, count", [(3, 20, 2), (4, 15, 368), (5, 12, 1010), (6, 10, 2339)]
+)
+def test_shipped_store_has_every_board(height, width, count):
+    problem_data = PentominoCreator().create_problem_data(height, width)
+    solutions = PentominoStore().solutions(height, width, problem_data)
+    assert len(solutions) == count
+    assert len({frozenset(solution) for solution in solutions}) == count
+
+
+def test_shipped_boards_are_filled_with_each_pentomino_once():
+    boards = Solver(precomputed=True).solve_pentomino_problem("DLX", 6, 10)
+    assert len(boards) == 2339
+    for board in boards:
+        assert Counter(name for row in board for name in row) == {
+            name: 5 for name in "FILNPTUVWXYZ"
+        }
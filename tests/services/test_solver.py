@@ -1,5 +1,8 @@
 import pytest
 
+from exact_cover_solver.algos import DLX, SearchLimits
+from exact_cover_solver.datastructures import compile_problem, matrix_base
+from exact_cover_solver.services import SolutionCache
 from exact_cover_solver.services.solver import Solver
 from unittest.mock import Mock
 
@@ -11,7 +14,7 @@ def solver():
 
 @pytest.fixture
 def algo_names():
-    return ["DLX", "DictX"]
+    return ["DLX", "DictX", "ArrayDLX", "BitX"]
 
 
 def test_wrong_algorithm_name_is_not_allowed(solver):
@@ -24,3 +27,378 @@ def test_all_algo_names_are_returned_in_error_message(solver, algo_names):
         solver._solve("WrongAlgo", Mock())
         for algo_name in algo_names:
             assert algo_name in error
+
+
+def test_streaming_generic_solutions_match_solved_ones(solver, algo_names):
+    problem_data = (
+        [1, 2, 3, 4, 5, 6, 7],
+        {
+            1: [4, 7],
+            2: [3],
+            3: [2, 6],
+            4: [1, 3, 5],
+            5: [1, 4, 5, 7],
+            6: [1, 2, 4, 5, 6, 7],
+        },
+    )
+    for algo_name in algo_names:
+        solutions = solver.solve_generic_problem(algo_name, problem_data)
+        streamed = list(solver.iter_generic_solutions(algo_name, problem_data))
+        assert sorted(streamed) == sorted(solutions)
+
+
+def test_streaming_pentomino_solutions_are_translated_to_boards(solver, monkeypatch):
+    solution = [17, 872, 232, 833, 211, 129, 109, 357, 675, 1103, 951, 501]
+    monkeypatch.setattr(Solver, "_iter_solutions", Mock(return_value=iter([solution])))
+    boards = list(solver.iter_pentomino_solutions("DLX", 3, 20))
+    assert len(boards) == 1
+    assert len(boards[0]) == 3
+    assert all(len(row) == 20 and all(row) for row in boards[0])
+
+
+def test_streaming_sudoku_solutions_are_valid(solver, algo_names):
+    sudoku = [[1, 2, 3, 4, 5, 6, 7, 8, 9]] + [[0] * 9 for _ in range(8)]
+    for algo_name in algo_names:
+        board = next(solver.iter_sudoku_solutions(algo_name, sudoku))
+        assert board[0] == sudoku[0]
+        assert all(sorted(row) == list(range(1, 10)) for row in board)
+
+
+def test_streaming_validates_input_before_iteration(solver):
+    with pytest.raises(ValueError):
+        solver.iter_generic_solutions("WrongAlgo", Mock())
+
+
+def test_matrices_skip_validation_of_already_validated_data(monkeypatch):
+    compile_problem = Mock(wraps=matrix_base.compile_problem)
+    monkeypatch.setattr(matrix_base, "compile_problem", compile_problem)
+    problem_data = ([1, 2, 3], {"a": [1, 2], "b": [3], "c": [1], "d": [2, 3]})
+    Solver().count_generic_solutions("DLX", problem_data)
+    assert compile_problem.call_args[0][1] is False
+    Solver(reduce=True).count_generic_solutions("DLX", problem_data)
+    assert compile_problem.call_args[0][1] is True
+
+
+def test_compiled_problem_can_be_solved_repeatedly(algo_names):
+    problem_data = ([1, 2, 3], {"a": [1, 2], "b": [3], "c": [1], "d": [2, 3]})
+    compiled = compile_problem(problem_data)
+    for solver in [Solver(), Solver(reduce=True, decompose=True)]:
+        for algo_name in algo_names:
+            solutions = solver.solve_generic_problem(algo_name, problem_data)
+            for _ in range(2):
+                compiled_solutions = solver.solve_generic_problem(algo_name, compiled)
+                assert sorted(compiled_solutions) == sorted(solutions)
+                assert solver.count_generic_solutions(algo_name, compiled) == 2
+                streamed = list(solver.iter_generic_solutions(algo_name, compiled))
+                assert sorted(streamed) == sorted(solutions)
+
+
+def test_counting_generic_solutions_matches_solution_amount(solver, algo_names):
+    universe = list(range(4))
+    subset_collection = {i: [i % 4] for i in range(12)}
+    for algo_name in algo_names:
+        amount = solver.count_generic_solutions(
+            algo_name, (universe, subset_collection)
+        )
+        assert amount == 3**4
+
+
+def test_generic_problem_can_have_secondary_elements(solver, algo_names):
+    problem_data = ([1, 2], {"a": [1, "x"], "b": [2, "x"], "c": [2]}, ["x"])
+    for algo_name in algo_names:
+        solutions = solver.solve_generic_problem(algo_name, problem_data)
+        assert solutions == [[[1, "x"], [2]]]
+        assert solver.count_generic_solutions(algo_name, problem_data) == 1
+
+
+def test_counting_sudoku_solutions(solver, algo_names):
+    sudoku = [[(y * 3 + y // 3 + x) % 9 + 1 for x in range(9)] for y in range(9)]
+    for y in range(0, 9, 2):
+        sudoku[y][y] = 0
+    for algo_name in algo_names:
+        assert solver.count_sudoku_solutions(algo_name, sudoku) == 1
+
+
+def test_solving_with_workers_gives_same_output(algo_names):
+    universe = list(range(4))
+    subset_collection = {i: [i % 4] for i in range(12)}
+    problem_data = (universe, subset_collection)
+    serial_solver = Solver()
+    parallel_solver = Solver(workers=2)
+
+    def normalize(solutions):
+        return sorted(sorted(solution) for solution in solutions)
+
+    for algo_name in algo_names:
+        solutions = serial_solver.solve_generic_problem(algo_name, problem_data)
+        parallel = parallel_solver.solve_generic_problem(algo_name, problem_data)
+        amount = parallel_solver.count_generic_solutions(algo_name, problem_data)
+        assert normalize(parallel) == normalize(solutions)
+        assert amount == len(solutions)
+
+
+def test_wrong_strategy_name_is_not_allowed():
+    with pytest.raises(ValueError) as error:
+        Solver(strategy="WrongStrategy")
+    assert "EarlyExitMRV" in str(error.value)
+
+
+def test_strategies_are_only_allowed_with_supporting_algorithms():
+    solver = Solver(strategy="DegreeMRV")
+    with pytest.raises(ValueError):
+        solver.count_generic_solutions("BitX", ([1], {1: [1]}))
+
+
+@pytest.mark.parametrize(
+    "strategy", ["MRV", "EarlyExitMRV", "DegreeMRV", "RandomMRV", "BucketMRV"]
+)
+def test_counting_sudoku_solutions_with_strategy(strategy):
+    sudoku = [[(y * 3 + y // 3 + x) % 9 + 1 for x in range(9)] for y in range(9)]
+    for y in range(0, 9, 2):
+        sudoku[y][y] = 0
+    solver = Solver(strategy=strategy)
+    for algo_name in ["DLX", "DictX"]:
+        assert solver.count_sudoku_solutions(algo_name, sudoku) == 1
+
+
+def test_bucket_strategy_gives_same_solutions():
+    problem_data = ([1, 2, 3, 4], {"a": [1, 2], "b": [3, 4], "c": [1], "d": [2, 3]})
+    serial_solver = Solver()
+    bucket_solver = Solver(strategy="BucketMRV")
+    for algo_name in ["DLX", "DictX"]:
+        solutions = serial_solver.solve_generic_problem(algo_name, problem_data)
+        buckets = bucket_solver.solve_generic_problem(algo_name, problem_data)
+        assert sorted(map(sorted, buckets)) == sorted(map(sorted, solutions))
+    with pytest.raises(ValueError):
+        bucket_solver.solve_generic_problem("ArrayDLX", problem_data)
+
+
+def test_solving_without_limits_is_complete(solver, algo_names):
+    problem_data = ([1, 2], {"a": [1], "b": [2], "c": [1, 2]})
+    for algo_name in algo_names:
+        solutions = solver.solve_generic_problem(algo_name, problem_data)
+        assert solutions.complete
+        assert len(solutions) == 2
+
+
+def test_solving_with_limits_reports_truncated_search(solver, algo_names):
+    empty_sudoku = [[0] * 9 for _ in range(9)]
+    for algo_name in algo_names:
+        for limits in [
+            SearchLimits(max_solutions=3),
+            SearchLimits(max_nodes=100),
+            SearchLimits(time_limit=0.01),
+        ]:
+            boards = solver.solve_sudoku_problem(algo_name, empty_sudoku, limits)
+            assert not boards.complete
+            assert len(boards) == 3 or limits.max_solutions is None
+            for board in boards:
+                assert all(sorted(row) == list(range(1, 10)) for row in board)
+
+
+def test_solving_pentominoes_with_limits(solver):
+    boards = solver.solve_pentomino_problem("DLX", 3, 20, SearchLimits(max_nodes=50))
+    assert boards == []
+    assert not boards.complete
+
+
+def test_solving_with_stats_reports_phases():
+    solver = Solver(collect_stats=True)
+    sudoku = [[(y * 3 + y // 3 + x) % 9 + 1 for x in range(9)] for y in range(9)]
+    for y in range(0, 9, 2):
+        sudoku[y][y] = 0
+    for algo_name in ["DLX", "DictX"]:
+        boards = solver.solve_sudoku_problem(algo_name, sudoku)
+        assert len(boards) == 1
+        assert boards.stats.solutions == 1
+        assert boards.stats.nodes_per_depth == [1] * 82
+        assert set(boards.stats.phase_times) == {"matrix", "search", "translate"}
+
+
+def test_stats_are_not_collected_by_default(solver):
+    boards = solver.solve_generic_problem("DLX", ([1], {"a": [1]}))
+    assert boards.stats is None
+
+
+def test_stats_are_only_collected_with_supporting_algorithms():
+    solver = Solver(collect_stats=True)
+    with pytest.raises(ValueError):
+        solver.solve_generic_problem("BitX", ([1], {1: [1]}))
+
+
+def test_solving_with_reduction_gives_same_output(algo_names):
+    sudoku = [[(y * 3 + y // 3 + x) % 9 + 1 for x in range(9)] for y in range(9)]
+    for y in range(6, 9):
+        sudoku[y] = [0] * 9
+    problem_data = (
+        [1, 2, 3],
+        {"a": [1, "x"], "b": [2], "c": [2, 3], "d": [3, "x"]},
+        ["x"],
+    )
+    solver = Solver()
+    reducing_solver = Solver(reduce=True)
+
+    def normalize(solutions):
+        return sorted(sorted(map(str, solution)) for solution in solutions)
+
+    for algo_name in algo_names:
+        boards = reducing_solver.solve_sudoku_problem(algo_name, sudoku)
+        assert normalize(boards) == normalize(
+            solver.solve_sudoku_problem(algo_name, sudoku)
+        )
+        assert reducing_solver.count_sudoku_solutions(algo_name, sudoku) == len(boards)
+        streamed = list(reducing_solver.iter_sudoku_solutions(algo_name, sudoku))
+        assert normalize(streamed) == normalize(boards)
+        solutions = reducing_solver.solve_generic_problem(algo_name, problem_data)
+        assert solutions == [[[1, "x"], [2, 3]]]
+
+
+def test_problems_decided_by_reduction_are_not_searched(algo_names):
+    solver = Solver(reduce=True)
+    for algo_name in algo_names:
+        assert solver.solve_generic_problem(algo_name, ([1], {"a": [1]})) == [[[1]]]
+        assert solver.count_generic_solutions(algo_name, ([1, 2], {"a": [1]})) == 0
+        assert list(solver.iter_generic_solutions(algo_name, ([1], {"a": [1]}))) == [
+            [[1]]
+        ]
+
+
+def test_decomposed_problems_give_same_output(algo_names):
+    problem_data = (
+        [1, 2, 3, 4, 5, 6],
+        {"a": [1, 2], "b": [1], "c": [2], "d": [3], "e": [3, 4], "f": [4], "g": [5, 6]},
+    )
+    solver = Solver()
+    decomposing_solver = Solver(decompose=True, reduce=True)
+
+    def normalize(solutions):
+        return sorted(sorted(map(str, solution)) for solution in solutions)
+
+    for algo_name in algo_names:
+        solutions = decomposing_solver.solve_generic_problem(algo_name, problem_data)
+        assert len(solutions) == 4
+        assert normalize(solutions) == normalize(
+            solver.solve_generic_problem(algo_name, problem_data)
+        )
+        streamed = decomposing_solver.iter_generic_solutions(algo_name, problem_data)
+        assert normalize(streamed) == normalize(solutions)
+        count = decomposing_solver.count_generic_solutions(algo_name, problem_data)
+        assert count == 4
+        no_solutions = (problem_data[0] + [7], problem_data[1])
+        assert decomposing_solver.count_generic_solutions(algo_name, no_solutions) == 0
+
+
+def test_decomposed_problems_respect_solution_limit():
+    problem_data = ([1, 2], {"a": [1], "b": [1], "c": [2], "d": [2]})
+    solver = Solver(decompose=True)
+    solutions = solver.solve_generic_problem(
+        "DLX", problem_data, SearchLimits(max_solutions=3)
+    )
+    assert len(solutions) == 3
+    assert not solutions.complete
+    assert Solver(decompose=True).solve_generic_problem("DLX", problem_data).complete
+
+
+def test_decomposed_problems_share_node_and_time_limits(monkeypatch):
+    component_limits = []
+    solve = DLX.solve
+
+    def record_limits(algo, matrix, limits=None):
+        component_limits.append(limits)
+        return solve(algo, matrix, limits)
+
+    monkeypatch.setattr(DLX, "solve", record_limits)
+    problem_data = ([1, 2, 3, 4], {"a": [1], "b": [2], "c": [3], "d": [4]})
+    limits = SearchLimits(max_nodes=10, time_limit=5, max_solutions=2)
+    Solver(decompose=True).solve_generic_problem("DLX", problem_data, limits)
+    assert len(component_limits) == 4
+    assert all(limits.max_nodes == 2 for limits in component_limits)
+    assert all(limits.max_solutions == 2 for limits in component_limits)
+    time_limits = [limits.time_limit for limits in component_limits]
+    assert time_limits == sorted(time_limits, reverse=True)
+    assert time_limits[0] <= 5
+
+
+def test_solution_limit_equal_to_solution_count_is_incomplete(solver):
+    problem_data = ([1], {"a": [1], "b": [1]})
+    exact = solver.solve_generic_problem(
+        "DLX", problem_data, SearchLimits(max_solutions=2)
+    )
+    assert len(exact) == 2
+    assert not exact.complete
+    above = solver.solve_generic_problem(
+        "DLX", problem_data, SearchLimits(max_solutions=3)
+    )
+    assert len(above) == 2
+    assert above.complete
+
+
+def test_stats_of_components_are_merged():
+    problem_data = ([1, 2, 3], {"a": [1, 2], "b": [1], "c": [2], "d": [3]})
+    solver = Solver(decompose=True, collect_stats=True)
+    for algo_name in ["DLX", "DictX"]:
+        solutions = solver.solve_generic_problem(algo_name, problem_data)
+        assert solutions.stats.nodes_per_depth == [2, 3, 1]
+        assert solutions.stats.solutions == 2
+        assert "decompose" in solutions.stats.phase_times
+
+
+def test_cached_solutions_are_not_searched_again(monkeypatch, algo_names):
+    cache = SolutionCache()
+    solver = Solver(cache=cache)
+    sudoku = [[(y * 3 + y // 3 + x) % 9 + 1 for x in range(9)] for y in range(9)]
+    for y in range(0, 9, 2):
+        sudoku[y][0] = 0
+    for algo_name in algo_names:
+        boards = solver.solve_sudoku_problem(algo_name, sudoku)
+        search = Mock(side_effect=AssertionError("searched again"))
+        with monkeypatch.context() as patched:
+            patched.setattr(solver, "_solve_uncached", search)
+            assert solver.solve_sudoku_problem(algo_name, [*sudoku]) == boards
+    assert (cache.hits, cache.misses) == (len(algo_names), len(algo_names))
+
+
+def test_cached_solutions_are_copied_for_each_caller():
+    cache = SolutionCache()
+    problem_data = ([1, 2], {"a": [1], "b": [2], "c": [1, 2]})
+    assert Solver(cache=cache)._solve("DLX", problem_data) == [["a", "b"], ["c"]]
+    first = Solver(cache=cache)._solve("DLX", problem_data)
+    first[0].append("changed")
+    second = Solver(cache=cache)._solve("DLX", ([1, 2], dict(problem_data[1])))
+    assert second == [["a", "b"], ["c"]]
+    assert cache.hits == 2
+
+
+def test_options_changing_solutions_are_cached_separately():
+    cache = SolutionCache()
+    problem_data = ([1, 2, 3, 4], {"a": [1, 2], "b": [3, 4], "c": [1], "d": [2]})
+    Solver(cache=cache).solve_generic_problem("DLX", problem_data)
+    Solver(cache=cache).solve_generic_problem("DictX", problem_data)
+    Solver(cache=cache, decompose=True).solve_generic_problem("DLX", problem_data)
+    Solver(cache=cache, workers=2).solve_generic_problem("DLX", problem_data)
+    Solver(cache=cache, split_depth=1).solve_generic_problem("DLX", problem_data)
+    assert Solver(cache=cache).count_generic_solutions("DLX", problem_data) == 2
+    assert (cache.hits, cache.misses, len(cache)) == (0, 6, 6)
+
+
+def test_counts_are_cached(monkeypatch):
+    cache = SolutionCache()
+    solver = Solver(cache=cache)
+    sudoku = [[(y * 3 + y // 3 + x) % 9 + 1 for x in range(9)] for y in range(9)]
+    for y in range(6, 9):
+        sudoku[y] = [0] * 9
+    count = solver.count_sudoku_solutions("DLX", sudoku)
+    monkeypatch.setattr(solver, "_count_uncached", Mock(side_effect=AssertionError))
+    assert solver.count_sudoku_solutions("DLX", sudoku) == count
+    assert cache.hits == 1
+
+
+def test_limited_searches_and_stats_bypass_cache():
+    cache = SolutionCache()
+    empty_sudoku = [[0] * 9 for _ in range(9)]
+    solver = Solver(cache=cache)
+    solver.solve_sudoku_problem("DLX", empty_sudoku, SearchLimits(max_solutions=1))
+    Solver(cache=cache, collect_stats=True).solve_generic_problem(
+        "DLX", ([1], {"a": [1]})
+    )
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
@@ -0,0 +1,190 @@
+import io
+import json
+
+import pytest
+
+from exact_cover_solver import Solver
+from exact_cover_solver.cli import main
+from exact_cover_solver.datastructures import compile_problem, save_problem
+
+
+@pytest.fixture
+def problem_text():
+    return json.dumps(
+        {
+            "universe": [1, 2, 3, 4, 5, 6, 7],
+            "subsets": {
+                "A": [1, 4, 7],
+                "B": [1, 4],
+                "C": [4, 5, 7],
+                "D": [3, 5, 6],
+                "E": [2, 3, 6, 7],
+                "F": [2, 7],
+            },
+        }
+    )
+
+
+@pytest.fixture
+def run(capsys, monkeypatch):
+    def run_main(argv, stdin=""):
+        monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+        status = main(argv)
+        out, err = capsys.readouterr()
+        return status, [json.loads(line) for line in out.splitlines()], err
+
+    return run_main
+
+
+def test_generic_problem_is_read_from_stdin_by_default(run, problem_text):
+    status, lines, _ = run([], problem_text)
+    assert status == 0
+    assert lines == [{"problem": 0, "solution": [[1, 4], [3, 5, 6], [2, 7]]}]
+
+
+def test_each_problem_in_input_is_solved(run, problem_text):
+    other_text = json.dumps(
+        {"universe": [[0, 1]], "subsets": {"x": [[0, 1]]}, "secondary_universe": ["s"]}
+    )
+    status, lines, _ = run(["generic", "-c"], f"{problem_text}\n{other_text}\n")
+    assert status == 0
+    assert lines == [{"problem": 0, "count": 1}, {"problem": 1, "count": 1}]
+
+
+def test_generic_problems_are_read_from_json_and_problem_files(
+    run, tmp_path, problem_text
+):
+    json_path = tmp_path / "problem.json"
+    json_path.write_text(problem_text)
+    problem_path = tmp_path / "problem.ecp"
+    save_problem(
+        compile_problem(([1, 2], {0: [1], 1: [2], 2: [1, 2]})), str(problem_path)
+    )
+    status, lines, _ = run(["-c", str(json_path), str(problem_path)])
+    assert status == 0
+    assert lines == [{"problem": 0, "count": 1}, {"problem": 1, "count": 2}]
+
+
+def test_problems_are_solved_before_rest_of_input_is_read(
+    capsys, monkeypatch, problem_text
+):
+    outputs = []
+
+    def stdin():
+        yield from json.dumps(json.loads(problem_text), indent=2).splitlines(True)
+        outputs.append(capsys.readouterr().out)
+        yield problem_text + " " + problem_text
+
+    monkeypatch.setattr("sys.stdin", stdin())
+    assert main(["-c"]) == 0
+    assert outputs == ['{"problem": 0, "count": 1}\n']
+    assert capsys.readouterr().out.splitlines() == [
+        '{"problem": 1, "count": 1}',
+        '{"problem": 2, "count": 1}',
+    ]
+
+
+def test_brackets_in_strings_dont_end_problems(run):
+    problem = {"universe": ["]", '{"'], "subsets": {"[": ["]"], "}": ['{"']}}
+    status, lines, _ = run(["-c"], json.dumps(problem, indent=2))
+    assert status == 0
+    assert lines == [{"problem": 0, "count": 1}]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"universe": [1], "subsets": {"a": [1]}}\n]',
+        '{"universe": ["a\n"], "subsets": {}}',
+        '{"universe": [1], "subsets": {"a": [1]',
+    ],
+)
+def test_invalid_json_is_reported_with_error_status(run, text):
+    status, _, err = run(["-c"], text)
+    assert status == 1
+    assert err.startswith("exact-cover-solver: error:")
+
+
+def test_unreadable_file_is_reported_with_error_status(run, tmp_path):
+    status, lines, err = run([str(tmp_path / "missing.json")])
+    assert status == 1
+    assert lines == []
+    assert err.startswith("exact-cover-solver: error:")
+    assert "missing.json" in err
+
+
+def test_solutions_are_limited_by_max_solutions(run):
+    problem_text = json.dumps(
+        {
+            "universe": [1, 2, 3, 4],
+            "subsets": {"a": [1], "b": [2], "c": [3], "d": [4], "e": [1, 2]},
+        }
+    )
+    status, lines, _ = run(["-n", "1", "-a", "DictX"], problem_text)
+    assert status == 0
+    assert len(lines) == 1
+    status, lines, _ = run(["--count"], problem_text)
+    assert lines == [{"problem": 0, "count": 2}]
+    status, lines, _ = run(["--count", "-n", "1"], problem_text)
+    assert lines == [{"problem": 0, "count": 1}]
+
+
+def test_solutions_are_same_with_workers(run, problem_text):
+    status, lines, _ = run(["--workers", "2", "-a", "ArrayDLX"], problem_text)
+    assert status == 0
+    assert lines == [{"problem": 0, "solution": [[1, 4], [3, 5, 6], [2, 7]]}]
+
+
+def test_pentomino_board_size_is_given_to_solver(run, monkeypatch):
+    calls = []
+
+    def iter_pentomino_solutions(self, algorithm, height, width):
+        calls.append((algorithm, height, width))
+        return iter([[["I"] * width] * height])
+
+    monkeypatch.setattr(Solver, "iter_pentomino_solutions", iter_pentomino_solutions)
+    status, lines, _ = run(["pentomino", "1", "5", "-a", "BitX"])
+    assert status == 0
+    assert calls == [("BitX", 1, 5)]
+    assert lines == [{"problem": 0, "solution": [["I"] * 5]}]
+
+
+def test_sudoku_boards_are_solved(run):
+    board = [[0] * 9 for _ in range(9)]
+    status, lines, _ = run(["sudoku", "-n", "2"], json.dumps(board))
+    assert status == 0
+    assert [line["problem"] for line in lines] == [0, 0]
+    for line in lines:
+        assert all(sorted(row) == list(range(1, 10)) for row in line["solution"])
+
+
+def test_invalid_problem_is_reported_with_error_status(run):
+    status, lines, err = run([], '{"universe": [1], "subsets": {"a": [2]}}')
+    assert status == 1
+    assert lines == []
+    assert "not elements of the universe" in err
+    status, _, _ = run([], "[1, 2")
+    assert status == 1
+
+
+@pytest.mark.parametrize(
+    "problem",
+    [
+        {"universe": [1, 2], "subsets": [1]},
+        {"universe": 1, "subsets": {"a": [1]}},
+        {"universe": [1], "subsets": {"a": 1}},
+        {"universe": [1], "subsets": {"a": [1]}, "secondary_universe": "x"},
+    ],
+)
+def test_malformed_problem_is_reported_with_error_status(run, problem):
+    status, lines, err = run([], json.dumps(problem))
+    assert status == 1
+    assert lines == []
+    assert err.startswith("exact-cover-solver: error:")
+
+
+def test_invalid_options_exit_with_usage():
+    with pytest.raises(SystemExit):
+        main(["pentomino", "3", "20", "-a", "Unknown"])
+    with pytest.raises(SystemExit):
+        main(["pentomino", "3", "0"])
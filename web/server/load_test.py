@@ -0,0 +1,132 @@
+"""Measure latency of cheap requests while heavy solves keep the server busy.
+
+Start the server first, e.g. with ./start.sh, then run
+python load_test.py --heavy 2 --cheap 200. Heavy requests are sudokus with
+thousands of solutions, each with its digits relabeled so the solution cache
+doesn't answer them. Cheap requests are 3x20 pentomino boards served from the
+precomputed store. Keep heavy clients fewer than server workers, so cheap requests
+find a free worker. Requests refused with 503 are counted, not retried.
+"""
+import argparse
+import json
+import math
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, List
+
+GRID = [
+    [(row * 3 + row // 3 + column) % 9 + 1 for column in range(9)] for row in range(9)
+]
+
+
+def heavy_sudoku() -> List[List[int]]:
+    """Create sudoku with four filled rows and first column, 6244 solutions."""
+    digits = list(range(1, 10))
+    random.shuffle(digits)
+    return [
+        [
+            digits[value - 1] if row < 4 or column == 0 else 0
+            for column, value in enumerate(values)
+        ]
+        for row, values in enumerate(GRID)
+    ]
+
+
+def post(url: str, body: Dict) -> int:
+    """Post body as JSON and read the whole response.
+
+    Args:
+        url: Address of the endpoint.
+        body: Body of the request.
+
+    Returns:
+        Status code of the response.
+    """
+    request = urllib.request.Request(
+        url, json.dumps(body).encode(), {"Content-Type": "application/json"}
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            response.read()
+            status: int = response.status
+            return status
+    except urllib.error.HTTPError as error:
+        return error.code
+
+
+def percentile(latencies: List[float], percent: float) -> float:
+    """Get latency below which given percent of latencies are.
+
+    Args:
+        latencies: Measured latencies.
+        percent: Percent of latencies, e.g. 99.
+
+    Returns:
+        Percentile of the latencies.
+    """
+    ordered = sorted(latencies)
+    return ordered[max(0, math.ceil(len(ordered) * percent / 100) - 1)]
+
+
+def main() -> None:
+    """Run heavy requests in the background and time cheap ones meanwhile."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--heavy", type=int, default=2, help="heavy clients")
+    parser.add_argument("--cheap", type=int, default=200, help="cheap requests")
+    parser.add_argument("--concurrency", type=int, default=4, help="cheap clients")
+    args = parser.parse_args()
+
+    done = threading.Event()
+    heavy_statuses: List[int] = []
+    cheap_statuses: List[int] = []
+    latencies: List[float] = []
+
+    def send_heavy() -> None:
+        while not done.is_set():
+            body = {"sudoku_board": heavy_sudoku(), "algorithm": "DLX"}
+            heavy_statuses.append(post(f"{args.url}/solve/sudoku", body))
+
+    def send_cheap(amount: int) -> None:
+        body = {"height": 3, "width": 20, "algorithm": "DLX"}
+        for _ in range(amount):
+            start_time = time.perf_counter()
+            cheap_statuses.append(post(f"{args.url}/solve/pentomino", body))
+            latencies.append(time.perf_counter() - start_time)
+
+    heavy_clients = [
+        threading.Thread(target=send_heavy, daemon=True) for _ in range(args.heavy)
+    ]
+    for client in heavy_clients:
+        client.start()
+    time.sleep(0.5)
+    cheap_clients = [
+        threading.Thread(target=send_cheap, args=(args.cheap // args.concurrency,))
+        for _ in range(args.concurrency)
+    ]
+    for client in cheap_clients:
+        client.start()
+    for client in cheap_clients:
+        client.join()
+    done.set()
+    for client in heavy_clients:
+        client.join()
+
+    print(
+        f"{len(latencies)} cheap requests with {args.heavy} heavy clients: "
+        f"p50 {percentile(latencies, 50) * 1000:.1f} ms, "
+        f"p99 {percentile(latencies, 99) * 1000:.1f} ms, "
+        f"max {max(latencies) * 1000:.1f} ms, "
+        f"{cheap_statuses.count(503)} refused."
+    )
+    print(
+        f"{len(heavy_statuses)} heavy requests finished meanwhile, "
+        f"{heavy_statuses.count(503)} refused."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,20 @@
-from fastapi import FastAPI
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
-from exact_cover_solver import Solver
-from typing import List
+from typing import Callable, List, TypeVar
+from workers import PoolFull, pentomino_response, sudoku_response, SolverPool
 from fastapi.middleware.cors import CORSMiddleware
 import os
 import logging
 
 mode = os.getenv("SERVER_ENV_MODE", "development")
 spa_location = os.environ.get("SERVER_SPA_LOCATION")
+workers = int(os.getenv("SERVER_WORKERS", os.cpu_count() or 1))
+queue_size = int(os.getenv("SERVER_QUEUE_SIZE", 2 * workers))
+retry_after = int(os.getenv("SERVER_RETRY_AFTER", 5))
+
+T = TypeVar("T")
 
 logger = logging.getLogger("main")
 level = logging.WARNING if mode == "production" else logging.INFO
@@ -25,7 +30,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-solver = Solver()
+pool = SolverPool(workers, queue_size)
+
+
+@app.on_event("startup")
+async def start_pool():
+    """Start warm worker processes before serving requests."""
+    await pool.start()
+    logger.info(f"Started {workers} workers with queue of {queue_size} solves.")
+
+
+@app.on_event("shutdown")
+def stop_pool():
+    """Stop worker processes."""
+    pool.shutdown()
+
+
+async def solve(function: Callable[..., T], *args: object) -> T:
+    """Solve in a worker process, refusing the request if queue is full."""
+    try:
+        return await pool.run(function, *args)
+    except PoolFull:
+        logger.warning(f"Refused a solve, {pool.pending} solves are pending.")
+        raise HTTPException(
+            status_code=503,
+            detail="Solver is busy, try again later.",
+            headers={"Retry-After": str(retry_after)},
+        )
 
 
 class PentominoBody(BaseModel):
@@ -46,19 +77,22 @@ class SudokuBody(BaseModel):
 @app.post("/solve/pentomino")
 async def solve_pentomino(pentomino_input: PentominoBody):
     """Get boards from solver, return them."""
-    boards = solver.solve_pentomino_problem(
-        pentomino_input.algorithm, pentomino_input.height, pentomino_input.width
+    body = await solve(
+        pentomino_response,
+        pentomino_input.algorithm,
+        pentomino_input.height,
+        pentomino_input.width,
     )
-    return {"boards": boards}
+    return Response(body, media_type="application/json")
 
 
 @app.post("/solve/sudoku")
 async def solve_sudoku(sudoku_input: SudokuBody):
     """Get boards from solver, return them."""
-    boards = solver.solve_sudoku_problem(
-        sudoku_input.algorithm, sudoku_input.sudoku_board
+    body = await solve(
+        sudoku_response, sudoku_input.algorithm, sudoku_input.sudoku_board
     )
-    return {"boards": boards}
+    return Response(body, media_type="application/json")
 
 
 if mode == "production":
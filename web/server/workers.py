@@ -0,0 +1,153 @@
+"""Pool of warm worker processes solving problems for the server.
+
+Solving is CPU bound, so it's done in worker processes instead of the event loop,
+which keeps serving other requests meanwhile. Workers encode the responses to JSON
+as well, since encoding thousands of boards would block the event loop too. Each
+worker imports the solver and loads the pentomino store when the pool starts, so
+first requests don't pay for it.
+Requests waiting for a worker are bounded, and the pool refuses new ones when the
+queue is full instead of letting latency grow without limit.
+"""
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, TypeVar
+
+from exact_cover_solver import Solver
+from exact_cover_solver.services import SolutionCache
+
+T = TypeVar("T")
+
+_solver: Optional[Solver] = None
+
+
+class PoolFull(Exception):
+    """Raised when the queue of the pool is full."""
+
+
+class SolverPool:
+    """Process pool with a bounded queue of waiting solves."""
+
+    def __init__(self, workers: int, queue_size: int) -> None:
+        """Initialize pool without starting the workers.
+
+        Args:
+            workers: Number of worker processes.
+            queue_size: Number of solves that can wait for a free worker.
+
+        Raises:
+            ValueError: if there are no workers or queue size is negative.
+        """
+        if workers < 1 or queue_size < 0:
+            raise ValueError("Pool needs workers and a non-negative queue size.")
+        self._workers = workers
+        self._capacity = workers + queue_size
+        self._pending = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def pending(self) -> int:
+        """Get number of solves running or waiting for a worker.
+
+        Returns:
+            Number of pending solves.
+        """
+        return self._pending
+
+    async def start(self) -> None:
+        """Start the worker processes and wait until they are running.
+
+        Server process is warmed up first, so workers forked from it inherit the
+        imported modules and the loaded pentomino store.
+        """
+        warm_up()
+        self._executor = ProcessPoolExecutor(self._workers)
+        loop = asyncio.get_event_loop()
+        await asyncio.gather(
+            *[
+                loop.run_in_executor(self._executor, warm_up)
+                for _ in range(self._workers)
+            ]
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, waiting for running solves."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def run(self, function: Callable[..., T], *args: object) -> T:
+        """Run function in a worker process.
+
+        Args:
+            function: Module level function to run.
+            args: Arguments of the function.
+
+        Returns:
+            Return value of the function.
+
+        Raises:
+            PoolFull: if all workers are busy and the queue is full.
+            RuntimeError: if pool is not started.
+        """
+        if self._executor is None:
+            raise RuntimeError("Pool is not started.")
+        if self._pending >= self._capacity:
+            raise PoolFull(f"{self._pending} solves are already pending.")
+        loop = asyncio.get_event_loop()
+        future = self._executor.submit(function, *args)
+        self._pending += 1
+        # Worker stays busy even if the request is cancelled, so the slot is freed
+        # only when the solve finishes.
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+        return await asyncio.wrap_future(future)
+
+    def _release(self) -> None:
+        """Free the slot of a finished solve."""
+        self._pending -= 1
+
+
+def warm_up() -> None:
+    """Create the solver of the process and load the pentomino store."""
+    _worker_solver().count_pentomino_solutions("DLX", 3, 20)
+
+
+def pentomino_response(algorithm: str, height: int, width: int) -> str:
+    """Solve pentomino board in a worker process.
+
+    Args:
+        algorithm: Name of the algorithm to use.
+        height: Height of the board.
+        width: Width of the board.
+
+    Returns:
+        JSON response body with every filled board.
+    """
+    boards = _worker_solver().solve_pentomino_problem(algorithm, height, width)
+    return json.dumps({"boards": boards})
+
+
+def sudoku_response(algorithm: str, sudoku_board: List[List[int]]) -> str:
+    """Solve sudoku in a worker process.
+
+    Args:
+        algorithm: Name of the algorithm to use.
+        sudoku_board: Sudoku with zeros in the empty cells.
+
+    Returns:
+        JSON response body with every filled sudoku.
+    """
+    boards = _worker_solver().solve_sudoku_problem(algorithm, sudoku_board)
+    return json.dumps({"boards": boards})
+
+
+def _worker_solver() -> Solver:
+    """Get solver of the worker process, created on the first call.
+
+    Returns:
+        Solver with a cache of its own, serving pentomino boards from the store.
+    """
+    global _solver
+    if _solver is None:
+        _solver = Solver(cache=SolutionCache(), precomputed=True)
+    return _solver